@@ -1,3 +1,5 @@
+import time
+
 import numpy as np
 import pytest
 import pyccl as ccl
@@ -132,6 +134,62 @@ def test_haloprofile(model):
     assert np.all(err <= tol)
 
 
+@pytest.mark.parametrize('model', ['einasto', 'hernquist'])
+def test_haloprofile_fourier_template(model):
+    # Compare the tabulated Fourier-space template with the direct FFTLog
+    # transform of the real-space profile.
+    a = 1.0
+    halomass = np.geomspace(1E11, 1E15, 16)
+    k = np.geomspace(1E-3, 1E2, 256)
+
+    mdef = ccl.halos.MassDef(200, 'matter')
+    c = ccl.halos.ConcentrationDuffy08(mass_def=mdef)
+    if model == 'einasto':
+        p = ccl.halos.HaloProfileEinasto(mass_def=mdef, concentration=c,
+                                         truncated=True)
+    elif model == 'hernquist':
+        p = ccl.halos.HaloProfileHernquist(mass_def=mdef, concentration=c,
+                                           truncated=True)
+    prof_fftlog = p.fourier(COSMO, k, halomass, a)
+    p.use_fourier_template()
+    prof_templ = p.fourier(COSMO, k, halomass, a)
+
+    err = np.abs(prof_templ - prof_fftlog) / halomass[:, None]
+    assert np.all(err <= HALOPROFILE_TOLERANCE)
+
+
+@pytest.mark.parametrize('model', ['einasto', 'hernquist'])
+def test_haloprofile_fourier_template_timing(model):
+    # Compare the cost of evaluating the template with that of the direct
+    # FFTLog transform. Timings are only reported, since they depend on the
+    # load of the machine.
+    a = 1.0
+    halomass = np.geomspace(1E11, 1E15, 128)
+    k = np.geomspace(1E-3, 1E2, 256)
+
+    mdef = ccl.halos.MassDef(200, 'matter')
+    c = ccl.halos.ConcentrationDuffy08(mass_def=mdef)
+    if model == 'einasto':
+        p = ccl.halos.HaloProfileEinasto(mass_def=mdef, concentration=c,
+                                         truncated=True)
+    elif model == 'hernquist':
+        p = ccl.halos.HaloProfileHernquist(mass_def=mdef, concentration=c,
+                                           truncated=True)
+    p.use_fourier_template()
+
+    start = time.time()
+    prof_fftlog = p._fftlog_wrap(COSMO, k, halomass, a, fourier_out=True)
+    t_fftlog = time.time() - start
+
+    start = time.time()
+    prof_templ = p.fourier(COSMO, k, halomass, a)
+    t_templ = time.time() - start
+    print(f"{model}: FFTLog {t_fftlog:.3f} s, template {t_templ:.3f} s")
+
+    err = np.abs(prof_templ - prof_fftlog) / halomass[:, None]
+    assert np.all(err <= HALOPROFILE_TOLERANCE)
+
+
 def test_weak_lensing_functions():
     data = np.loadtxt("./benchmarks/data/haloprofile_nfw_wl_numcosmo.txt")
     z_lens = 1.0
@@ -1,5 +1,6 @@
 import numpy as np
 import pyccl as ccl
+import pytest
 import time
 
 
@@ -36,3 +37,27 @@ def test_timing():
     t_seconds = end - start
     print(end-start)
     assert t_seconds < 3.
+
+
+def test_class_pk_array_extraction():
+    # Extracting the linear power spectrum from a CLASS run in a single call
+    # should give the same result as evaluating it point by point.
+    classy = pytest.importorskip("classy")
+    from pyccl.boltzmann import _get_class_params, _get_class_pk_arrays
+
+    cosmo = ccl.CosmologyVanillaLCDM(transfer_function='boltzmann_class')
+    model = classy.Class()
+    try:
+        model.set(_get_class_params(cosmo))
+        model.compute()
+        a_arr, lk_arr, lpk = _get_class_pk_arrays(cosmo, model)
+
+        # Compare against the whole grid evaluated one point at a time.
+        lpk_loop = np.array([
+            [np.log(model.pk_lin(np.exp(lk), max(1/a-1, 1e-10)))
+             for lk in lk_arr]
+            for a in a_arr])
+    finally:
+        model.struct_cleanup()
+        model.empty()
+    assert np.allclose(lpk, lpk_loop, atol=1E-10, rtol=0)
@@ -252,6 +252,27 @@ double ccl_growth_rate(ccl_cosmology * cosmo, double a, int* status);
  */
 void ccl_growth_rates(ccl_cosmology * cosmo, int na, double a[], double output[], int * status);
 
+/**
+ * Scale-dependent growth factors and growth rates on a grid of scale factors a[0..na-1]
+ * and wavenumbers k[0..nk-1], obtained by integrating the linear growth ODE once for
+ * each wavenumber. The scale dependence comes from mu(a,k) in the mu-Sigma
+ * parametrisation of modified gravity.
+ * @param cosmo Cosmological parameters
+ * @param na Number of scale factors in a
+ * @param a array of increasing scale factors
+ * @param nk Number of wavenumbers in k
+ * @param k array of wavenumbers in Mpc^-1
+ * @param growth array of length na*nk to store the growth factor, normalized to the
+ * large-scale (k=0) growth factor today. The entry at index i+j*na stores the growth
+ * factor for a[i] and k[j].
+ * @param fgrowth array of length na*nk to store the growth rate, with the same ordering.
+ * @param status Status flag. 0 if there are no errors, nonzero otherwise.
+ * For specific cases see documentation for ccl_error.c
+ * @return void
+ */
+void ccl_scale_dependent_growths(ccl_cosmology * cosmo, int na, double a[], int nk, double k[],
+                                 double growth[], double fgrowth[], int * status);
+
 /**
  * Scale factor for a given comoving distance (in Mpc)
  * @param cosmo Cosmological parameters
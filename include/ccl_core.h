@@ -180,6 +180,8 @@ typedef struct ccl_gsl_params {
   // Flags for using spline integration
   bool NZ_NORM_SPLINE_INTEGRATION;
   bool LENSING_KERNEL_SPLINE_INTEGRATION;
+  // Flag for evaluating E(a) from its spline in background integrals
+  bool BACKGROUND_E_SPLINE;
 } ccl_gsl_params;
 
 extern ccl_gsl_params ccl_user_gsl_params;
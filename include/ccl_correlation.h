@@ -41,6 +41,56 @@ void ccl_correlation(ccl_cosmology *cosmo,
 		     int corr_type,int do_taper_cl,double *taper_cl_limits,int flag_method,
 		     int *status);
 
+/**
+ * Computes the correlation functions of several power spectra sampled on the same multipoles.
+ * With CCL_CORR_FFTLOG, all power spectra are transformed with a single FFTLog call.
+ * @param n_cls : number of input power spectra
+ * @param cls : input power spectra. Should have size n_cls * n_ell, with the multipole being the fastest varying variable.
+ * @param wtheta : output correlation functions. Should have size n_cls * n_theta, with theta being the fastest varying variable.
+ * All other arguments are as in ccl_correlation.
+ */
+void ccl_correlation_multi(ccl_cosmology *cosmo,
+			   int n_ell,double *ell,int n_cls,double *cls,
+			   int n_theta,double *theta,double *wtheta,
+			   int corr_type,int do_taper_cl,double *taper_cl_limits,int flag_method,
+			   int *status);
+
+/**
+ * Tabulates the weights of the brute-force Legendre sum used to compute
+ * angular correlation functions, so they can be reused for many power spectra.
+ * @param cosmo :Cosmological parameters
+ * @param corr_type : type of correlation function (see ccl_correlation).
+ * For CCL_CORR_LP and CCL_CORR_LM, the full-sky Wigner-d matrices d^l_{2,+-2} are used.
+ * @param n_theta : number of values of the separation angle (theta)
+ * @param theta : values of the separation angle in degrees.
+ * @param ell_max : maximum multipole.
+ * @param pl_arr : output weights. Should have size n_theta * (ell_max+1), with the multipole being the fastest varying variable.
+ * @param status : Status flag. 0 if there are no errors, nonzero otherwise.
+ */
+void ccl_correlation_legendre_matrix(ccl_cosmology *cosmo,int corr_type,
+				     int n_theta,double *theta,int ell_max,
+				     double *pl_arr,int *status);
+
+/**
+ * Computes the angular correlation functions for several power spectra sampled
+ * on the same multipoles, using precomputed Legendre weights.
+ * @param cosmo :Cosmological parameters
+ * @param n_ell : number of multipoles in the input power spectra
+ * @param ell : multipoles at which the power spectra are evaluated
+ * @param n_cls : number of input power spectra
+ * @param cls : input power spectra. Should have size n_cls * n_ell, with the multipole being the fastest varying variable.
+ * @param n_theta : number of values of the separation angle (theta)
+ * @param ell_max : maximum multipole.
+ * @param pl_arr : weights computed with ccl_correlation_legendre_matrix.
+ * @param wtheta : output correlation functions. Should have size n_cls * n_theta, with theta being the fastest varying variable.
+ * @param status : Status flag. 0 if there are no errors, nonzero otherwise.
+ */
+void ccl_correlation_legendre_multi(ccl_cosmology *cosmo,
+				    int n_ell,double *ell,
+				    int n_cls,double *cls,
+				    int n_theta,int ell_max,double *pl_arr,
+				    double *wtheta,int *status);
+
 /**
  * Computes the 3dcorrelation function (wrapper)
  * @param cosmo :Cosmological parameters
@@ -42,6 +42,27 @@ double ccl_f1d_t_eval(ccl_f1d_t *spl,double x);
 
 void ccl_f1d_t_free(ccl_f1d_t *spl);
 
+/**
+ * Interpolate several arrays, sampled at the same input values, onto a common set of output values.
+ * @param n_in number of input samples.
+ * @param x_in input x values (in increasing order).
+ * @param n_f number of arrays to interpolate.
+ * @param f_in input arrays. Should have size n_f * n_in, with x being the fastest varying variable.
+ * @param n_out number of output samples.
+ * @param x_out output x values.
+ * @param y0 constant value used below the interpolation range if extrap_lo_type is ccl_f1d_extrap_const.
+ * @param yf constant value used above the interpolation range if extrap_hi_type is ccl_f1d_extrap_const.
+ * @param extrap_lo_type extrapolation below the interpolation range.
+ * @param extrap_hi_type extrapolation above the interpolation range.
+ * @param f_out output arrays. Should have size n_f * n_out, with x being the fastest varying variable.
+ * @param status Status flag. 0 if there are no errors, nonzero otherwise.
+ */
+void ccl_f1d_resample_multi(int n_in,double *x_in,int n_f,double *f_in,
+			    int n_out,double *x_out,double y0,double yf,
+			    ccl_f1d_extrap_t extrap_lo_type,
+			    ccl_f1d_extrap_t extrap_hi_type,
+			    double *f_out,int *status);
+
 CCL_END_DECLS
 
 #endif
@@ -4,11 +4,79 @@
 
 CCL_BEGIN_DECLS
 
+/**
+ * FFTLog plan. Holds the FFTW plans and transform coefficients for a given
+ * transform geometry so that they can be reused across transforms.
+ */
+typedef struct ccl_fftlog_plan ccl_fftlog_plan_t;
+
+/**
+ * Create an FFTLog plan.
+ * @param N number of samples of the input arrays.
+ * @param dlnk logarithmic spacing of the input arrays.
+ * @param dim number of dimensions (2 or 3).
+ * @param mu Bessel function order.
+ * @param q FFTLog bias exponent.
+ * @param measure if not zero, FFTW plans will be created with FFTW_MEASURE (otherwise FFTW_ESTIMATE). Any wisdom previously imported with ccl_fftlog_import_wisdom will be used.
+ * @param status Status flag. 0 if there are no errors, nonzero otherwise.
+ * @return FFTLog plan.
+ */
+ccl_fftlog_plan_t *ccl_fftlog_plan_new(int N, double dlnk, double dim,
+				       double mu, double q, int measure,
+				       int *status);
+
+/**
+ * ccl_fftlog_plan_t destructor.
+ */
+void ccl_fftlog_plan_free(ccl_fftlog_plan_t *plan);
+
+/**
+ * Compute the discrete Hankel transform of npk arrays using a precomputed plan.
+ * The input arrays must have the number of samples and logarithmic spacing used to create the plan.
+ * @param plan FFTLog plan.
+ * @param npk number of arrays to transform.
+ * @param nk number of elements in k and in each of the arrays.
+ * @param k logarithmically spaced values of k.
+ * @param pk arrays to transform. Each of them should be sampled at the values of k.
+ * @param r output values of r. This array is modified on output.
+ * @param xi output arrays sampled at r.
+ * @param status Status flag. 0 if there are no errors, nonzero otherwise.
+ */
+void ccl_fftlog_plan_execute(ccl_fftlog_plan_t *plan, int npk, int nk,
+			     double *k, double **pk,
+			     double *r, double **xi, int *status);
+
+/**
+ * Free all plans stored in the internal cache used by ccl_fftlog_ComputeXi2D and ccl_fftlog_ComputeXi3D.
+ */
+void ccl_fftlog_clear_cache(void);
+
+/**
+ * Choose the FFTW planner flag used for plans in the internal cache. This clears the cache.
+ * @param measure if not zero, use FFTW_MEASURE. Otherwise FFTW_ESTIMATE (default).
+ */
+void ccl_fftlog_set_cache_measure(int measure);
+
+/**
+ * Import FFTW wisdom from a file.
+ * @param fname file name.
+ * @return non-zero on success.
+ */
+int ccl_fftlog_import_wisdom(const char *fname);
+
+/**
+ * Export the accumulated FFTW wisdom to a file.
+ * @param fname file name.
+ * @return non-zero on success.
+ */
+int ccl_fftlog_export_wisdom(const char *fname);
+
 
 /**
  * Compute the function
  *   \xi_\mu(\theta) = \int \frac{d\ell}{2\pi} \ell J_\mu(\ell\theta)\,C_\ell
  * C_\ell will be multiplied by ell^{1-\epsilon}, so \epsilon can be used to minimize ringing.
+ * FFTLog plans are cached internally and reused for transforms with the same geometry.
  * @param mu Bessel function order.
  * @param epsilon FFTLog bias exponent.
  * @param ncl number of power spectra that should be converted into correlation functions.
@@ -26,6 +94,7 @@ void ccl_fftlog_ComputeXi2D(double mu,double epsilon,
  * Compute the function
  *   \xi_\ell(r) = \int \frac{dk k^2}{2\pi^2} P_k j_\ell(kr)
  * P(k) will be multiplied by k^{3/2-\epsilon}, so \epsilon can be used to minimize ringing.
+ * FFTLog plans are cached internally and reused for transforms with the same geometry.
  * @param mu Bessel function order.
  * @param epsilon FFTLog bias exponent.
  * @param npk number of power spectra that should be converted into correlation functions.
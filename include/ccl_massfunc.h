@@ -38,6 +38,23 @@ double ccl_sigmaM(ccl_cosmology *cosmo, double log_halomass, double a, int *stat
  */
 double ccl_dlnsigM_dlogM(ccl_cosmology *cosmo, double log_halomass, double a, int *status);
 
+/**
+ * Calculate the standard deviation of density, and its logarithmic derivative, on a 2D grid
+ * of scale factors and halo masses via interpolation.
+ * @param cosmo Cosmological parameters
+ * @param na number of scale factors
+ * @param a_arr scale factors
+ * @param nm number of halo masses
+ * @param log_halomass log10(Mass) to compute at, in units of Msun
+ * @param sigM_arr output sigma(M). Should have size na * nm, with the mass being the fastest varying variable.
+ * @param dlns_arr output dln(sigma^-1)/dlog10(M), with the same layout as sigM_arr. Not computed if NULL.
+ * @param status Status flag. 0 if there are no errors, nonzero otherwise.
+ * For specific cases see documentation for ccl_error.
+ */
+void ccl_sigmaM_2d(ccl_cosmology *cosmo, int na, double *a_arr,
+                   int nm, double *log_halomass,
+                   double *sigM_arr, double *dlns_arr, int *status);
+
 CCL_END_DECLS
 
 #endif
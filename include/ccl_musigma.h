@@ -35,6 +35,34 @@ double ccl_Sig_MG(ccl_cosmology * cosmo, double a, double k, int *status);
 */
 double ccl_mu_MG(ccl_cosmology * cosmo, double a, double k, int *status);
 
+/**
+ * mu(a,k) in the mu / Sigma parameterisation of modified gravity on a grid of scale factors and wavenumbers.
+ * @param cosmo Cosmological parameters
+ * @param na number of scale factors
+ * @param a scale factors, normalized to 1 for today
+ * @param nk number of wavenumbers
+ * @param k wavenumbers
+ * @param output output array of size na * nk, with the scale factor varying fastest.
+ * @param status 0 if there are no errors, nonzero otherwise.
+ *  For specific cases see documentation for ccl_error.c
+*/
+void ccl_mu_MG_vec(ccl_cosmology * cosmo, int na, double *a, int nk, double *k,
+                   double *output, int *status);
+
+/**
+ * Sigma(a,k) in the mu / Sigma parameterisation of modified gravity on a grid of scale factors and wavenumbers.
+ * @param cosmo Cosmological parameters
+ * @param na number of scale factors
+ * @param a scale factors, normalized to 1 for today
+ * @param nk number of wavenumbers
+ * @param k wavenumbers
+ * @param output output array of size na * nk, with the scale factor varying fastest.
+ * @param status 0 if there are no errors, nonzero otherwise.
+ *  For specific cases see documentation for ccl_error.c
+*/
+void ccl_Sig_MG_vec(ccl_cosmology * cosmo, int na, double *a, int nk, double *k,
+                    double *output, int *status);
+
 CCL_END_DECLS
 
 #endif
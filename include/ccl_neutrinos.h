@@ -45,5 +45,29 @@ typedef enum ccl_neutrino_mass_splits{
  */
 double ccl_Omeganuh2(double a, int N_nu_mass, double* mnu, double T_CMB, double T_ncdm, int * status);
 
+/**
+ * Returns the density of massive neutrinos at an array of scale factors.
+ * The mass and temperature-dependent prefactors are computed only once.
+ * @param na Number of scale factors.
+ * @param a Scale factors.
+ * @param N_nu_mass Number of massive neutrino species.
+ * @param mnu Pointer to array containing neutrino mass (can be 0).
+ * @param T_CMB Temperature of the CMB
+ * @param T_ncdm Non-CDM temperature in units of photon temperature.
+ * @param output Output array of size na, with the fractional energy density of massive neutrinos, multiplied by h squared.
+ * @param status Status flag. 0 if there are no errors, nonzero otherwise.
+ * For specific cases see documentation for ccl_error.c
+ */
+void ccl_Omeganuh2_vec(int na, double *a, int N_nu_mass, double* mnu,
+                       double T_CMB, double T_ncdm, double *output, int * status);
+
+/**
+ * Precomputed phase-space integral of a massive neutrino species, sampled at
+ * CCL_NU_MNUT_N values of log(m/T) linearly spaced between
+ * log(CCL_NU_MNUT_MIN) and log(CCL_NU_MNUT_MAX), and normalized to its value
+ * at the first node.
+ */
+extern const double ccl_nu_phasespace_table[CCL_NU_MNUT_N];
+
 CCL_END_DECLS
 #endif
@@ -63,6 +63,19 @@ ccl_cl_tracer_t *ccl_cl_tracer_t_new(ccl_cosmology *cosmo,
  */
 void ccl_cl_tracer_t_free(ccl_cl_tracer_t *tr);
 
+/**
+ * Update the values of the radial kernel of a tracer in place.
+ * The kernel must be sampled on the same number of radial distances used when creating the tracer.
+ * @param tr tracer.
+ * @param n_w number of array elements in radial kernel.
+ * @param chi_w values of the radial comoving distance for the radial kernel.
+ * @param w_w corresponding values of the radial kernel.
+ * @param status Status flag. 0 if there are no errors, nonzero otherwise.
+ */
+void ccl_cl_tracer_t_update_kernel(ccl_cl_tracer_t *tr,
+				   int n_w,double *chi_w,double *w_w,
+				   int *status);
+
 /**
  * Return the ell-dependent part of a tracer.
  * @param tr tracer.
@@ -148,6 +161,44 @@ void ccl_get_lensing_mag_kernel(ccl_cosmology *cosmo,
 				int nz_s,double *zs_arr,double *sz_arr,
 				int nchi,double *chi_arr,double *wL_arr,int *status);
 
+/**
+ * Return the geometric weight matrix of the lensing kernel. Multiplying
+ * this matrix by a normalized redshift distribution (times the magnification
+ * factor 1-5s(z)/2) sampled on z_arr yields the lensing kernel at chi_arr.
+ * @param cosmo cosmology.
+ * @param nz number of input redshifts.
+ * @param z_arr input redshifts (in increasing order).
+ * @param nchi number of distance values.
+ * @param chi_arr input array of distances.
+ * @param g_arr output weight matrix. Should have size nchi * nz, with the redshift being the fastest varying variable.
+ * @param status Status flag. 0 if there are no errors, nonzero otherwise.
+ */
+void ccl_get_lensing_kernel_weights(ccl_cosmology *cosmo,
+				    int nz,double *z_arr,
+				    int nchi,double *chi_arr,
+				    double *g_arr,int *status);
+
+/**
+ * Return lensing kernels for several redshift distributions sampled on the same redshift grid.
+ * @param cosmo cosmology.
+ * @param nz number of input redshifts.
+ * @param z_arr input redshifts (in increasing order).
+ * @param n_nz number of redshift distributions.
+ * @param nz_arr input redshift distributions. Should have size n_nz * nz, with the redshift being the fastest varying variable.
+ * @param normalize_nz if not zero, will normalize each redshift distribution to unit integral.
+ * @param sz_arr magnification bias with the same layout as nz_arr. If NULL, magnification bias will be assumed to be zero.
+ * @param nchi number of distance values.
+ * @param chi_arr input array of distances.
+ * @param wL_arr output lensing kernels. Should have size n_nz * nchi, with the distance being the fastest varying variable.
+ * @param status Status flag. 0 if there are no errors, nonzero otherwise.
+ */
+void ccl_get_lensing_mag_kernel_multi(ccl_cosmology *cosmo,
+				      int nz,double *z_arr,
+				      int n_nz,double *nz_arr,
+				      int normalize_nz,double *sz_arr,
+				      int nchi,double *chi_arr,
+				      double *wL_arr,int *status);
+
 /**
  * Return radial kernel for CMB lensing convergence.
  * @param cosmo cosmology.
@@ -16,13 +16,14 @@ __all__ = (
     "comoving_angular_distance", "angular_diameter_distance",
     "luminosity_distance", "distance_modulus",
     "sigma_critical", "omega_x", "rho_x",
-    "growth_factor", "growth_factor_unnorm", "growth_rate",)
+    "growth_factor", "growth_factor_unnorm", "growth_rate",
+    "scale_dependent_growth_factor", "scale_dependent_growth_rate",)
 
 from enum import Enum
 
 import numpy as np
 
-from . import lib, physical_constants
+from . import check, lib, physical_constants
 from .pyutils import (_vectorize_fn, _vectorize_fn3,
                       _vectorize_fn4, _vectorize_fn5)
 
@@ -347,3 +348,73 @@ def growth_rate(cosmo, a):
     cosmo.compute_growth()
     return _vectorize_fn(lib.growth_rate,
                          lib.growth_rate_vec, cosmo, a)
+
+
+def _scale_dependent_growth(cosmo, k, a):
+    # Growth factor and growth rate on the (a, k) grid, with shape
+    # (2, n_a, n_k). Scalar ``k`` or ``a`` dimensions are squeezed.
+    a_use = np.atleast_1d(np.array(a, dtype=float))
+    k_use = np.atleast_1d(np.array(k, dtype=float))
+    # The growth ODE is integrated forward in a.
+    order = np.argsort(a_use)
+    na, nk = a_use.size, k_use.size
+
+    status = 0
+    out, status = lib.scale_dependent_growth_vec(
+        cosmo.cosmo, a_use[order], k_use, 2*na*nk, status)
+    check(status, cosmo)
+
+    out = out.reshape([2, nk, na]).transpose(0, 2, 1)
+    gf = np.empty_like(out)
+    gf[:, order] = out
+    if np.ndim(k) == 0:
+        gf = gf[:, :, 0]
+    if np.ndim(a) == 0:
+        gf = gf[:, 0]
+    return gf
+
+
+def scale_dependent_growth_factor(cosmo, k, a):
+    """Scale-dependent linear growth factor :math:`D(k,a)`.
+
+    The growth ODE is solved once for each wavenumber, including the
+    scale dependence of :math:`\\mu(k,a)` in the :math:`\\mu-\\Sigma`
+    parametrization of modified gravity. If :math:`\\mu` is
+    scale-independent, the result does not depend on :math:`k` and is equal
+    to :func:`growth_factor`.
+
+    .. warning:: CCL is not able to compute the scale-dependent growth
+                 factor for cosmologies with massive neutrinos.
+
+    Args:
+        cosmo (:class:`~pyccl.cosmology.Cosmology`): Cosmological parameters.
+        k (:obj:`float` or `array`): Wavenumber(s) in units of
+            :math:`{\\rm Mpc}^{-1}`.
+        a (:obj:`float` or `array`): Scale factor(s), normalized to 1 today.
+
+    Returns:
+        (:obj:`float` or `array`): Growth factor, normalized to the
+        large-scale (:math:`k=0`) growth factor today. The output has
+        shape ``(n_a, n_k)``, with dimensions of scalar inputs squeezed.
+    """
+    return _scale_dependent_growth(cosmo, k, a)[0]
+
+
+def scale_dependent_growth_rate(cosmo, k, a):
+    """Scale-dependent growth rate :math:`f(k,a)\\equiv
+    d\\log D(k,a)/d\\log a` (see :func:`scale_dependent_growth_factor`).
+
+    .. warning:: CCL is not able to compute the scale-dependent growth
+                 rate for cosmologies with massive neutrinos.
+
+    Args:
+        cosmo (:class:`~pyccl.cosmology.Cosmology`): Cosmological parameters.
+        k (:obj:`float` or `array`): Wavenumber(s) in units of
+            :math:`{\\rm Mpc}^{-1}`.
+        a (:obj:`float` or `array`): Scale factor(s), normalized to 1 today.
+
+    Returns:
+        (:obj:`float` or `array`): Growth rate, with shape ``(n_a, n_k)``
+        (dimensions of scalar inputs squeezed).
+    """
+    return _scale_dependent_growth(cosmo, k, a)[1]
@@ -1,10 +1,9 @@
 __all__ = ("BaccoemuBaryons",)
 
 import numpy as np
-from copy import deepcopy
 
-from .. import Pk2D
 from . import Baryons
+from ..emulators.baccoemu_utils import _get_emupars
 
 
 class BaccoemuBaryons(Baryons):
@@ -62,21 +61,6 @@ class BaccoemuBaryons(Baryons):
             'M_inn': log10_M_inn
         }
 
-    def _sigma8tot_2_sigma8cold(self, emupars, sigma8tot):
-        """Use baccoemu to convert sigma8 total matter to sigma8 cdm+baryons
-        """
-        if np.ndim(emupars['omega_cold']) == 1:
-            _emupars = {}
-            for pname in emupars:
-                _emupars[pname] = emupars[pname][0]
-        else:
-            _emupars = emupars
-        A_s_fid = 2.1e-9
-        sigma8tot_fid = self.mpk.get_sigma8(cold=False,
-                                            A_s=A_s_fid, **_emupars)
-        A_s = (sigma8tot / sigma8tot_fid)**2 * A_s_fid
-        return self.mpk.get_sigma8(cold=True, A_s=A_s, **_emupars)
-
     def boost_factor(self, cosmo, k, a):
         """The baccoemu BCM model boost factor for baryons.
 
@@ -89,67 +73,84 @@ class BaccoemuBaryons(Baryons):
             :obj:`float` or `array`: Correction factor to apply to \
             the power spectrum.
         """ # noqa
+        return self.boost_factor_batch(cosmo, k, a)[0]
 
-        # Check a ranges
-        self._check_a_range(a)
+    def boost_factor_batch(self, cosmo, k, a, bcm_params=None):
+        """The baccoemu BCM model boost factor for several cosmologies
+        and/or sets of baryonic parameters, evaluated with a single call to
+        the emulator (one per value of :math:`h`).
 
-        # First create the dictionary passed to baccoemu
-        # if a is an array, make sure all the other parameters passed to the
-        # emulator have the same len
-        if np.ndim(a) == 1:
-            emupars = dict(
-                omega_cold=np.full((len(a)),
-                                   cosmo['Omega_c'] + cosmo['Omega_b']),
-                omega_baryon=np.full((len(a)), cosmo['Omega_b']),
-                ns=np.full((len(a)), cosmo['n_s']),
-                hubble=np.full((len(a)), cosmo['h']),
-                neutrino_mass=np.full((len(a)), np.sum(cosmo['m_nu'])),
-                w0=np.full((len(a)), cosmo['w0']),
-                wa=np.full((len(a)), cosmo['wa']),
-                expfactor=a
-            )
-        else:
-            emupars = dict(
-                omega_cold=cosmo['Omega_c'] + cosmo['Omega_b'],
-                omega_baryon=cosmo['Omega_b'],
-                ns=cosmo['n_s'],
-                hubble=cosmo['h'],
-                neutrino_mass=np.sum(cosmo['m_nu']),
-                w0=cosmo['w0'],
-                wa=cosmo['wa'],
-                expfactor=a
-            )
-
-        # if cosmo contains sigma8, we use it for baccoemu, otherwise we pass
-        # A_s to the emulator
-        if np.isnan(cosmo['A_s']):
-            # note that ccl parametrises sigma8 of the total matter power
-            # spectrum while baccoemu defines it in terms of the cdm+baryons
-            # power spectrum; so we have to convert from total to cold sigma8
-            sigma8tot = cosmo['sigma8']
-            sigma8cold = self._sigma8tot_2_sigma8cold(emupars, sigma8tot)
-            if np.ndim(a) == 1:
-                emupars['sigma8_cold'] = np.full((len(a)), sigma8cold)
-            else:
-                emupars['sigma8_cold'] = sigma8cold
+        Args:
+            cosmo (:class:`~pyccl.cosmology.Cosmology` or :obj:`list`):
+                Cosmological parameters, or a list of them.
+            k (:obj:`float` or `array`): Wavenumber (in
+                :math:`{\\rm Mpc}^{-1}`).
+            a (:obj:`float` or `array`): Scale factor.
+            bcm_params (:obj:`list` or :obj:`None`): list of dictionaries
+                of baryonic parameters, with the same names as the
+                arguments of :meth:`update_parameters` (e.g.
+                ``log10_M_c``). Missing parameters take the values stored
+                in this object. If :obj:`None`, the parameters of this
+                object are used.
+
+        Returns:
+            `array`: Correction factors with shape ``(N, n_a, n_k)``,
+            where ``N`` is the number of cosmologies or sets of
+            parameters. The dimensions corresponding to scalar ``a`` or
+            ``k`` are squeezed out.
+        """
+        cosmos = list(cosmo) if isinstance(cosmo, (list, tuple)) else [cosmo]
+        if bcm_params is None:
+            params = [self.bcm_params]
         else:
-            if np.ndim(a) == 1:
-                emupars['A_s'] = np.full((len(a)), cosmo['A_s'])
-            else:
-                emupars['A_s'] = cosmo['A_s']
-
-        # change masses from Msun to Msun/h
-        _bcm_params = deepcopy(self.bcm_params)
-        l10h = np.log10(emupars['hubble'])
-        for key in ['M_c', 'M1_z0_cen', 'M_inn']:
-            _bcm_params[key] += l10h
-
-        # baccoemu internally interpolates k with a cubic spline
-        # it returns k, boost, so, since we are already requesting a specific
-        # k-vector we can ignore the first returned object
-        _, fka = self.mpk.get_baryonic_boost(k=k / cosmo['h'],
-                                             **{**emupars, **_bcm_params})
+            params = []
+            for pars in bcm_params:
+                bad = set(pars) - {"log10_" + key for key in self.bcm_params}
+                if bad:
+                    raise ValueError(f"Unknown baryonic parameters {bad}.")
+                params.append({**self.bcm_params,
+                               **{key[6:]: val for key, val in pars.items()}})
+
+        # Broadcast the cosmologies and the baryonic parameters.
+        n_batch = max(len(cosmos), len(params))
+        if len(cosmos) == 1:
+            cosmos = cosmos * n_batch
+        if len(params) == 1:
+            params = params * n_batch
+        if len(cosmos) != len(params):
+            raise ValueError("The number of cosmologies and of sets of "
+                             "baryonic parameters must match.")
 
+        # Check a ranges
+        self._check_a_range(a)
+        a_use = np.atleast_1d(a).astype(float)
+        k_use = np.atleast_1d(k).astype(float)
+
+        fka = np.zeros([n_batch, a_use.size, k_use.size])
+        hs = np.array([c['h'] for c in cosmos])
+        for h in np.unique(hs):
+            # baccoemu takes a single k vector (in h/Mpc) per call, so
+            # cosmologies are grouped by their value of h.
+            idx = np.where(hs == h)[0]
+            emupars = _get_emupars(self.mpk, [cosmos[i] for i in idx], a_use)
+            # change masses from Msun to Msun/h
+            _bcm_params = {key: np.repeat([params[i][key] for i in idx],
+                                          a_use.size)
+                           for key in self.bcm_params}
+            for key in ['M_c', 'M1_z0_cen', 'M_inn']:
+                _bcm_params[key] = _bcm_params[key] + np.log10(h)
+
+            # baccoemu internally interpolates k with a cubic spline
+            # it returns k, boost, so, since we are already requesting a
+            # specific k-vector we can ignore the first returned object
+            _, f = self.mpk.get_baryonic_boost(k=k_use / h,
+                                               **{**emupars, **_bcm_params})
+            fka[idx] = np.reshape(f, [idx.size, a_use.size, k_use.size])
+
+        if np.ndim(k) == 0:
+            fka = np.squeeze(fka, axis=-1)
+        if np.ndim(a) == 0:
+            fka = np.squeeze(fka, axis=1)
         return fka
 
     def update_parameters(self, log10_M_c=None, log10_eta=None,
@@ -184,19 +185,7 @@ class BaccoemuBaryons(Baryons):
         self.bcm_params.update(new_bcm_params)
 
     def _include_baryonic_effects(self, cosmo, pk):
-        # Applies boost factor
-        a_arr, lk_arr, pk_arr = pk.get_spline_arrays()
-        k_arr = np.exp(lk_arr)
-        fka = self.boost_factor(cosmo, k_arr, a_arr)
-        pk_arr *= fka
-
-        if pk.psp.is_log:
-            np.log(pk_arr, out=pk_arr)  # in-place log
-
-        return Pk2D(a_arr=a_arr, lk_arr=lk_arr, pk_arr=pk_arr,
-                    is_logp=pk.psp.is_log,
-                    extrap_order_lok=pk.extrap_order_lok,
-                    extrap_order_hik=pk.extrap_order_hik)
+        return self._apply_boost_factor(cosmo, pk)
 
     def _check_a_range(self, a):
         if np.ndim(a) == 0:
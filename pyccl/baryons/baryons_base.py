@@ -1,8 +1,11 @@
-__all__ = ("Baryons",)
+__all__ = ("Baryons", "BoostedPk2D",)
 
 from abc import abstractmethod
+from collections import OrderedDict
 
-from .. import CCLAutoRepr, CCLNamedClass
+import numpy as np
+
+from .. import CCLAutoRepr, CCLNamedClass, Pk2D, hash_, unlock_instance
 
 
 class Baryons(CCLAutoRepr, CCLNamedClass):
@@ -12,7 +15,15 @@ class Baryons(CCLAutoRepr, CCLNamedClass):
     :class:`~pyccl.pk2d.Pk2D` and returns another :class:`~pyccl.pk2d.Pk2D`
     object that now accounts for baryonic effects (according to the model
     implemented in the corresponding :class:`Baryons` object).
+
+    Models implementing a multiplicative ``boost_factor(cosmo, k, a)``
+    method cache the boost factors they compute (see
+    :meth:`clear_cache`), and can be applied lazily (see
+    :meth:`include_baryonic_effects`).
     """
+    # Maximum number of boost factor grids stored by each instance.
+    _n_boost_cache = 8
+    _boost_cache = None
 
     @abstractmethod
     def _include_baryonic_effects(self, cosmo, pk):
@@ -27,15 +38,119 @@ class Baryons(CCLAutoRepr, CCLNamedClass):
             :obj:`~pyccl.pk2d.Pk2D` object.
         """
 
-    def include_baryonic_effects(self, cosmo, pk):
+    def include_baryonic_effects(self, cosmo, pk, *, lazy=False):
         """Apply baryonic effects to a given power spectrum.
 
         Args:
             cosmo (:class:`~pyccl.cosmology.Cosmology`):
                 Cosmological parameters.
             pk (:class:`~pyccl.pk2d.Pk2D`): power spectrum.
+            lazy (:obj:`bool`): if ``True``, return a
+                :class:`BoostedPk2D` that applies the boost factor when it
+                is evaluated, instead of building a new spline. Only
+                available for models implementing ``boost_factor``.
 
         Returns:
-            :obj:`~pyccl.pk2d.Pk2D` or :obj:`None`.
+            :obj:`~pyccl.pk2d.Pk2D`, :class:`BoostedPk2D` or :obj:`None`.
         """
+        if lazy:
+            if not hasattr(self, "boost_factor"):
+                raise NotImplementedError(
+                    f"{self.__class__.__name__} does not implement a boost "
+                    "factor, so it cannot be applied lazily.")
+            return BoostedPk2D(pk, self, cosmo)
         return self._include_baryonic_effects(cosmo, pk)
+
+    @unlock_instance(mutate=False)
+    def _get_boost_factor(self, cosmo, k, a):
+        """Return the boost factor on the grid of ``a`` and ``k`` values,
+        with shape ``(n_a, n_k)``. Results are cached, keyed on the model
+        parameters, the cosmology and the grid.
+        """
+        a_use = np.atleast_1d(a).astype(float)
+        k_use = np.atleast_1d(k).astype(float)
+        if self._boost_cache is None:
+            self._boost_cache = OrderedDict()
+        cache = self._boost_cache
+
+        key = (hash_(self), hash_(cosmo), a_use.tobytes(), k_use.tobytes())
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        fka = np.array(self.boost_factor(cosmo, k_use, a_use), dtype=float)
+        fka = fka.reshape([a_use.size, k_use.size])
+        fka.flags.writeable = False
+        while len(cache) >= self._n_boost_cache:
+            cache.popitem(last=False)
+        cache[key] = fka
+        return fka
+
+    @unlock_instance(mutate=False)
+    def clear_cache(self):
+        """Empty the cache of boost factors."""
+        self._boost_cache = None
+
+    def _apply_boost_factor(self, cosmo, pk):
+        # Multiply the spline data of `pk` by the boost factor.
+        a_arr, lk_arr, pk_arr = pk.get_spline_arrays()
+        pk_arr *= self._get_boost_factor(cosmo, np.exp(lk_arr), a_arr)
+
+        if pk.psp.is_log:
+            np.log(pk_arr, out=pk_arr)  # in-place log
+
+        return Pk2D(a_arr=a_arr, lk_arr=lk_arr, pk_arr=pk_arr,
+                    is_logp=pk.psp.is_log,
+                    extrap_order_lok=pk.extrap_order_lok,
+                    extrap_order_hik=pk.extrap_order_hik)
+
+
+class BoostedPk2D:
+    """A power spectrum with baryonic effects applied at evaluation time.
+
+    Instead of building a new spline, the boost factor of a
+    :class:`Baryons` model is multiplied into the underlying
+    :class:`~pyccl.pk2d.Pk2D` whenever the power spectrum is evaluated.
+    Objects of this class are usually created by
+    :meth:`Baryons.include_baryonic_effects` with ``lazy=True``.
+
+    .. note:: Only direct evaluation is supported. Use :meth:`to_pk2d`
+              to obtain a :class:`~pyccl.pk2d.Pk2D` that can be passed to
+              other CCL functions.
+
+    Args:
+        pk (:class:`~pyccl.pk2d.Pk2D`): power spectrum without baryonic
+            effects.
+        baryons (:class:`Baryons`): baryonic effects model.
+        cosmo (:class:`~pyccl.cosmology.Cosmology`): Cosmological
+            parameters used to compute the boost factor.
+    """
+
+    def __init__(self, pk, baryons, cosmo):
+        self.pk = pk
+        self.baryons = baryons
+        self.cosmo = cosmo
+
+    def __call__(self, k, a, cosmo=None):
+        """Evaluate the power spectrum including baryonic effects.
+
+        Args:
+            k (:obj:`float` or `array`): Wavenumber (in
+                :math:`{\\rm Mpc}^{-1}`).
+            a (:obj:`float` or `array`): Scale factor.
+            cosmo (:class:`~pyccl.cosmology.Cosmology`): Cosmology used
+                to extrapolate the underlying power spectrum in ``a`` (see
+                :meth:`~pyccl.pk2d.Pk2D.__call__`).
+
+        Returns:
+            :obj:`float` or `array`: Power spectrum.
+        """
+        pk = self.pk(k, a, cosmo)
+        fka = self.baryons._get_boost_factor(self.cosmo, k, a)
+        return pk * fka.reshape(np.shape(pk))
+
+    def to_pk2d(self):
+        """Return a :class:`~pyccl.pk2d.Pk2D` with the boost factor
+        applied on its spline nodes.
+        """
+        return self.baryons._include_baryonic_effects(self.cosmo, self.pk)
@@ -2,7 +2,6 @@ __all__ = ("BaryonsSchneider15",)
 
 import numpy as np
 
-from .. import Pk2D
 from . import Baryons
 
 
@@ -81,16 +80,4 @@ class BaryonsSchneider15(Baryons):
             self.k_s = k_s
 
     def _include_baryonic_effects(self, cosmo, pk):
-        # Applies boost factor
-        a_arr, lk_arr, pk_arr = pk.get_spline_arrays()
-        k_arr = np.exp(lk_arr)
-        fka = self.boost_factor(cosmo, k_arr, a_arr)
-        pk_arr *= fka
-
-        if pk.psp.is_log:
-            np.log(pk_arr, out=pk_arr)  # in-place log
-
-        return Pk2D(a_arr=a_arr, lk_arr=lk_arr, pk_arr=pk_arr,
-                    is_logp=pk.psp.is_log,
-                    extrap_order_lok=pk.extrap_order_lok,
-                    extrap_order_hik=pk.extrap_order_hik)
+        return self._apply_boost_factor(cosmo, pk)
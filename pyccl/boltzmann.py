@@ -1,4 +1,7 @@
-__all__ = ("get_camb_pk_lin", "get_isitgr_pk_lin", "get_class_pk_lin",)
+__all__ = ("get_camb_pk_lin", "get_isitgr_pk_lin", "get_class_pk_lin",
+           "BoltzmannPool",)
+
+from concurrent.futures import Future, ProcessPoolExecutor
 
 import numpy as np
 
@@ -7,7 +10,16 @@ try:
 except ModuleNotFoundError:
     pass  # prevent nans from isitgr
 
-from . import CCLError, Pk2D, check, lib, sigma8
+from . import (CCLError, DEFAULT_POWER_SPECTRUM, Caching, Pk2D, cache,
+               check, lib, sigma8)
+
+
+# Primordial parameters of the Boltzmann runs cached when caching is enabled.
+# The linear power spectrum for any other amplitude and tilt is obtained by
+# rescaling. CAMB and CLASS both use a pivot scale of 0.05 Mpc^-1.
+_A_S_FID = 2.1e-9
+_N_S_FID = 1.0
+_K_PIVOT = 0.05
 
 
 def get_camb_pk_lin(cosmo, *, nonlin=False):
@@ -24,7 +36,20 @@ def get_camb_pk_lin(cosmo, *, nonlin=False):
         :class:`~pyccl.pk2d.Pk2D`: Power spectrum object. The linear power \
             spectrum. If ``nonlin=True``, returns a tuple \
             ``(pk_lin, pk_nonlin)``.
+
+    .. note:: If caching is enabled (see :class:`~pyccl._core.Caching`),
+              the linear power spectrum is computed for fixed primordial
+              parameters and rescaled to the requested ``A_s`` (or
+              ``sigma8``) and ``n_s``. Cosmologies differing only in these
+              parameters then share a single CAMB run.
     """
+    if not nonlin:
+        cosmo_fid = _get_fiducial_cosmology(cosmo)
+        if cosmo_fid is not None:
+            return _rescale_primordial(
+                cosmo, _get_fiducial_pk_arrays(cosmo_fid, "camb"),
+                normalize_sigma8=True)
+
     import camb
     import camb.model
 
@@ -150,26 +175,22 @@ def get_camb_pk_lin(cosmo, *, nonlin=False):
 
     camb_res = camb.get_transfer_functions(cp)
 
-    def construct_Pk2D(camb_res, nonlin=False):
+    def get_pk_arrays(camb_res, nonlin=False):
+        # Power spectra must have been computed already.
         k, z, pk = camb_res.get_linear_matter_power_spectrum(
-            hubble_units=True, nonlinear=nonlin)
+            hubble_units=True, nonlinear=nonlin, have_power_spectra=True)
 
         # convert to non-h inverse units
         k *= cosmo['h']
         pk /= (h2 * cosmo['h'])
 
-        # now build interpolant
-        nk = k.shape[0]
-        lk_arr = np.log(k)
+        # sort in increasing scale factor
         a_arr = 1.0 / (1.0 + z)
-        na = a_arr.shape[0]
         sinds = np.argsort(a_arr)
-        a_arr = a_arr[sinds]
-        ln_p_k_and_z = np.zeros((na, nk), dtype=np.float64)
-        for i, sind in enumerate(sinds):
-            ln_p_k_and_z[i, :] = np.log(pk[sind, :])
+        return a_arr[sinds], np.log(k), np.log(pk[sinds, :])
 
-        pk = Pk2D(
+    def construct_Pk2D(a_arr, lk_arr, ln_p_k_and_z):
+        return Pk2D(
             a_arr=a_arr,
             lk_arr=lk_arr,
             pk_arr=ln_p_k_and_z,
@@ -177,15 +198,7 @@ def get_camb_pk_lin(cosmo, *, nonlin=False):
             extrap_order_lok=1,
             extrap_order_hik=2)
 
-        return pk
-
-    if np.isfinite(cosmo["sigma8"]):
-        camb_res.calc_power_spectra()
-        pk = construct_Pk2D(camb_res, nonlin=False)
-        sigma8_tmp = sigma8(cosmo, p_of_k_a=pk)
-        camb_res.Params.InitPower.As *= sigma8_target**2 / sigma8_tmp**2
-
-    if nonlin:
+    def set_nonlinear(camb_res):
         camb_res.Params.NonLinear = camb.model.NonLinear_pk
         camb_res.Params.NonLinearModel = camb.nonlinear.Halofit()
         halofit_version = extra_camb_params.get("halofit_version", "mead")
@@ -196,16 +209,37 @@ def get_camb_pk_lin(cosmo, *, nonlin=False):
         camb_res.Params.NonLinearModel.set_params(
             halofit_version=halofit_version,
             **options)
+
+    normalize_sigma8 = not np.isfinite(cosmo["A_s"])
+
+    # If the amplitude is known, the linear and non-linear power spectra
+    # are obtained from a single calculation.
+    if nonlin and not normalize_sigma8:
+        set_nonlinear(camb_res)
     else:
         assert camb_res.Params.NonLinear == camb.model.NonLinear_none
-
     camb_res.calc_power_spectra()
-    pk_lin = construct_Pk2D(camb_res, nonlin=False)
+    a_arr, lk_arr, ln_p_k_and_z = get_pk_arrays(camb_res, nonlin=False)
+
+    if normalize_sigma8:
+        # The linear power spectrum is proportional to A_s, so it
+        # can be rescaled analytically.
+        sigma8_tmp = sigma8(
+            cosmo, p_of_k_a=construct_Pk2D(a_arr, lk_arr, ln_p_k_and_z))
+        rescale = sigma8_target**2 / sigma8_tmp**2
+        ln_p_k_and_z += np.log(rescale)
+        camb_res.Params.InitPower.As *= rescale
+        if nonlin:
+            # The non-linear power spectrum needs the right A_s.
+            set_nonlinear(camb_res)
+            camb_res.calc_power_spectra()
+
+    pk_lin = construct_Pk2D(a_arr, lk_arr, ln_p_k_and_z)
 
     if not nonlin:
         return pk_lin
     else:
-        pk_nonlin = construct_Pk2D(camb_res, nonlin=True)
+        pk_nonlin = construct_Pk2D(*get_pk_arrays(camb_res, nonlin=True))
 
         return pk_lin, pk_nonlin
 
@@ -395,9 +429,48 @@ def get_class_pk_lin(cosmo):
     Returns:
         :class:`~pyccl.pk2d.Pk2D`: Power spectrum object.\
             The linear power spectrum.
+
+    .. note:: If caching is enabled (see :class:`~pyccl._core.Caching`),
+              the linear power spectrum is computed for fixed primordial
+              parameters and rescaled to the requested ``A_s`` and ``n_s``.
+              Cosmologies differing only in these parameters then share a
+              single CLASS run.
     """
+    cosmo_fid = _get_fiducial_cosmology(cosmo)
+    if cosmo_fid is not None:
+        return _rescale_primordial(
+            cosmo, _get_fiducial_pk_arrays(cosmo_fid, "class"),
+            normalize_sigma8=False)
+
     import classy
 
+    params = _get_class_params(cosmo)
+
+    model = None
+    try:
+        model = classy.Class()
+        model.set(params)
+        model.compute()
+        a_arr, lk_arr, ln_p_k_and_z = _get_class_pk_arrays(cosmo, model)
+    finally:
+        if model is not None:
+            model.struct_cleanup()
+            model.empty()
+
+    # make the Pk2D object
+    pk_lin = Pk2D(
+        a_arr=a_arr,
+        lk_arr=lk_arr,
+        pk_arr=ln_p_k_and_z,
+        is_logp=True,
+        extrap_order_lok=1,
+        extrap_order_hik=2)
+
+    return pk_lin
+
+
+def _get_class_params(cosmo):
+    """Return the dictionary of CLASS input parameters for a cosmology."""
     params = {
         "output": "mPk",
         "non linear": "none",
@@ -447,53 +520,244 @@ def get_class_pk_lin(cosmo):
             "Could not normalize the linear power spectrum. "
             "A_s = %f, sigma8 = %f" % (
                 cosmo['A_s'], cosmo['sigma8']))
+    return params
 
-    model = None
-    try:
-        model = classy.Class()
-        model.set(params)
-        model.compute()
 
-        # Set k and a sampling from CCL parameters
-        nk = lib.get_pk_spline_nk(cosmo.cosmo)
-        na = lib.get_pk_spline_na(cosmo.cosmo)
-        status = 0
-        a_arr, status = lib.get_pk_spline_a(cosmo.cosmo, na, status)
-        check(status, cosmo=cosmo)
-
-        # FIXME - getting the lowest CLASS k value from the python interface
-        # appears to be broken - setting to 1e-5 which is close to the
-        # old value
-        lk_arr = np.log(np.logspace(
-            -5,
-            np.log10(cosmo.cosmo.spline_params.K_MAX_SPLINE), nk))
-
-        # we need to cut this to the max value used for calling CLASS
-        msk = lk_arr < np.log(cosmo.cosmo.spline_params.K_MAX_SPLINE)
-        nk = int(np.sum(msk))
-        lk_arr = lk_arr[msk]
-
-        # now do interp by hand
-        ln_p_k_and_z = np.zeros((na, nk), dtype=np.float64)
-        for aind in range(na):
-            z = max(1.0 / a_arr[aind] - 1, 1e-10)
-            for kind in range(nk):
-                ln_p_k_and_z[aind, kind] = np.log(
-                    model.pk_lin(np.exp(lk_arr[kind]), z))
-    finally:
-        if model is not None:
-            model.struct_cleanup()
-            model.empty()
+def _get_class_pk_arrays(cosmo, model):
+    """Extract the linear power spectrum from a computed CLASS model,
+    sampled on the CCL spline grid. Returns the scale factors, the
+    natural logarithm of the wavenumbers, and the natural logarithm of
+    the power spectrum with shape ``(n_a, n_k)``.
+    """
+    # Set k and a sampling from CCL parameters
+    nk = lib.get_pk_spline_nk(cosmo.cosmo)
+    na = lib.get_pk_spline_na(cosmo.cosmo)
+    status = 0
+    a_arr, status = lib.get_pk_spline_a(cosmo.cosmo, na, status)
+    check(status, cosmo=cosmo)
 
-    params["P_k_max_1/Mpc"] = cosmo.cosmo.spline_params.K_MAX_SPLINE
+    # FIXME - getting the lowest CLASS k value from the python interface
+    # appears to be broken - setting to 1e-5 which is close to the
+    # old value
+    lk_arr = np.log(np.logspace(
+        -5,
+        np.log10(cosmo.cosmo.spline_params.K_MAX_SPLINE), nk))
+
+    # we need to cut this to the max value used for calling CLASS
+    msk = lk_arr < np.log(cosmo.cosmo.spline_params.K_MAX_SPLINE)
+    nk = int(np.sum(msk))
+    lk_arr = lk_arr[msk]
+
+    # Evaluate the whole (z, k) grid in a single call. The output is
+    # ordered with k varying fastest.
+    z_arr = np.maximum(1.0 / a_arr - 1, 1e-10)
+    pk = model.get_pk_array(np.ascontiguousarray(np.exp(lk_arr)),
+                            np.ascontiguousarray(z_arr),
+                            nk, na, False)
+    ln_p_k_and_z = np.log(pk.reshape([na, nk]))
+    return a_arr, lk_arr, ln_p_k_and_z
+
+
+def _get_fiducial_cosmology(cosmo):
+    """Return a copy of ``cosmo`` with the fiducial primordial parameters,
+    whose linear power spectrum can be cached and rescaled. Returns ``None``
+    if caching is disabled or if the linear power spectrum of ``cosmo``
+    should be computed directly.
+    """
+    if not Caching._enabled:
+        return None
+    if (cosmo["A_s"] == _A_S_FID) and (cosmo["n_s"] == _N_S_FID):
+        # This is the fiducial cosmology: run the Boltzmann code.
+        return None
+
+    from .cosmology import Cosmology
+    # `extra_parameters` is stored in both sets of init kwargs.
+    kwargs = {**cosmo._params_init_kwargs, **cosmo._config_init_kwargs}
+    kwargs.update(A_s=_A_S_FID, sigma8=None, n_s=_N_S_FID,
+                  matter_power_spectrum="linear", baryonic_effects=None,
+                  mg_parametrization=cosmo.mg_parametrization)
+    cosmo_fid = Cosmology(**kwargs)
+    if cosmo_fid._accuracy_params != cosmo._accuracy_params:
+        # Accuracy parameters changed since `cosmo` was created.
+        return None
+    return cosmo_fid
+
+
+@cache(maxsize=8)
+def _get_fiducial_pk_arrays(cosmo_fid, backend):
+    # Linear power spectrum of a fiducial cosmology. The cache key is built
+    # from its representation, which contains all the parameters except
+    # for the (fixed) primordial ones.
+    get_pk_lin = {"camb": get_camb_pk_lin, "class": get_class_pk_lin}
+    a_arr, lk_arr, pk_arr = get_pk_lin[backend](cosmo_fid).get_spline_arrays()
+    return a_arr, lk_arr, np.log(pk_arr)
+
+
+def _rescale_primordial(cosmo, arrays, normalize_sigma8):
+    """Rescale the linear power spectrum of the fiducial cosmology to the
+    primordial amplitude and tilt of ``cosmo``. If ``cosmo`` is specified
+    via ``sigma8``, the amplitude is normalized exactly if
+    ``normalize_sigma8`` is True, and approximately otherwise (to be
+    normalized later on by CCL).
+    """
+    a_arr, lk_arr, ln_p_k_and_z = arrays
+    ln_p_k_and_z = ln_p_k_and_z + (cosmo["n_s"] - _N_S_FID) * (
+        lk_arr - np.log(_K_PIVOT))
 
-    # make the Pk2D object
-    pk_lin = Pk2D(
-        a_arr=a_arr,
-        lk_arr=lk_arr,
-        pk_arr=ln_p_k_and_z,
-        is_logp=True,
-        extrap_order_lok=1,
-        extrap_order_hik=2)
+    def construct_Pk2D(ln_p_k_and_z):
+        return Pk2D(
+            a_arr=a_arr,
+            lk_arr=lk_arr,
+            pk_arr=ln_p_k_and_z,
+            is_logp=True,
+            extrap_order_lok=1,
+            extrap_order_hik=2)
 
-    return pk_lin
+    if np.isfinite(cosmo["A_s"]):
+        rescale = cosmo["A_s"] / _A_S_FID
+    elif np.isfinite(cosmo["sigma8"]):
+        if normalize_sigma8:
+            sigma8_tmp = sigma8(cosmo, p_of_k_a=construct_Pk2D(ln_p_k_and_z))
+            rescale = cosmo["sigma8"]**2 / sigma8_tmp**2
+        else:
+            rescale = 2.43e-9 * (cosmo["sigma8"] / 0.87659)**2 / _A_S_FID
+    else:
+        raise CCLError(
+            "Could not normalize the linear power spectrum. "
+            "A_s = %f, sigma8 = %f" % (
+                cosmo['A_s'], cosmo['sigma8']))
+
+    return construct_Pk2D(ln_p_k_and_z + np.log(rescale))
+
+
+def _pk2d_to_arrays(pk):
+    # Picklable representation of a log-interpolated Pk2D.
+    if pk is None:
+        return None
+    a_arr, lk_arr, pk_arr = pk.get_spline_arrays()
+    return (a_arr, lk_arr, np.log(pk_arr),
+            pk.extrap_order_lok, pk.extrap_order_hik)
+
+
+def _pk2d_from_arrays(arrays):
+    if arrays is None:
+        return None
+    a_arr, lk_arr, lpk_arr, extrap_order_lok, extrap_order_hik = arrays
+    return Pk2D(a_arr=a_arr, lk_arr=lk_arr, pk_arr=lpk_arr, is_logp=True,
+                extrap_order_lok=extrap_order_lok,
+                extrap_order_hik=extrap_order_hik)
+
+
+def _compute_power_arrays(cosmo):
+    # Run in a worker process. Computes the linear power spectrum of `cosmo`
+    # (and the non-linear one, if it comes from the same CAMB run).
+    pk_lin = cosmo._compute_linear_power()
+    pk_nl = cosmo._pk_nl.get(DEFAULT_POWER_SPECTRUM)
+    return _pk2d_to_arrays(pk_lin), _pk2d_to_arrays(pk_nl)
+
+
+class BoltzmannPool:
+    """Pool of worker processes running Boltzmann codes (CAMB, CLASS or
+    ISiTGR) in the background.
+
+    Submitting a :class:`~pyccl.cosmology.Cosmology` returns immediately
+    with a :class:`concurrent.futures.Future`. The linear power spectrum
+    (and the non-linear one, if ``matter_power_spectrum='camb'``) is
+    computed in a separate process and, once ready, installed in the
+    cosmology, which from then on behaves as if
+    :meth:`~pyccl.cosmology.Cosmology.compute_linear_power` had been called.
+    This allows the Boltzmann runs of many cosmologies (e.g. the walkers of
+    an ensemble sampler) to overlap with each other and with the
+    calculations for cosmologies whose power spectra are already available.
+
+    Example:
+        >>> with BoltzmannPool(max_workers=8) as pool:
+        ...     futures = [pool.submit(cosmo) for cosmo in cosmologies]
+        ...     for cosmo, fut in zip(cosmologies, futures):
+        ...         fut.result()  # wait for this cosmology
+        ...         cls = angular_cl(cosmo, tracer1, tracer2, ell)
+
+    Args:
+        max_workers (:obj:`int`): maximum number of worker processes.
+            Defaults to the number of processors.
+        mp_context: multiprocessing context used to start the workers. See
+            :class:`concurrent.futures.ProcessPoolExecutor`.
+    """
+    _transfer_functions = ["boltzmann_camb", "boltzmann_class",
+                           "boltzmann_isitgr"]
+
+    def __init__(self, max_workers=None, *, mp_context=None):
+        self._executor = ProcessPoolExecutor(max_workers=max_workers,
+                                             mp_context=mp_context)
+
+    def submit(self, cosmo):
+        """Start computing the power spectrum of a cosmology.
+
+        Args:
+            cosmo (:class:`~pyccl.cosmology.Cosmology`): Cosmological
+                parameters. The transfer function must be one of
+                ``'boltzmann_camb'``, ``'boltzmann_class'`` or
+                ``'boltzmann_isitgr'``.
+
+        Returns:
+            :class:`concurrent.futures.Future`: future resolving to the
+            linear :class:`~pyccl.pk2d.Pk2D` once it has been installed
+            in ``cosmo``.
+        """
+        trf = cosmo._config_init_kwargs["transfer_function"]
+        if trf not in self._transfer_functions:
+            raise ValueError("BoltzmannPool can only compute power spectra "
+                             "for the transfer functions "
+                             f"{self._transfer_functions}, not {trf}.")
+
+        future = Future()
+        if cosmo.has_linear_power:
+            future.set_result(cosmo.get_linear_power())
+            return future
+
+        def install(job):
+            try:
+                pk_lin, pk_nl = map(_pk2d_from_arrays, job.result())
+                # Don't replace power spectra computed in the meantime.
+                if pk_nl is not None:
+                    cosmo._pk_nl.setdefault(DEFAULT_POWER_SPECTRUM, pk_nl)
+                pk_lin = cosmo._pk_lin.setdefault(DEFAULT_POWER_SPECTRUM,
+                                                  pk_lin)
+            except BaseException as err:
+                future.set_exception(err)
+            else:
+                future.set_result(pk_lin)
+
+        future.set_running_or_notify_cancel()
+        job = self._executor.submit(_compute_power_arrays, cosmo)
+        job.add_done_callback(install)
+        return future
+
+    def compute(self, cosmos):
+        """Compute the power spectra of several cosmologies in parallel,
+        and wait for all of them.
+
+        Args:
+            cosmos (:obj:`list`): list of
+                :class:`~pyccl.cosmology.Cosmology` objects.
+
+        Returns:
+            :obj:`list`: linear :class:`~pyccl.pk2d.Pk2D` objects for each
+            cosmology, which are also installed in them.
+        """
+        futures = [self.submit(cosmo) for cosmo in cosmos]
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait=True):
+        """Shut down the worker processes.
+
+        Args:
+            wait (:obj:`bool`): whether to wait for pending jobs to finish.
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.shutdown()
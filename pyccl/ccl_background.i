@@ -8,6 +8,7 @@
 %apply (double* IN_ARRAY1, int DIM1) {(double* a, int na)};
 %apply (double* IN_ARRAY1, int DIM1) {(double* a1, int na1)};
 %apply (double* IN_ARRAY1, int DIM1) {(double* a2, int na2)};
+%apply (double* IN_ARRAY1, int DIM1) {(double* k, int nk)};
 %apply (double* IN_ARRAY1, int DIM1) {(double* chi, int nchi)};
 %apply (double* IN_ARRAY1, int DIM1) {(double* hoh0, int nhoh0)};
 %apply (double* IN_ARRAY1, int DIM1) {(double* growth, int ngrowth)};
@@ -112,6 +113,20 @@ void scale_factor_of_chi_vec(ccl_cosmology * cosmo, double* chi, int nchi,
 %}
 
 
+%feature("pythonprepend") scale_dependent_growth_vec %{
+    if nout != 2 * numpy.size(a) * numpy.size(k):
+        raise CCLError("`nout` must match twice the size of `a` times the size of `k`!")
+%}
+
+%inline %{
+
+void scale_dependent_growth_vec(ccl_cosmology * cosmo, double* a, int na, double* k, int nk,
+                                int nout, double* output, int *status) {
+    ccl_scale_dependent_growths(cosmo, na, a, nk, k, output, output+na*nk, status);
+}
+
+%}
+
 /* The directive gets carried between files, so we reset it at the end. */
 %feature("pythonprepend") %{ %}
 
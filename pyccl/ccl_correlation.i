@@ -10,6 +10,7 @@
 %apply (double* IN_ARRAY1, int DIM1) {
     (double* larr, int nlarr),
     (double* clarr, int nclarr),
+    (double* plarr, int nplarr),
     (double* theta, int nt),
     (double* r, int nr),
     (double* s, int ns),
@@ -27,6 +28,30 @@
         raise CCLError("Input shape for `theta` must match `(nout,)`!")
 %}
 
+%feature("pythonprepend") correlation_multi_vec %{
+    if numpy.size(clarr) != numpy.size(larr) * ncl:
+        raise CCLError("Input size of `clarr` must match `larr` times `ncl`!")
+
+    if nout != ncl * numpy.size(theta):
+        raise CCLError("`nout` must match `ncl` times the size of `theta`!")
+%}
+
+%feature("pythonprepend") correlation_legendre_matrix_vec %{
+    if nout != numpy.size(theta) * (ell_max + 1):
+        raise CCLError("`nout` must match the size of `theta` times `ell_max+1`!")
+%}
+
+%feature("pythonprepend") correlation_legendre_multi_vec %{
+    if numpy.size(clarr) != numpy.size(larr) * ncl:
+        raise CCLError("Input size of `clarr` must match `larr` times `ncl`!")
+
+    if numpy.size(plarr) != nt * (ell_max + 1):
+        raise CCLError("Input size of `plarr` must match `nt` times `ell_max+1`!")
+
+    if nout != ncl * nt:
+        raise CCLError("`nout` must match `ncl` times `nt`!")
+%}
+
 %feature("pythonprepend") correlation_3d_vec %{
     if numpy.shape(r) != (nxi,):
         raise CCLError("Input shape for `r` must match `(nxi,)`!")
@@ -63,6 +88,33 @@ void correlation_vec(ccl_cosmology *cosmo, double* larr, int nlarr,
         output, corr_type, 0, NULL, method, status);
 }
 
+void correlation_multi_vec(ccl_cosmology *cosmo, double* larr, int nlarr,
+                           double* clarr, int nclarr, int ncl,
+                           double* theta, int nt,
+                           int corr_type, int method, int nout, double* output,
+                           int *status) {
+    ccl_correlation_multi(
+        cosmo, nlarr, larr, ncl, clarr, nt, theta,
+        output, corr_type, 0, NULL, method, status);
+}
+
+void correlation_legendre_matrix_vec(ccl_cosmology *cosmo, double* theta, int nt,
+                                     int corr_type, int ell_max,
+                                     int nout, double* output, int *status) {
+    ccl_correlation_legendre_matrix(
+        cosmo, corr_type, nt, theta, ell_max, output, status);
+}
+
+void correlation_legendre_multi_vec(ccl_cosmology *cosmo,
+                                    double* larr, int nlarr,
+                                    double* clarr, int nclarr, int ncl,
+                                    double* plarr, int nplarr,
+                                    int nt, int ell_max,
+                                    int nout, double* output, int *status) {
+    ccl_correlation_legendre_multi(
+        cosmo, nlarr, larr, ncl, clarr, nt, ell_max, plarr, output, status);
+}
+
 void correlation_3d_vec(ccl_cosmology *cosmo,ccl_f2d_t *psp,
                         double a, double* r, int nr,
                         int nxi, double* xi, int *status) {
@@ -33,7 +33,7 @@ void array_1d_resample(double *x_in, int n_in_x,
 {
   int ii;
   ccl_f1d_t *spl=ccl_f1d_t_new(n_in_x, x_in, f_in, f0, ff,
-			       extrap_hi, extrap_lo, status);
+			       extrap_lo, extrap_hi, status);
   if(spl==NULL)
     *status=CCL_ERROR_MEMORY;
 
@@ -52,3 +52,27 @@ void array_1d_resample(double *x_in, int n_in_x,
 }
 
 %}
+
+%feature("pythonprepend") array_2d_resample %{
+    if numpy.size(f_in) != numpy.size(x_in) * nf:
+        raise CCLError("Input size of `f_in` must match `x_in` times `nf`!")
+
+    if nout != numpy.size(x_out) * nf:
+        raise CCLError("`nout` must match `x_out` times `nf`!")
+%}
+
+%inline %{
+
+void array_2d_resample(double *x_in, int n_in_x,
+		       double *f_in, int n_in_f, int nf,
+		       double *x_out, int n_out_x,
+		       double f0, double ff,
+		       int extrap_lo, int extrap_hi,
+		       int nout, double *output,
+		       int *status)
+{
+  ccl_f1d_resample_multi(n_in_x, x_in, nf, f_in, n_out_x, x_out,
+			 f0, ff, extrap_lo, extrap_hi, output, status);
+}
+
+%}
@@ -8,7 +8,8 @@
 
 %apply (double* IN_ARRAY1, int DIM1) {
   (double *k_in, int n_in_k),
-  (double *fk_in, int n_in_f)};
+  (double *fk_in, int n_in_f),
+  (double *mu_in, int n_mu)};
 %apply (int DIM1, double* ARGOUT_ARRAY1) {(int nout, double* output)};
 
 
@@ -60,3 +61,97 @@ void fftlog_transform(int npk,
 }
 
 %}
+
+%feature("pythonprepend") fftlog_transform_multi %{
+    if npk * k_in.size != fk_in.size:
+        raise CCLError("Input size for `fk_in` must match `npk * k_in.size`")
+
+    if nout != mu_in.size * k_in.size * (npk + 1):
+        raise CCLError("Input shape for `output` must match `(mu_in.size * k_in.size * (npk + 1),)`!")
+
+    if (dim != 2) and (dim !=3):
+        raise CCLError("`dim` must be 2 or 3")
+%}
+
+%inline %{
+
+void fftlog_transform_multi(int npk,
+			    double *k_in, int n_in_k,
+			    double *fk_in, int n_in_f,
+			    int dim, double *mu_in, int n_mu,
+			    double plaw_index,
+			    int nout, double *output,
+			    int *status)
+{
+  int ii, imu;
+  double epsilon = 0.5*dim+plaw_index;
+
+  double **_fk_in=NULL, **_fr_out=NULL;
+  _fk_in = malloc(npk*sizeof(double *));
+  _fr_out = malloc(npk*sizeof(double *));
+  if((_fk_in==NULL) || (_fr_out==NULL))
+    *status = CCL_ERROR_MEMORY;
+
+  if(*status==0) {
+    for(ii=0;ii<npk;ii++)
+      _fk_in[ii]=&(fk_in[ii*n_in_k]);
+  }
+
+  // The same inputs are transformed for each Bessel order, each block of
+  // the output holding the output abscissas followed by the npk transforms.
+  for(imu=0;(imu<n_mu) && (*status==0);imu++) {
+    double *out_mu = &(output[imu*(npk+1)*n_in_k]);
+    for(ii=0;ii<npk;ii++)
+      _fr_out[ii]=&(out_mu[(ii+1)*n_in_k]);
+
+    if(dim==3)
+      ccl_fftlog_ComputeXi3D(mu_in[imu], epsilon, npk, n_in_k, k_in, _fk_in, out_mu, _fr_out, status);
+    else if(dim==2)
+      ccl_fftlog_ComputeXi2D(mu_in[imu], epsilon, npk, n_in_k, k_in, _fk_in, out_mu, _fr_out, status);
+  }
+
+  free(_fk_in);
+  free(_fr_out);
+}
+
+%}
+
+%feature("pythonprepend") fftlog_plan_transform %{
+    if npk * k_in.size != fk_in.size:
+        raise CCLError("Input size for `fk_in` must match `npk * k_in.size`")
+
+    if nout != k_in.size * (npk + 1):
+        raise CCLError("Input shape for `output` must match `(k_in.size * (npk + 1),)`!")
+%}
+
+%inline %{
+
+void fftlog_plan_transform(ccl_fftlog_plan_t *plan, int npk,
+			   double *k_in, int n_in_k,
+			   double *fk_in, int n_in_f,
+			   int nout, double *output,
+			   int *status)
+{
+  int ii;
+  double *r_out = &(output[0]);
+
+  double **_fk_in=NULL, **_fr_out=NULL;
+  _fk_in = malloc(npk*sizeof(double *));
+  _fr_out = malloc(npk*sizeof(double *));
+  if((_fk_in==NULL) || (_fr_out==NULL))
+    *status = CCL_ERROR_MEMORY;
+
+  if(*status==0) {
+    for(ii=0;ii<npk;ii++) {
+      _fk_in[ii]=&(fk_in[ii*n_in_k]);
+      _fr_out[ii]=&(output[(ii+1)*n_in_k]);
+    }
+
+    ccl_fftlog_plan_execute(plan, npk, n_in_k, k_in, _fk_in, r_out, _fr_out, status);
+  }
+
+  free(_fk_in);
+  free(_fr_out);
+}
+
+%}
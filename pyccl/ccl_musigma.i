@@ -22,34 +22,12 @@
 %inline %{
 void mu_MG_vec(ccl_cosmology * cosmo, double* a, int na, double* k, int nk,
                int nout, double* output, int *status) {
-    int index;
-    int _status;
-    assert(nout == na*nk);
-    for(int j=0; j < nk; j++){
-            index = j * na; // to get correct indexing.
-            for(int i=0; i < na; i++){
-                _status = 0;
-                output[i+index] = ccl_mu_MG(cosmo, a[i], k[j], &_status);
-                *status |= _status;
-// printf("index-i=%d, index-j=%d, index=%d, Sigma=%f, a=%f, k=%f \n", i, j, index, output[i+index], a[i], k[j]);
-            }
-    }
+    ccl_mu_MG_vec(cosmo, na, a, nk, k, output, status);
 }
 
 void Sig_MG_vec(ccl_cosmology * cosmo, double* a, int na, double* k, int nk,
                 int nout, double* output, int *status) {
-    int index;
-    int _status;
-    assert(nout == na*nk);
-    for(int j=0; j < nk; j++){
-            index = j * na; // to get correct indexing.
-            for(int i=0; i < na; i++){
-                _status = 0;
-                output[i+index] = ccl_Sig_MG(cosmo, a[i], k[j], &_status);
-                *status |= _status;
-//printf("index-i=%d, index-j=%d, index=%d, Sigma=%f, a=%f, k=%f \n", i, j, index, output[i+index], a[i], k[j]);
-            }
-     }
+    ccl_Sig_MG_vec(cosmo, na, a, nk, k, output, status);
 }
 %}
 /* End of MG functions and unit tests */
@@ -7,7 +7,8 @@
 %include "../include/ccl_massfunc.h"
 
 // Enable vectorised arguments for arrays
-%apply (double* IN_ARRAY1, int DIM1) {(double* logM, int nM)};
+%apply (double* IN_ARRAY1, int DIM1) {(double* logM, int nM),
+                                      (double* a_arr, int na)};
 %apply (int DIM1, double* ARGOUT_ARRAY1) {(int nout, double* output)};
 
 /* The python code here will be executed before all of the functions that
@@ -37,5 +38,37 @@ void dlnsigM_dlogM_vec(ccl_cosmology * cosmo, double a,
 
 %}
 
+%feature("pythonprepend") sigM_2d_vec %{
+    if nout != numpy.size(a_arr) * numpy.size(logM):
+        raise CCLError("`nout` must match the sizes of `a_arr` times `logM`!")
+%}
+
+%feature("pythonprepend") sigM_dlnsigM_2d_vec %{
+    if nout != 2 * numpy.size(a_arr) * numpy.size(logM):
+        raise CCLError("`nout` must be twice the sizes of `a_arr` times `logM`!")
+%}
+
+%inline %{
+
+void sigM_2d_vec(ccl_cosmology * cosmo,
+		 double *a_arr, int na,
+		 double *logM, int nM,
+		 int nout, double* output, int *status)
+{
+  ccl_sigmaM_2d(cosmo, na, a_arr, nM, logM, output, NULL, status);
+}
+
+// Returns sigma(M) followed by dln(sigma^-1)/dlog10(M).
+void sigM_dlnsigM_2d_vec(ccl_cosmology * cosmo,
+			 double *a_arr, int na,
+			 double *logM, int nM,
+			 int nout, double* output, int *status)
+{
+  ccl_sigmaM_2d(cosmo, na, a_arr, nM, logM,
+		output, output + na*nM, status);
+}
+
+%}
+
 /* The directive gets carried between files, so we reset it at the end. */
 %feature("pythonprepend") %{ %}
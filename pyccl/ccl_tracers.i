@@ -76,6 +76,49 @@ void get_lensing_kernel_wrapper(ccl_cosmology *cosmo,
 }
 %}
 
+%feature("pythonprepend") get_lensing_kernel_multi_wrapper %{
+    if numpy.size(n) % numpy.size(z_n) != 0:
+        raise CCLError("Input size of `n` must be a multiple of that of `z_n`!")
+
+    if has_magbias and (numpy.shape(n) != numpy.shape(b)):
+        raise CCLError("Input shape for `n` must match `b`!")
+
+    if nout != (numpy.size(n) // numpy.size(z_n)) * numpy.size(chi_s):
+        raise CCLError("`nout` must match the number of `n` rows times `chi_s`")
+%}
+
+%inline %{
+void get_lensing_kernel_multi_wrapper(ccl_cosmology *cosmo,
+				      double *z_n, int nz_n,
+				      double *n, int nn,
+				      int has_magbias,
+				      double *b, int nb,
+				      double *chi_s, int nchi,
+				      int nout,double *output,
+				      int *status)
+{
+  double *sz_arr=NULL;
+
+  if(has_magbias)
+    sz_arr=b;
+  ccl_get_lensing_mag_kernel_multi(cosmo,
+				   nz_n, z_n, nn/nz_n, n, 1, sz_arr,
+				   nchi, chi_s, output, status);
+}
+%}
+
+%inline %{
+void get_lensing_kernel_weights_wrapper(ccl_cosmology *cosmo,
+					double *z_n, int nz_n,
+					double *chi_s, int nchi,
+					int nout,double *output,
+					int *status)
+{
+  ccl_get_lensing_kernel_weights(cosmo, nz_n, z_n, nchi, chi_s,
+				 output, status);
+}
+%}
+
 %inline %{
 void get_kappa_kernel_wrapper(ccl_cosmology *cosmo,double chi_source,
 			      double* chi_s, int nchi,
@@ -121,6 +164,21 @@ void cl_tracer_get_kernel(ccl_cl_tracer_t *tr,
 }
 %}
 
+%feature("pythonprepend") cl_tracer_update_kernel %{
+    if numpy.shape(chi_s) != numpy.shape(wchi_s):
+        raise CCLError("Input shape for `chi_s` must match `wchi_s`!")
+%}
+
+%inline %{
+void cl_tracer_update_kernel(ccl_cl_tracer_t *tr,
+			     double *chi_s, int nchi,
+			     double *wchi_s, int nwchi,
+			     int *status)
+{
+  ccl_cl_tracer_t_update_kernel(tr, nchi, chi_s, wchi_s, status);
+}
+%}
+
 %feature("pythonprepend") cl_tracer_get_f_ell %{
     if ell_s.size != nout:
         raise CCLError("Input shape for `ell_s` must match `nout`")
@@ -1,10 +1,11 @@
-__all__ = ("angular_cl",)
+__all__ = ("angular_cl", "AngularClDerivatives",)
 
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 
-from . import DEFAULT_POWER_SPECTRUM, CCLWarning, check, lib
+from . import DEFAULT_POWER_SPECTRUM, CCLWarning, UnlockInstance, check, lib
 from .pyutils import integ_types
 
 
@@ -83,3 +84,208 @@ def angular_cl(cosmo, tracer1, tracer2, ell, *,
 
     check(status, cosmo=cosmo_in)
     return cl
+
+
+# Finite-difference stencils for first derivatives: offsets (in units of
+# the step) and the corresponding weights.
+_STENCILS = {
+    3: ((-1, 1), (-1/2, 1/2)),
+    5: ((-2, -1, 1, 2), (1/12, -2/3, 2/3, -1/12)),
+    7: ((-3, -2, -1, 1, 2, 3), (-1/60, 3/20, -3/4, 3/4, -3/20, 1/60)),
+}
+
+
+def _cosmology_kwargs(cosmo):
+    """Arguments needed to re-create a :class:`~pyccl.cosmology.Cosmology`.
+    """
+    config = cosmo._config_init_kwargs
+    return {**cosmo._params_init_kwargs,
+            "transfer_function": (cosmo.lin_pk_emu or
+                                  config["transfer_function"]),
+            "matter_power_spectrum": (cosmo.nl_pk_emu or
+                                      config["matter_power_spectrum"]),
+            "baryonic_effects": cosmo.baryons,
+            "mg_parametrization": cosmo.mg_parametrization}
+
+
+def _angular_cl_pairs(cosmo, tracers, pairs, ell, cl_kwargs):
+    return np.array([angular_cl(cosmo, tracers[i], tracers[j], ell,
+                                **cl_kwargs)
+                     for i, j in pairs])
+
+
+def _accuracy_kwargs(cosmo):
+    """Numerical accuracy parameters of a cosmology, which can be sent to
+    worker processes. Spline types are not included, since they can't be
+    pickled.
+    """
+    return {name: {key: val for key, val in pars.items()
+                   if isinstance(val, (bool, int, float))}
+            for name, pars in [("spline_params", cosmo._spline_params),
+                               ("gsl_params", cosmo._gsl_params)]}
+
+
+def _perturbed_angular_cl(cosmo_kwargs, accuracy_kwargs, get_tracers, pairs,
+                          ell, cl_kwargs, tracers=None):
+    # Module-level so that it can be run in worker processes. The accuracy
+    # parameters of the fiducial cosmology are set on the new one before it
+    # computes anything, so the global parameters are left untouched.
+    from .cosmology import Cosmology
+    cosmo = Cosmology(**cosmo_kwargs)
+    with UnlockInstance(cosmo):
+        for name, pars in accuracy_kwargs.items():
+            c_pars = getattr(cosmo.cosmo, name)
+            for key, val in pars.items():
+                setattr(c_pars, key, val)
+            getattr(cosmo, f"_{name}").update(pars)
+        cosmo._accuracy_params = {**cosmo._spline_params,
+                                  **cosmo._gsl_params}
+    if tracers is None:
+        tracers = get_tracers(cosmo)
+    return _angular_cl_pairs(cosmo, tracers, pairs, ell, cl_kwargs)
+
+
+class AngularClDerivatives:
+    """Finite-difference derivatives of angular power spectra with respect to
+    cosmological parameters, e.g. for Fisher forecasts.
+
+    The fiducial cosmology, tracers and power spectra are computed once and
+    cached. For each parameter, the angular power spectra of all tracer pairs
+    are evaluated at the points of a central finite-difference stencil.
+    Parameters listed in ``kernel_invariant`` only affect the
+    three-dimensional power spectrum (not distances, growth or the tracer
+    kernels and transfer functions), so the fiducial tracers are reused for
+    them when running in a single process. With ``n_workers > 1``, all the
+    perturbed cosmologies are evaluated in parallel worker processes, with
+    the accuracy parameters of the fiducial cosmology.
+
+    Args:
+        cosmo (:class:`~pyccl.cosmology.Cosmology`): fiducial cosmology.
+            Cosmologies with custom input arrays
+            (:class:`~pyccl.cosmology.CosmologyCalculator`) are not supported.
+        get_tracers (:obj:`callable`): function taking a
+            :class:`~pyccl.cosmology.Cosmology` and returning a list of
+            :class:`~pyccl.tracers.Tracer` objects. If ``n_workers > 1``,
+            it must be picklable (e.g. a module-level function).
+        ell (`array`): angular multipoles.
+        params (:obj:`list`): names of the :class:`~pyccl.cosmology.Cosmology`
+            arguments to differentiate with respect to
+            (e.g. ``['Omega_c', 'sigma8']``).
+        steps (:obj:`dict` or :obj:`float`): finite-difference steps. If a
+            :obj:`dict`, absolute step for each parameter. If a
+            :obj:`float`, relative step (the absolute step is used for
+            parameters with a fiducial value of zero). Parameters missing
+            from a :obj:`dict` use a relative step of 0.01.
+        stencil (:obj:`int` or :obj:`tuple`): number of points of the
+            central stencil (3, 5 or 7), or a tuple ``(offsets, weights)``
+            defining a custom stencil, with offsets in units of the step.
+        pairs (:obj:`list`): list of index pairs ``(i, j)`` of tracers to
+            correlate. If ``None``, all pairs with ``i <= j`` are used.
+        kernel_invariant (:obj:`tuple`): parameters for which the fiducial
+            tracers can be reused.
+        n_workers (:obj:`int`): number of worker processes used to evaluate
+            perturbed cosmologies. If 1, everything runs in this process.
+        **cl_kwargs: extra keyword arguments passed to
+            :func:`angular_cl` (``p_of_k_a``, ``l_limber``,
+            ``limber_integration_method``).
+    """
+    def __init__(self, cosmo, get_tracers, ell, *, params, steps=0.01,
+                 stencil=3, pairs=None,
+                 kernel_invariant=("A_s", "sigma8", "n_s"),
+                 n_workers=1, **cl_kwargs):
+        from .cosmology import Cosmology
+        if type(cosmo) is not Cosmology:
+            raise NotImplementedError(
+                "Derivatives are only supported for `Cosmology` objects.")
+
+        self.cosmo = cosmo
+        self.get_tracers = get_tracers
+        self.ell = np.atleast_1d(ell)
+        self.cl_kwargs = cl_kwargs
+        self.n_workers = n_workers
+        self.kernel_invariant = kernel_invariant
+        self._cosmo_kwargs = _cosmology_kwargs(cosmo)
+        self._accuracy_kwargs = _accuracy_kwargs(cosmo)
+
+        self.params = list(params)
+        for par in self.params:
+            if self._cosmo_kwargs.get(par) is None:
+                raise ValueError(f"Parameter {par} is not set in the "
+                                 "fiducial cosmology.")
+        self.steps = {par: self._get_step(par, steps) for par in self.params}
+
+        if isinstance(stencil, int):
+            if stencil not in _STENCILS:
+                raise ValueError(f"Stencil must be one of "
+                                 f"{list(_STENCILS)} or (offsets, weights).")
+            stencil = _STENCILS[stencil]
+        self.offsets, self.weights = map(np.asarray, stencil)
+        if self.offsets.shape != self.weights.shape:
+            raise ValueError("Stencil offsets and weights must have the "
+                             "same shape.")
+
+        # Fiducial pieces
+        self.tracers = list(get_tracers(cosmo))
+        if pairs is None:
+            pairs = [(i, j) for i in range(len(self.tracers))
+                     for j in range(i, len(self.tracers))]
+        self.pairs = list(pairs)
+        self._cl_fid = None
+
+    def _get_step(self, par, steps):
+        if isinstance(steps, dict):
+            if par in steps:
+                return steps[par]
+            steps = 0.01
+        value = self._cosmo_kwargs[par]
+        return steps * abs(value) if value != 0 else steps
+
+    def _perturbed_kwargs(self, par, offset):
+        kwargs = dict(self._cosmo_kwargs)
+        kwargs[par] = kwargs[par] + offset * self.steps[par]
+        return kwargs
+
+    @property
+    def cl_fiducial(self):
+        """Angular power spectra of all pairs in the fiducial cosmology,
+        with shape ``(n_pairs, n_ell)``.
+        """
+        if self._cl_fid is None:
+            self._cl_fid = _angular_cl_pairs(self.cosmo, self.tracers,
+                                             self.pairs, self.ell,
+                                             self.cl_kwargs)
+        return self._cl_fid
+
+    def __call__(self):
+        """Compute the derivatives.
+
+        Returns:
+            `array`: derivatives of the angular power spectra with shape
+            ``(n_params, n_pairs, n_ell)``, ordered as ``params`` and
+            ``pairs``.
+        """
+        points = [(par, off) for par in self.params for off in self.offsets]
+        if self.n_workers <= 1 or not points:
+            cls = {}
+            for par, off in points:
+                tracers = None
+                if par in self.kernel_invariant:
+                    tracers = self.tracers
+                cls[par, off] = _perturbed_angular_cl(
+                    self._perturbed_kwargs(par, off), self._accuracy_kwargs,
+                    self.get_tracers, self.pairs, self.ell, self.cl_kwargs,
+                    tracers=tracers)
+        else:
+            with ProcessPoolExecutor(max_workers=self.n_workers) as ex:
+                futures = {p: ex.submit(_perturbed_angular_cl,
+                                        self._perturbed_kwargs(*p),
+                                        self._accuracy_kwargs,
+                                        self.get_tracers, self.pairs,
+                                        self.ell, self.cl_kwargs)
+                           for p in points}
+                cls = {p: fut.result() for p, fut in futures.items()}
+
+        return np.array([
+            sum(w * cls[par, off] for off, w in zip(self.offsets,
+                                                    self.weights))
+            / self.steps[par] for par in self.params])
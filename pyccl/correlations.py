@@ -1,6 +1,7 @@
 __all__ = ("CorrelationMethods", "CorrelationTypes", "correlation",
-           "correlation_3d", "correlation_multipole", "correlation_3dRsd",
-           "correlation_3dRsd_avgmu", "correlation_pi_sigma",)
+           "LegendreCorrelation", "correlation_3d", "correlation_multipole",
+           "correlation_3dRsd", "correlation_3dRsd_avgmu",
+           "correlation_pi_sigma",)
 
 from enum import Enum
 import numpy as np
@@ -85,7 +86,10 @@ def correlation(cosmo, *, ell, C_ell, theta, type='NN', method='fftlog'):
         cosmo (:class:`~pyccl.cosmology.Cosmology`): A Cosmology object.
         ell (array): Multipoles corresponding to the input angular power
                           spectrum.
-        C_ell (array): Input angular power spectrum.
+        C_ell (array): Input angular power spectrum. Several power spectra
+            can be passed at once as an array with shape
+            ``(..., len(ell))``, in which case they are transformed
+            together (e.g. with a single ``FFTLog`` call).
         theta (:obj:`float` or `array`): Angular separation(s) at which to
             calculate the angular correlation function (in degrees).
         type (:obj:`str`): Type of correlation function. Choices: ``'NN'`` (0x0),
@@ -98,11 +102,15 @@ def correlation(cosmo, *, ell, C_ell, theta, type='NN', method='fftlog'):
         method (:obj:`str`): Method to compute the correlation function.
             Choices: ``'Bessel'`` (direct integration over Bessel function),
             ``'FFTLog'`` (fast integration with FFTLog), ``'Legendre'``
-            (brute-force sum over Legendre polynomials).
+            (brute-force sum over Legendre polynomials, or Wigner-d
+            matrices for ``'GG+'`` and ``'GG-'``). To evaluate many power
+            spectra at the same angular separations with the ``'Legendre'``
+            method, use :class:`LegendreCorrelation`.
 
     Returns:
         (:obj:`float` or `array`): Value(s) of the correlation function at the
-        input angular separations.
+        input angular separations. For multi-dimensional ``C_ell``, the
+        output has shape ``C_ell.shape[:-1] + np.shape(theta)``.
     """ # noqa
     cosmo_in = cosmo
     cosmo = cosmo.cosmo
@@ -119,9 +127,20 @@ def correlation(cosmo, *, ell, C_ell, theta, type='NN', method='fftlog'):
     if scalar := isinstance(theta, (int, float)):
         theta = np.array([theta, ])
 
+    shape = np.shape(C_ell)[:-1]
     if np.all(np.array(C_ell) == 0):
         # short-cut and also avoid integration errors
-        wth = np.zeros_like(theta)
+        wth = np.zeros(shape + np.shape(theta))
+    elif shape:
+        # Transform all power spectra together
+        n_cl = int(np.prod(shape))
+        C_ell = np.asarray(C_ell, dtype=float).flatten()
+        wth, status = lib.correlation_multi_vec(cosmo, ell, C_ell, n_cl,
+                                                theta,
+                                                correlation_types[type],
+                                                correlation_methods[method],
+                                                n_cl*len(theta), status)
+        wth = wth.reshape(shape + (len(theta),))
     else:
         # Call correlation function
         wth, status = lib.correlation_vec(cosmo, ell, C_ell, theta,
@@ -130,10 +149,87 @@ def correlation(cosmo, *, ell, C_ell, theta, type='NN', method='fftlog'):
                                           len(theta), status)
     check(status, cosmo_in)
     if scalar:
-        return wth[0]
+        return wth[..., 0] if shape else wth[0]
     return wth
 
 
+class LegendreCorrelation:
+    r"""Angular correlation functions computed as a brute-force sum over
+    Legendre polynomials (or Wigner-d matrices for spin-2 fields), for many
+    power spectra at a fixed set of angular separations.
+
+    The :math:`(\theta,\ell)` matrix of weights in the sum is tabulated
+    once, on the first call, and reused for all subsequent calls, so that the
+    correlation functions of all input power spectra are obtained as a single
+    matrix product. The results match those of :func:`correlation` with
+    ``method='legendre'``. Note that the matrix holds
+    ``len(theta) * (ell_max+1)`` numbers, so ``ell_max`` may need to be
+    lowered for large numbers of angular separations.
+
+    .. code-block:: python
+
+        xi = ccl.LegendreCorrelation(theta=theta, type='GG+')
+        xip = xi(cosmo, ell=ell, C_ell=cls)  # cls.shape = (n_pairs, n_ell)
+
+    Args:
+        theta (:obj:`float` or `array`): Angular separation(s) at which to
+            calculate the angular correlation function (in degrees).
+        type (:obj:`str`): Type of correlation function. See
+            :func:`correlation`.
+        ell_max (:obj:`int`): Maximum multipole in the sum. If ``None``, the
+            value of ``spline_params.ELL_MAX_CORR`` of the cosmology
+            passed in the first call is used.
+    """
+    def __init__(self, *, theta, type='NN', ell_max=None):
+        if type not in correlation_types:
+            raise ValueError(f"Invalid correlation type {type}.")
+        self.theta = np.atleast_1d(np.asarray(theta, dtype=float))
+        self.type = type
+        self.ell_max = None if ell_max is None else int(ell_max)
+        self._pl = None
+
+    def _get_matrix(self, cosmo):
+        if self._pl is None:
+            if self.ell_max is None:
+                self.ell_max = int(cosmo.cosmo.spline_params.ELL_MAX_CORR)
+            status = 0
+            pl, status = lib.correlation_legendre_matrix_vec(
+                cosmo.cosmo, self.theta, correlation_types[self.type],
+                self.ell_max, self.theta.size*(self.ell_max+1), status)
+            check(status, cosmo)
+            self._pl = pl
+        return self._pl
+
+    def __call__(self, cosmo, *, ell, C_ell):
+        """Compute the correlation functions.
+
+        Args:
+            cosmo (:class:`~pyccl.cosmology.Cosmology`): A Cosmology object.
+            ell (array): Multipoles corresponding to the input angular power
+                spectra.
+            C_ell (array): Input angular power spectra. The last dimension
+                must correspond to ``ell``.
+
+        Returns:
+            (array): Correlation functions with shape
+            ``C_ell.shape[:-1] + theta.shape``.
+        """
+        ell = np.asarray(ell, dtype=float)
+        C_ell = np.asarray(C_ell, dtype=float)
+        if C_ell.shape[-1:] != ell.shape:
+            raise ValueError("The last dimension of `C_ell` must match `ell`.")
+
+        pl = self._get_matrix(cosmo)
+        shape = C_ell.shape[:-1]
+        n_cl = int(np.prod(shape))
+        status = 0
+        wth, status = lib.correlation_legendre_multi_vec(
+            cosmo.cosmo, ell, C_ell.flatten(), n_cl, pl,
+            self.theta.size, self.ell_max, n_cl*self.theta.size, status)
+        check(status, cosmo)
+        return wth.reshape(shape + self.theta.shape)
+
+
 def correlation_3d(cosmo, *, r, a, p_of_k_a=DEFAULT_POWER_SPECTRUM):
     r"""Compute the 3D correlation function:
 
@@ -4,6 +4,7 @@ import numpy as np
 
 from .. import Pk2D
 from . import EmulatorPk
+from .baccoemu_utils import _get_emupars
 
 
 class BaccoemuLinear(EmulatorPk):
@@ -35,85 +36,48 @@ k_min,k_max = ({}, {}),
 a_min,a_max = ({}, {})""".format(
             self.k_min, self.k_max, self.a_min, self.a_max)
 
-    def _sigma8tot_2_sigma8cold(self, emupars, sigma8tot):
-        """Use baccoemu to convert sigma8 total matter to sigma8 cdm+baryons
-        """
-        if hasattr(emupars['omega_cold'], '__len__'):
-            _emupars = {}
-            for pname in emupars:
-                _emupars[pname] = emupars[pname][0]
-        else:
-            _emupars = emupars
-        A_s_fid = 2.1e-9
-        sigma8tot_fid = self.mpk.get_sigma8(cold=False, A_s=A_s_fid,
-                                            **_emupars)
-        A_s = (sigma8tot / sigma8tot_fid)**2 * A_s_fid
-        return self.mpk.get_sigma8(cold=True, A_s=A_s, **_emupars)
-
     def _get_pk_at_a(self, cosmo, a):
-        # First create the dictionary passed to baccoemu
-        # if a is an array, make sure all the other parameters passed to the
-        # emulator have the same len
-        if hasattr(a, '__len__'):
-            emupars = dict(
-                omega_cold=np.full((len(a)),
-                                   cosmo['Omega_c'] + cosmo['Omega_b']),
-                omega_baryon=np.full((len(a)), cosmo['Omega_b']),
-                ns=np.full((len(a)), cosmo['n_s']),
-                hubble=np.full((len(a)), cosmo['h']),
-                neutrino_mass=np.full((len(a)), np.sum(cosmo['m_nu'])),
-                w0=np.full((len(a)), cosmo['w0']),
-                wa=np.full((len(a)), cosmo['wa']),
-                expfactor=a
-            )
-        else:
-            emupars = dict(
-                omega_cold=cosmo['Omega_c'] + cosmo['Omega_b'],
-                omega_baryon=cosmo['Omega_b'],
-                ns=cosmo['n_s'],
-                hubble=cosmo['h'],
-                neutrino_mass=np.sum(cosmo['m_nu']),
-                w0=cosmo['w0'],
-                wa=cosmo['wa'],
-                expfactor=a
-            )
-
-        # if cosmo contains sigma8, we use it for baccoemu, otherwise we pass
-        # A_s to the emulator
-        if np.isnan(cosmo['A_s']):
-            sigma8tot = cosmo['sigma8']
-            sigma8cold = self._sigma8tot_2_sigma8cold(emupars, sigma8tot)
-            if hasattr(a, '__len__'):
-                emupars['sigma8_cold'] = np.full((len(a)), sigma8cold)
-            else:
-                emupars['sigma8_cold'] = sigma8cold
-        else:
-            if hasattr(a, '__len__'):
-                emupars['A_s'] = np.full((len(a)), cosmo['A_s'])
-            else:
-                emupars['A_s'] = cosmo['A_s']
+        k, pk = self._get_pk_at_a_batch([cosmo], a)
+        return k[0], pk[0] if np.ndim(a) == 1 else pk[0, 0]
 
-        h = cosmo['h']
+    def _get_pk_at_a_batch(self, cosmos, a):
+        # Evaluate the emulator for all cosmologies and scale factors in a
+        # single call.
+        a_use = np.atleast_1d(a)
+        emupars = _get_emupars(self.mpk, cosmos, a_use)
         k_hubble, pk_hubble = self.mpk.get_linear_pk(cold=False, **emupars)
-        return k_hubble * h, pk_hubble / h**3
+        h = np.array([cosmo['h'] for cosmo in cosmos])
+        pk = np.reshape(pk_hubble, [len(cosmos), a_use.size, -1])
+        return k_hubble * h[:, None], pk / h[:, None, None]**3
 
     def _get_pk2d(self, cosmo):
-        a = cosmo.get_pk_spline_a()
+        return self._get_pk2d_batch([cosmo])[0]
+
+    def _get_pk2d_batch(self, cosmos):
+        a = cosmos[0].get_pk_spline_a()
+        if not all(np.array_equal(cosmo.get_pk_spline_a(), a)
+                   for cosmo in cosmos[1:]):
+            raise ValueError("All cosmologies must use the same scale "
+                             "factor sampling for the power spectrum.")
         a_for_baccoemu = a[a >= self.a_min]
         a_extrapolated = a[a < self.a_min]
         # we directly use the emulator for the expansion factors within its
         # range
-        k, pk = self.get_pk_at_a(cosmo, a_for_baccoemu)
-        # for the expansion factors requested by ccl but outside the emulator
-        # range, we extrapolate from the earliest pk available with linear
-        # growth factors.
-        # NOTE: ccl computes scale independent growth factors, this is not
-        # correct with massive neutrinos
-        growth_factors = cosmo.growth_factor(a_extrapolated)
-        ref_growth_factor = cosmo.growth_factor(a_for_baccoemu[0])
-        pk_extrapolated = (np.repeat([pk[0]], [len(a_extrapolated)], axis=0).T
-                           * (growth_factors / ref_growth_factor)**2).T
-        # now we combine the extrapolated and direct spectra
-        pk_final = np.concatenate([pk_extrapolated, pk])
-        return Pk2D(a_arr=a, lk_arr=np.log(k), pk_arr=np.log(pk_final),
-                    is_logp=True, extrap_order_lok=1, extrap_order_hik=2)
+        ks, pks = self._get_pk_at_a_batch(cosmos, a_for_baccoemu)
+        pk2ds = []
+        for cosmo, k, pk in zip(cosmos, ks, pks):
+            # for the expansion factors requested by ccl but outside the
+            # emulator range, we extrapolate from the earliest pk available
+            # with linear growth factors.
+            # NOTE: ccl computes scale independent growth factors, this is
+            # not correct with massive neutrinos
+            growth_factors = cosmo.growth_factor(a_extrapolated)
+            ref_growth_factor = cosmo.growth_factor(a_for_baccoemu[0])
+            growth_ratios = growth_factors / ref_growth_factor
+            pk_extrapolated = pk[0][None, :] * growth_ratios[:, None]**2
+            # now we combine the extrapolated and direct spectra
+            pk_final = np.concatenate([pk_extrapolated, pk])
+            pk2ds.append(Pk2D(a_arr=a, lk_arr=np.log(k),
+                              pk_arr=np.log(pk_final), is_logp=True,
+                              extrap_order_lok=1, extrap_order_hik=2))
+        return pk2ds
@@ -4,6 +4,7 @@ import numpy as np
 
 from .. import Pk2D
 from . import EmulatorPk
+from .baccoemu_utils import _get_emupars
 
 
 class BaccoemuNonlinear(EmulatorPk):
@@ -52,70 +53,26 @@ k_min,k_max = ({}, {}),
 a_min,a_max = ({}, {})""".format(
             self.k_min, self.k_max, self.a_min, self.a_max)
 
-    def _sigma8tot_2_sigma8cold(self, emupars, sigma8tot):
-        """Use baccoemu to convert sigma8 total matter to sigma8 cdm+baryons
-        """
-        if hasattr(emupars['omega_cold'], '__len__'):
-            _emupars = {}
-            for pname in emupars:
-                _emupars[pname] = emupars[pname][0]
-        else:
-            _emupars = emupars
-        A_s_fid = 2.1e-9
-        sigma8tot_fid = self.mpk.get_sigma8(cold=False, A_s=A_s_fid,
-                                            **_emupars)
-        A_s = (sigma8tot / sigma8tot_fid)**2 * A_s_fid
-        return self.mpk.get_sigma8(cold=True, A_s=A_s, **_emupars)
-
     def _get_pk_at_a(self, cosmo, a):
-        # First create the dictionary passed to baccoemu
-        # if a is an array, make sure all the other parameters passed to the
-        # emulator have the same len
-        if hasattr(a, '__len__'):
-            emupars = dict(
-                omega_cold=np.full((len(a)),
-                                   cosmo['Omega_c'] + cosmo['Omega_b']),
-                omega_baryon=np.full((len(a)), cosmo['Omega_b']),
-                ns=np.full((len(a)), cosmo['n_s']),
-                hubble=np.full((len(a)), cosmo['h']),
-                neutrino_mass=np.full((len(a)), np.sum(cosmo['m_nu'])),
-                w0=np.full((len(a)), cosmo['w0']),
-                wa=np.full((len(a)), cosmo['wa']),
-                expfactor=a
-            )
-        else:
-            emupars = dict(
-                omega_cold=cosmo['Omega_c'] + cosmo['Omega_b'],
-                omega_baryon=cosmo['Omega_b'],
-                ns=cosmo['n_s'],
-                hubble=cosmo['h'],
-                neutrino_mass=np.sum(cosmo['m_nu']),
-                w0=cosmo['w0'],
-                wa=cosmo['wa'],
-                expfactor=a
-            )
-
-        # if cosmo contains sigma8, we use it for baccoemu, otherwise we pass
-        # A_s to the emulator
-        if np.isnan(cosmo['A_s']):
-            sigma8tot = cosmo['sigma8']
-            sigma8cold = self._sigma8tot_2_sigma8cold(emupars, sigma8tot)
-            if hasattr(a, '__len__'):
-                emupars['sigma8_cold'] = np.full((len(a)), sigma8cold)
-            else:
-                emupars['sigma8_cold'] = sigma8cold
-        else:
-            if hasattr(a, '__len__'):
-                emupars['A_s'] = np.full((len(a)), cosmo['A_s'])
-            else:
-                emupars['A_s'] = cosmo['A_s']
+        k, pk = self._get_pk_at_a_batch([cosmo], a)
+        return k[0], pk[0] if np.ndim(a) == 1 else pk[0, 0]
 
-        h = cosmo['h']
+    def _get_pk_at_a_batch(self, cosmos, a):
+        # Evaluate the emulator for all cosmologies and scale factors in a
+        # single call.
+        a_use = np.atleast_1d(a)
+        emupars = _get_emupars(self.mpk, cosmos, a_use)
         k_hubble, pk_hubble = self.mpk.get_nonlinear_pk(cold=False, **emupars)
-        return k_hubble * h, pk_hubble / h**3
+        h = np.array([cosmo['h'] for cosmo in cosmos])
+        pk = np.reshape(pk_hubble, [len(cosmos), a_use.size, -1])
+        return k_hubble * h[:, None], pk / h[:, None, None]**3
 
     def _get_pk2d(self, cosmo):
+        return self._get_pk2d_batch([cosmo])[0]
+
+    def _get_pk2d_batch(self, cosmos):
         a = np.linspace(self.a_min, 1, self.n_sampling_a)
-        k, pk = self.get_pk_at_a(cosmo, a)
-        return Pk2D(a_arr=a, lk_arr=np.log(k), pk_arr=np.log(pk), is_logp=True,
-                    extrap_order_lok=1, extrap_order_hik=2)
+        ks, pks = self._get_pk_at_a_batch(cosmos, a)
+        return [Pk2D(a_arr=a, lk_arr=np.log(k), pk_arr=np.log(pk),
+                     is_logp=True, extrap_order_lok=1, extrap_order_hik=2)
+                for k, pk in zip(ks, pks)]
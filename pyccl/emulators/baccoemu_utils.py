@@ -0,0 +1,98 @@
+"""Helpers shared by the baccoemu power spectrum and baryon emulators.
+
+baccoemu evaluates its neural networks for arrays of parameter points in a
+single forward pass. The functions below stack the parameters of several
+cosmologies (and scale factors) into such arrays.
+"""
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+
+import numpy as np
+
+
+# Cosmological parameters of the baccoemu emulators (besides the amplitude).
+_COSMO_PARAMS = ("omega_cold", "omega_baryon", "ns", "hubble",
+                 "neutrino_mass", "w0", "wa")
+
+# Amplitude used to convert between sigma8 and A_s.
+_A_S_FID = 2.1e-9
+
+# sigma8 of the total and cold matter power spectra at `_A_S_FID`, for
+# recently used sets of cosmological parameters, stored separately for each
+# emulator object.
+_sigma8_fid_cache = WeakKeyDictionary()
+_n_sigma8_fid_cache = 64
+
+
+def _get_cosmo_params(cosmo):
+    """Return the baccoemu parameters of a cosmology, except for the
+    amplitude of fluctuations."""
+    return dict(omega_cold=cosmo['Omega_c'] + cosmo['Omega_b'],
+                omega_baryon=cosmo['Omega_b'],
+                ns=cosmo['n_s'],
+                hubble=cosmo['h'],
+                neutrino_mass=np.sum(cosmo['m_nu']),
+                w0=cosmo['w0'],
+                wa=cosmo['wa'])
+
+
+def _get_sigma8_fid(mpk, pars):
+    """Return the total and cold-matter sigma8 for the parameters ``pars``
+    and ``A_s = _A_S_FID``. Results are cached, so each set of parameters
+    needs to be run through each emulator only once."""
+    cache = _sigma8_fid_cache.setdefault(mpk, OrderedDict())
+    key = tuple(float(pars[p]) for p in _COSMO_PARAMS)
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+
+    pars = {p: pars[p] for p in _COSMO_PARAMS}
+    s8 = (mpk.get_sigma8(cold=False, A_s=_A_S_FID, expfactor=1., **pars),
+          mpk.get_sigma8(cold=True, A_s=_A_S_FID, expfactor=1., **pars))
+    while len(cache) >= _n_sigma8_fid_cache:
+        cache.popitem(last=False)
+    cache[key] = s8
+    return s8
+
+
+def _sigma8tot_2_sigma8cold(mpk, pars, sigma8tot):
+    """Use baccoemu to convert sigma8 total matter to sigma8 cdm+baryons.
+    Both are proportional to :math:`\\sqrt{A_s}`, so only their ratio is
+    needed."""
+    sigma8tot_fid, sigma8cold_fid = _get_sigma8_fid(mpk, pars)
+    return sigma8cold_fid * sigma8tot / sigma8tot_fid
+
+
+def _get_emupars(mpk, cosmos, a):
+    """Build the dictionary of baccoemu parameters needed to evaluate the
+    emulators for a list of cosmologies at scale factors ``a``, in a single
+    call. Each entry is an array of size ``len(cosmos) * len(a)``, with the
+    scale factor varying fastest.
+
+    The amplitude is passed to the emulator as ``A_s`` if all the
+    cosmologies are specified with it. Otherwise, it is passed as the
+    cold-matter ``sigma8`` (converted from the total-matter ``sigma8`` or
+    from ``A_s``).
+    """
+    a = np.atleast_1d(a).astype(float)
+    rows = [_get_cosmo_params(cosmo) for cosmo in cosmos]
+    if all(np.isfinite(cosmo['A_s']) for cosmo in cosmos):
+        for pars, cosmo in zip(rows, cosmos):
+            pars['A_s'] = cosmo['A_s']
+    else:
+        # note that ccl parametrises sigma8 of the total matter power
+        # spectrum while baccoemu defines it in terms of the cdm+baryons
+        # power spectrum; so we have to convert from total to cold sigma8
+        for pars, cosmo in zip(rows, cosmos):
+            if np.isnan(cosmo['A_s']):
+                sigma8cold = _sigma8tot_2_sigma8cold(
+                    mpk, pars, cosmo['sigma8'])
+            else:
+                sigma8cold = _get_sigma8_fid(mpk, pars)[1] * np.sqrt(
+                    cosmo['A_s'] / _A_S_FID)
+            pars['sigma8_cold'] = sigma8cold
+
+    emupars = {p: np.repeat([pars[p] for pars in rows], a.size)
+               for p in rows[0]}
+    emupars['expfactor'] = np.tile(a, len(cosmos))
+    return emupars
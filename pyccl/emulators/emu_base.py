@@ -2,6 +2,8 @@ __all__ = ('EmulatorPk', )
 
 from abc import abstractmethod
 
+import numpy as np
+
 
 class EmulatorPk(object):
 
@@ -33,6 +35,27 @@ class EmulatorPk(object):
         """
         return self._get_pk_at_a(cosmo, a)
 
+    def _get_pk_at_a_batch(self, cosmos, a):
+        # Emulators able to evaluate several cosmologies in a single call
+        # should override this.
+        k, pk = zip(*[self._get_pk_at_a(cosmo, a) for cosmo in cosmos])
+        return np.array(k), np.array(pk)
+
+    def get_pk_at_a_batch(self, cosmos, a):
+        """Get k vectors and uninterpolated power spectra at given a for
+        several cosmologies.
+
+        Args:
+            cosmos (:obj:`list`): list of
+                :class:`~pyccl.cosmology.Cosmology` objects.
+            a (:obj:`float` or `array`):
+                Scale factor.
+
+        Returns:
+            :tuple: k and pk arrays, with the cosmology as the first axis.
+        """
+        return self._get_pk_at_a_batch(list(cosmos), a)
+
     @abstractmethod
     def _get_pk2d(self, cosmo):
         """Get a 2D interpolator for the power of k and a.
@@ -56,3 +79,21 @@ class EmulatorPk(object):
             :obj:`~pyccl.pk2d.Pk2D` object.
         """
         return self._get_pk2d(cosmo)
+
+    def _get_pk2d_batch(self, cosmos):
+        # Emulators able to evaluate several cosmologies in a single call
+        # should override this.
+        return [self._get_pk2d(cosmo) for cosmo in cosmos]
+
+    def get_pk2d_batch(self, cosmos):
+        """Get 2D interpolators for the power of k and a for several
+        cosmologies.
+
+        Args:
+            cosmos (:obj:`list`): list of
+                :class:`~pyccl.cosmology.Cosmology` objects.
+
+        Returns:
+            :obj:`list` of :obj:`~pyccl.pk2d.Pk2D` objects.
+        """
+        return self._get_pk2d_batch(list(cosmos))
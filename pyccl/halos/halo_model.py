@@ -1,10 +1,14 @@
 __all__ = ("HMCalculator",)
 
+import functools
+from collections import OrderedDict
+from contextlib import contextmanager
+
 import numpy as np
 
-from .. import CCLAutoRepr, unlock_instance
+from .. import CCLAutoRepr, UnlockInstance, unlock_instance
 from .. import physical_constants as const
-from . import MassDef
+from . import MassDef, Profile2pt
 from ..pyutils import _spline_integrate
 
 
@@ -34,10 +38,25 @@ class HMCalculator(CCLAutoRepr):
             to be used in the mass integrals.
         integration_method_M (:obj:`str`): integration method to use
             in the mass integrals. Options: "simpson" and "spline".
+
+    .. note::
+
+        Within a single call to one of the ``halomod_*`` functions, the
+        mass function, halo bias, profile normalizations and Fourier-space
+        profiles evaluated on the calculator's mass grid are memoized in a
+        workspace, indexed by scale factor. This way, predictions involving
+        several profiles compute each ingredient only once. The workspace is
+        cleared when the call returns, so changes to the profiles between
+        calls are always taken into account. Outside of these functions,
+        only the mass function and halo bias at the last cosmology and scale
+        factor are kept, which can be released with :meth:`clear_workspace`.
     """ # noqa
     __repr_attrs__ = __eq_attrs__ = (
         "mass_function", "halo_bias", "mass_def", "precision",)
 
+    # Maximum number of normalizations and Fourier-space profiles memoized.
+    _ws_max_arrays = 256
+
     def __init__(self, *, mass_function, halo_bias, mass_def=None,
                  log10M_min=8., log10M_max=16., nM=128,
                  integration_method_M='simpson'):
@@ -64,13 +83,20 @@ class HMCalculator(CCLAutoRepr):
         else:
             raise ValueError("Invalid integration method.")
 
-        # Cache last results for mass function and halo bias.
-        self._cosmo_mf = self._cosmo_bf = None
-        self._a_mf = self._a_bf = -1
+        # Workspace of halo model ingredients for the last cosmology.
+        self._ws_cosmo = None
+        self._ws = {}
+        self._ws_arrays = OrderedDict()
+        self._ws_depth = 0
 
     def _integ_spline(self, fM, log10M):
-        # Spline integrator
-        return _spline_integrate(log10M, fM, log10M[0], log10M[-1])
+        # Spline integrator (over the last axis)
+        fM = np.asarray(fM)
+        if fM.ndim <= 2:
+            return _spline_integrate(log10M, fM, log10M[0], log10M[-1])
+        out = _spline_integrate(log10M, fM.reshape([-1, fM.shape[-1]]),
+                                log10M[0], log10M[-1])
+        return out.reshape(fM.shape[:-1])
 
     def _check_mass_def(self, *others):
         # Verify that internal & external mass definitions are consistent.
@@ -78,29 +104,119 @@ class HMCalculator(CCLAutoRepr):
             raise ValueError("Inconsistent mass definitions.")
 
     @unlock_instance(mutate=False)
-    def _get_mass_function(self, cosmo, a, rho0):
-        # Compute the mass function at this cosmo and a.
-        if a != self._a_mf or cosmo != self._cosmo_mf:
-            self._mf = self.mass_function(cosmo, self._mass, a)
-            integ = self._integrator(self._mf*self._mass, self._lmass)
-            self._mf0 = (rho0 - integ) / self._m0
-            self._cosmo_mf, self._a_mf = cosmo, a  # cache
+    def clear_workspace(self):
+        """Release all the halo model ingredients memoized by this
+        calculator.
+        """
+        self._ws_cosmo = None
+        self._ws = {}
+        self._ws_arrays = OrderedDict()
+
+    @contextmanager
+    def _workspace(self):
+        # Memoize halo model ingredients until the outermost context exits.
+        # Ingredients computed before entering it are discarded as well.
+        if self._ws_depth == 0:
+            self.clear_workspace()
+        with UnlockInstance(self, mutate=False):
+            self._ws_depth += 1
+        try:
+            yield
+        finally:
+            with UnlockInstance(self, mutate=False):
+                self._ws_depth -= 1
+            if self._ws_depth == 0:
+                self.clear_workspace()
 
     @unlock_instance(mutate=False)
-    def _get_halo_bias(self, cosmo, a, rho0):
-        # Compute the halo bias at this cosmo and a.
-        if a != self._a_bf or cosmo != self._cosmo_bf:
-            self._bf = self.halo_bias(cosmo, self._mass, a)
-            integ = self._integrator(self._mf*self._bf*self._mass, self._lmass)
-            self._mbf0 = (rho0 - integ) / self._m0
-            self._cosmo_bf, self._a_bf = cosmo, a  # cache
+    def _get_workspace(self, cosmo, a):
+        # Workspace entry for this cosmo and a. The workspace is reset if
+        # the cosmology has changed or, outside of `_workspace`, if the
+        # scale factor has changed.
+        same_cosmo = cosmo is self._ws_cosmo or cosmo == self._ws_cosmo
+        if not same_cosmo or (self._ws_depth == 0 and a not in self._ws):
+            self.clear_workspace()
+            self._ws_cosmo = cosmo
+        return self._ws.setdefault(a, {})
+
+    def _memoize(self, cosmo, a, key, func, *objs):
+        # Return `func()`, memoized in the workspace for this cosmo and a
+        # under `key` and `objs`. Only done within `_workspace`, during
+        # which the objects are not expected to change.
+        if self._ws_depth == 0:
+            return func()
+        self._get_workspace(cosmo, a)
+        key = (a,) + key + tuple(id(obj) for obj in objs)
+        if key in self._ws_arrays:
+            self._ws_arrays.move_to_end(key)
+            return self._ws_arrays[key][0]
+        out = func()
+        if isinstance(out, np.ndarray):
+            out.flags.writeable = False
+        # Keep a reference to `objs`, so that their ids can't be reused by
+        # other objects while the entry is stored.
+        self._ws_arrays[key] = (out, objs)
+        while len(self._ws_arrays) > self._ws_max_arrays:
+            self._ws_arrays.popitem(last=False)
+        return out
 
+    @unlock_instance(mutate=False)
     def _get_ingredients(self, cosmo, a, *, get_bf):
         """Compute mass function and halo bias at some scale factor."""
+        ws = self._get_workspace(cosmo, a)
         rho0 = const.RHO_CRITICAL * cosmo["Omega_m"] * cosmo["h"]**2
-        self._get_mass_function(cosmo, a, rho0)
+        if "mf" not in ws:
+            mf = self.mass_function(cosmo, self._mass, a)
+            integ = self._integrator(mf*self._mass, self._lmass)
+            ws["mf"], ws["mf0"] = mf, (rho0 - integ) / self._m0
+        self._mf, self._mf0 = ws["mf"], ws["mf0"]
         if get_bf:
-            self._get_halo_bias(cosmo, a, rho0)
+            if "bf" not in ws:
+                bf = self.halo_bias(cosmo, self._mass, a)
+                integ = self._integrator(self._mf*bf*self._mass, self._lmass)
+                ws["bf"], ws["mbf0"] = bf, (rho0 - integ) / self._m0
+            self._bf, self._mbf0 = ws["bf"], ws["mbf0"]
+
+    def _fourier(self, cosmo, k, a, prof):
+        # Fourier-space profile on the mass grid, with shape (N_k, N_M).
+        k_use = np.asarray(k, dtype=float)
+        return self._memoize(
+            cosmo, a, ("fourier", k_use.shape, k_use.tobytes()),
+            lambda: prof.fourier(cosmo, k_use, self._mass, a).T, prof)
+
+    def _fourier_2pt(self, cosmo, k, a, prof, prof2, prof_2pt):
+        # Two-point moment of two profiles on the mass grid, with shape
+        # (N_k, N_M).
+        k_use = np.asarray(k, dtype=float)
+        if type(prof_2pt) is Profile2pt:
+            # Product of the individual (memoized) Fourier profiles.
+            uk1 = self._fourier(cosmo, k_use, a, prof)
+            uk2 = uk1 if prof2 == prof else self._fourier(
+                cosmo, k_use, a, prof2)
+            return uk1 * uk2 * (1 + prof_2pt.r_corr)
+        return self._memoize(
+            cosmo, a, ("fourier_2pt", k_use.shape, k_use.tobytes()),
+            lambda: prof_2pt.fourier_2pt(
+                cosmo, k_use, self._mass, a, prof, prof2=prof2).T,
+            prof_2pt, prof, prof2)
+
+    def get_normalization(self, cosmo, a, prof):
+        """ Returns the normalization of a halo profile (see
+        :meth:`~pyccl.halos.profiles.profile_base.HaloProfile.get_normalization`),
+        memoized in this calculator's workspace.
+
+        Args:
+            cosmo (:class:`~pyccl.cosmology.Cosmology`): a Cosmology object.
+            a (:obj:`float`): scale factor.
+            prof (:class:`~pyccl.halos.profiles.profile_base.HaloProfile`):
+                halo profile.
+
+        Returns:
+            :obj:`float`: normalization factor of the profile.
+        """ # noqa
+        return self._memoize(
+            cosmo, a, ("norm",),
+            lambda: prof.get_normalization(cosmo, a, hmc=self), prof)
 
     def _integrate_over_mf(self, array_2):
         #  ∫ dM n(M) f(M)
@@ -154,8 +270,12 @@ class HMCalculator(CCLAutoRepr):
             selection (:obj:`callable`): function of mass and scale factor
                 that returns the selection function. This function
                 should take in floats or arrays with a signature ``sel(m, a)``
-                and return an array with shape ``(len(m), len(a))`` according
-                to the numpy broadcasting rules.
+                and return an array with shape ``(len(m), len(a))``,
+                ``(len(m), 1)`` or ``(1, len(a))``. It is called once, with the
+                full arrays of masses and scale factors. Several selection
+                functions (e.g. for different richness or redshift bins) may
+                be computed at once by returning an array with shape
+                ``(..., len(m), len(a))``.
             a_min (:obj:`float`): the minimum scale factor at which to start integrals
                 over the selection function.
                 Default: value of ``cosmo.cosmo.spline_params.A_SPLINE_MIN``
@@ -165,7 +285,9 @@ class HMCalculator(CCLAutoRepr):
                 the integrals.
 
         Returns:
-            :obj:`float`: the total number of clusters/halos.
+            :obj:`float` or `array`: the total number of clusters/halos. If
+            ``selection`` returns several selection functions, the output has
+            shape ``sel.shape[:-2]``.
         """ # noqa
         # get a values for integral
         if a_min is None:
@@ -180,17 +302,24 @@ class HMCalculator(CCLAutoRepr):
         dvdz = dh * dc**2 / ez
         dvda = dvdz * abs_dzda
 
-        # now do m intergrals in a loop
-        mint = np.zeros_like(a)
-        for i, _a in enumerate(a):
-            self._get_ingredients(cosmo, _a, get_bf=False)
-            _selm = np.atleast_2d(selection(self._mass, _a)).T
-            mint[i] = self._integrator(
-                dvda[i] * self._mf[..., :] * _selm[..., :],
-                self._lmass
-            )
-
-        # now do scale factor integral
+        # mass function on the (a, M) grid, and selection function(s)
+        # with shape (..., na, nM)
+        mf = self.mass_function(cosmo, self._mass, a)
+        nM = len(self._mass)
+        sel = np.asarray(selection(self._mass, a), dtype=float)
+        # Only allow broadcasting along whole axes, so that e.g. a mass-only
+        # selection with shape (nM,) is not silently taken as a function
+        # of scale factor.
+        if sel.ndim < 2 or sel.shape[-2:] not in [(nM, na), (nM, 1), (1, na)]:
+            raise ValueError(
+                f"The selection function returned an array with shape "
+                f"{sel.shape}, but its last two dimensions must be "
+                f"(len(m), len(a)) = {(nM, na)}, (len(m), 1) or (1, len(a)).")
+        sel = np.swapaxes(np.broadcast_to(sel, sel.shape[:-2] + (nM, na)),
+                          -1, -2)
+
+        # now do the m integrals, and then the scale factor integral
+        mint = self._integrator(dvda[:, None] * mf * sel, self._lmass)
         return self._integrator(mint, a)
 
     def I_0_1(self, cosmo, k, a, prof):
@@ -216,7 +345,7 @@ class HMCalculator(CCLAutoRepr):
         """
         self._check_mass_def(prof)
         self._get_ingredients(cosmo, a, get_bf=False)
-        uk = prof.fourier(cosmo, k, self._mass, a).T
+        uk = self._fourier(cosmo, k, a, prof)
         return self._integrate_over_mf(uk)
 
     def I_1_1(self, cosmo, k, a, prof):
@@ -244,7 +373,7 @@ class HMCalculator(CCLAutoRepr):
         """
         self._check_mass_def(prof)
         self._get_ingredients(cosmo, a, get_bf=True)
-        uk = prof.fourier(cosmo, k, self._mass, a).T
+        uk = self._fourier(cosmo, k, a, prof)
         return self._integrate_over_mbf(uk)
 
     def I_0_2(self, cosmo, k, a, prof, *, prof2=None, prof_2pt):
@@ -281,7 +410,7 @@ class HMCalculator(CCLAutoRepr):
 
         self._check_mass_def(prof, prof2)
         self._get_ingredients(cosmo, a, get_bf=False)
-        uk = prof_2pt.fourier_2pt(cosmo, k, self._mass, a, prof, prof2=prof2).T
+        uk = self._fourier_2pt(cosmo, k, a, prof, prof2, prof_2pt)
         return self._integrate_over_mf(uk)
 
     def I_1_2(self, cosmo, k, a, prof, *, prof2=None, prof_2pt):
@@ -319,7 +448,7 @@ class HMCalculator(CCLAutoRepr):
 
         self._check_mass_def(prof, prof2)
         self._get_ingredients(cosmo, a, get_bf=True)
-        uk = prof_2pt.fourier_2pt(cosmo, k, self._mass, a, prof, prof2=prof2).T
+        uk = self._fourier_2pt(cosmo, k, a, prof, prof2, prof_2pt)
         return self._integrate_over_mbf(uk)
 
     def I_0_22(self, cosmo, k, a, prof, *,
@@ -374,14 +503,24 @@ class HMCalculator(CCLAutoRepr):
 
         self._check_mass_def(prof, prof2, prof3, prof4)
         self._get_ingredients(cosmo, a, get_bf=False)
-        uk12 = prof12_2pt.fourier_2pt(
-            cosmo, k, self._mass, a, prof, prof2=prof2).T
+        uk12 = self._fourier_2pt(cosmo, k, a, prof, prof2, prof12_2pt)
 
         if (prof, prof2, prof12_2pt) == (prof3, prof4, prof34_2pt):
             # 4pt approximation of the same profile
             uk34 = uk12
         else:
-            uk34 = prof34_2pt.fourier_2pt(
-                cosmo, k, self._mass, a, prof3, prof2=prof4).T
+            uk34 = self._fourier_2pt(cosmo, k, a, prof3, prof4, prof34_2pt)
 
         return self._integrate_over_mf(uk12[None, :, :] * uk34[:, None, :])
+
+
+def _use_workspace(func):
+    """Decorator for halo model functions with signature
+    ``func(cosmo, hmc, ...)``, which memoizes the halo model ingredients
+    in the workspace of ``hmc`` for the duration of the call.
+    """
+    @functools.wraps(func)
+    def wrapper(cosmo, hmc, *args, **kwargs):
+        with hmc._workspace():
+            return func(cosmo, hmc, *args, **kwargs)
+    return wrapper
@@ -110,9 +110,15 @@ class HMIngredients(CCLAutoRepr, CCLNamedClass):
                     f"{msg}. To relax this check set `mass_def_strict=False`.")
 
     def _get_logM_sigM(self, cosmo, M, a, *, return_dlns=False):
-        """Compute ``logM``, ``sigM``, and (optionally) ``dlns_dlogM``."""
+        """Compute ``logM``, ``sigM``, and (optionally) ``dlns_dlogM``.
+        If ``a`` is an array, ``sigM`` and ``dlns_dlogM`` have shape
+        ``(N_M, N_a)``.
+        """
         cosmo.compute_sigma()  # initialize sigma(M) splines if needed
         logM = np.log10(M)
+        if np.ndim(a) > 0:
+            return self._get_logM_sigM_2d(cosmo, logM, a,
+                                          return_dlns=return_dlns)
 
         # sigma(M)
         status = 0
@@ -127,6 +133,25 @@ class HMIngredients(CCLAutoRepr, CCLNamedClass):
         check(status, cosmo=cosmo)
         return logM, sigM, dlns_dlogM
 
+    def _get_logM_sigM_2d(self, cosmo, logM, a, *, return_dlns=False):
+        # sigma(M) and dlogsigma(M)/dlog10(M) on the (M, a) grid
+        # in a single call.
+        a_use = np.atleast_1d(a).astype(float)
+        shape = (a_use.size, logM.size)
+        status = 0
+        if not return_dlns:
+            sigM, status = lib.sigM_2d_vec(cosmo.cosmo, a_use, logM,
+                                           a_use.size * logM.size, status)
+            check(status, cosmo=cosmo)
+            return logM, sigM.reshape(shape).T
+
+        out, status = lib.sigM_dlnsigM_2d_vec(cosmo.cosmo, a_use, logM,
+                                              2 * a_use.size * logM.size,
+                                              status)
+        check(status, cosmo=cosmo)
+        sigM, dlns_dlogM = out.reshape((2,) + shape).transpose(0, 2, 1)
+        return logM, sigM, dlns_dlogM
+
 
 class MassFunc(HMIngredients):
     """This class enables the calculation of halo mass functions.
@@ -167,7 +192,8 @@ class MassFunc(HMIngredients):
             cosmo (:class:`~pyccl.cosmology.Cosmology`): A Cosmology object.
             sigM (:obj:`float` or `array`): standard deviation in the
                 overdensity field on the scale of this halo.
-            a (:obj:`float`): scale factor.
+            a (:obj:`float` or `array`): scale factor. If an array, it
+                broadcasts against the last dimension of ``sigM``.
             lnM (:obj:`float` or `array`): natural logarithm of the
                 halo mass in units of M_sun (provided in addition
                 to sigM for convenience in some mass function
@@ -183,21 +209,28 @@ class MassFunc(HMIngredients):
         Args:
             cosmo (:class:`~pyccl.cosmology.Cosmology`): A Cosmology object.
             M (:obj:`float` or `array`): halo mass.
-            a (:obj:`float`): scale factor.
+            a (:obj:`float` or `array`): scale factor.
 
         Returns:
             (:obj:`float` or `array`): mass function \
                 :math:`dn/d\\log_{10}M` in units of Mpc^-3 (comoving).
+                If ``a`` is an array, the output has shape
+                ``(N_a, N_M)``, with any scalar dimensions squeezed out.
         """
         M_use = np.atleast_1d(M)
         logM, sigM, dlns_dlogM = self._get_logM_sigM(
             cosmo, M_use, a, return_dlns=True)
+        lnM = 2.302585092994046 * logM
+        if np.ndim(a) > 0:
+            # Scale factors run along the last dimension.
+            a = np.atleast_1d(a).astype(float)
+            M_use, lnM = M_use[:, None], lnM[:, None]
 
         rho = (const.RHO_CRITICAL * cosmo['Omega_m'] * cosmo['h']**2)
-        f = self._get_fsigma(cosmo, sigM, a, 2.302585092994046 * logM)
-        mf = f * rho * dlns_dlogM / M_use
+        f = self._get_fsigma(cosmo, sigM, a, lnM)
+        mf = (f * rho * dlns_dlogM / M_use).T
         if np.ndim(M) == 0:
-            return mf[0]
+            return mf[..., 0]
         return mf
 
 
@@ -230,7 +263,8 @@ class HaloBias(HMIngredients):
             cosmo (:class:`~pyccl.cosmology.Cosmology`): A Cosmology object.
             sigM (:obj:`float` or `array`): standard deviation in the
                 overdensity field on the scale of this halo.
-            a (:obj:`float`): scale factor.
+            a (:obj:`float` or `array`): scale factor. If an array, it
+                broadcasts against the last dimension of ``sigM``.
 
         Returns:
             (:obj:`float` or `array`): f(sigma_M) function.
@@ -242,16 +276,20 @@ class HaloBias(HMIngredients):
         Args:
             cosmo (:class:`~pyccl.cosmology.Cosmology`): A Cosmology object.
             M (:obj:`float` or `array`): halo mass.
-            a (:obj:`float`): scale factor.
+            a (:obj:`float` or `array`): scale factor.
 
         Returns:
-            (:obj:`float` or `array`): halo bias.
+            (:obj:`float` or `array`): halo bias. If ``a`` is an array, the
+            output has shape ``(N_a, N_M)``, with any scalar dimensions
+            squeezed out.
         """
         M_use = np.atleast_1d(M)
         logM, sigM = self._get_logM_sigM(cosmo, M_use, a)
-        b = self._get_bsigma(cosmo, sigM, a)
+        if np.ndim(a) > 0:
+            a = np.atleast_1d(a).astype(float)
+        b = self._get_bsigma(cosmo, sigM, a).T
         if np.ndim(M) == 0:
-            return b[0]
+            return b[..., 0]
         return b
 
 
@@ -29,6 +29,9 @@ class MassFuncBocquet20(MassFunc):
         return mass_def.name != '200c'
 
     def __call__(self, cosmo, M, a):
+        if np.ndim(a) > 0:
+            return np.array([self(cosmo, M, aa) for aa in a])
+
         # Set up cosmology
         h = cosmo['h']
         om = cosmo['Omega_m']*h**2
@@ -37,21 +37,15 @@ class MassFuncWatson13(MassFunc):
         om = cosmo.omega_x(a, "matter")
         Delta_178 = self.mass_def.Delta / 178
 
-        if a == 1:
-            pA = 0.194
-            pa = 1.805
-            pb = 2.267
-            pc = 1.287
-        elif a < 1/(1+6):
-            pA = 0.563
-            pa = 3.810
-            pb = 0.874
-            pc = 1.453
-        else:
-            pA = om * (1.097 * a**3.216 + 0.074)
-            pa = om * (5.907 * a**3.058 + 2.349)
-            pb = om * (3.136 * a**3.599 + 2.344)
-            pc = 1.318
+        # z=0 and z>6 fits, and redshift-dependent fit otherwise.
+        cases = [a == 1, a < 1/(1+6)]
+        pA = np.select(cases, [0.194, 0.563],
+                       om * (1.097 * a**3.216 + 0.074))
+        pa = np.select(cases, [1.805, 3.810],
+                       om * (5.907 * a**3.058 + 2.349))
+        pb = np.select(cases, [2.267, 0.874],
+                       om * (3.136 * a**3.599 + 2.344))
+        pc = np.select(cases, [1.287, 1.453], 1.318)
 
         f_178 = pA * ((pb / sigM)**pa + 1.) * np.exp(-pc / sigM**2)
         C = np.exp(0.023 * (Delta_178 - 1.0))
@@ -1,12 +1,13 @@
 __all__ = ("mass2radius_lagrangian", "convert_concentration", "MassDef",
            "MassDef200m", "MassDef200c", "MassDef500c", "MassDefVir",
-           "MassDefFof", "mass_translator",)
+           "MassDefFof", "mass_translator", "MassTranslator",)
 
+from collections import OrderedDict
 from functools import cached_property
 
 import numpy as np
 
-from .. import CCLAutoRepr, CCLNamedClass, lib, check
+from .. import CCLAutoRepr, CCLNamedClass, hash_, lib, check
 from . import Concentration, HaloBias, MassFunc
 
 
@@ -57,19 +58,61 @@ def convert_concentration(cosmo, *, c_old, Delta_old, Delta_new):
         (:obj:`float` or `array`): concentration parameter for the new
         mass definition.
     """
-    status = 0
-    c_old_use = np.atleast_1d(c_old)
-    c_new, status = lib.convert_concentration_vec(cosmo.cosmo,
-                                                  Delta_old, c_old_use,
-                                                  Delta_new, c_old_use.size,
-                                                  status)
-    check(status, cosmo=cosmo)
+    c_old_use = np.atleast_1d(np.asarray(c_old, dtype=float))
+    d_factor = Delta_old / Delta_new
+    if d_factor == 1:
+        c_new = c_old_use.copy()
+    else:
+        # Invert f(x) through the tabulated inverse.
+        lx_min, lx_max = _NFW_LOG10X_RANGE
+        ok = (c_old_use >= 10**lx_min) & (c_old_use <= 10**lx_max)
+        lf = np.full(c_old_use.shape, np.nan)
+        lf[ok] = np.log(d_factor * _nfw_fx(c_old_use[ok]))
+        inv = _get_nfw_inverse()
+        ok &= (lf >= inv.x[0]) & (lf <= inv.x[-1])
+        c_new = np.empty_like(c_old_use)
+        c_new[ok] = np.exp(inv(lf[ok]))
+
+        # Fall back to the root finder outside the table range.
+        if not ok.all():
+            c_bad = c_old_use[~ok]
+            c_new[~ok], status = lib.convert_concentration_vec(
+                cosmo.cosmo, Delta_old, c_bad, Delta_new, c_bad.size, 0)
+            check(status, cosmo=cosmo)
 
     if np.isscalar(c_old):
         return c_new[0]
     return c_new
 
 
+# Range (in log10) and number of samples of the table used to invert the
+# NFW function f(x) in `convert_concentration`.
+_NFW_LOG10X_RANGE = (-2., 4.)
+_NFW_N_TABLE = 2048
+_nfw_inverse = None
+
+
+def _nfw_fx(x):
+    """ NFW function :math:`f(x)` relating concentrations and
+    overdensities (see :func:`convert_concentration`).
+    """
+    xp1 = 1 + x
+    return xp1 * x**3 / (xp1 * np.log1p(x) - x)
+
+
+def _get_nfw_inverse():
+    """ Return a spline of :math:`\\log x` as a function of
+    :math:`\\log f(x)`, building it the first time it is needed.
+    """
+    global _nfw_inverse
+    if _nfw_inverse is None:
+        from scipy.interpolate import CubicSpline
+        lx = np.log(np.logspace(*_NFW_LOG10X_RANGE, _NFW_N_TABLE))
+        lf = np.log(_nfw_fx(np.exp(lx)))
+        _nfw_inverse = CubicSpline(lf, lx)
+    return _nfw_inverse
+
+
 class MassDef(CCLAutoRepr, CCLNamedClass):
     """Halo mass definition. Halo masses are defined in terms of an overdensity
     parameter :math:`\\Delta` and an associated density :math:`X` (either the
@@ -335,34 +378,106 @@ def mass_translator(*, mass_in, mass_out, concentration):
             be calibrated for masses using the ``mass_in`` definition.
 
     Returns:
-        Function that ranslates between two masses. The returned function
-        ``f`` can be called as: ``f(cosmo, M, a)``, where
+        :class:`MassTranslator` that translates between two masses. The
+        returned object ``f`` can be called as: ``f(cosmo, M, a)``, where
         ``cosmo`` is a :class:`~pyccl.cosmology.Cosmology` object, ``M``
         is a mass (or array of masses), and ``a`` is a scale factor.
 
     """ # noqa
 
-    mass_in = MassDef.create_instance(mass_in)
-    mass_out = MassDef.create_instance(mass_out)
-    concentration = Concentration.create_instance(concentration,
-                                                  mass_def=mass_in)
-    if concentration.mass_def != mass_in:
-        raise ValueError("mass_def of concentration doesn't match mass_in")
+    return MassTranslator(mass_in=mass_in, mass_out=mass_out,
+                          concentration=concentration)
 
-    def translate(cosmo, M, a):
-        if mass_in == mass_out:
-            return M
 
-        c_in = concentration(cosmo, M, a)
-        Om_in = cosmo.omega_x(a, mass_in.rho_type)
-        D_in = mass_in.get_Delta(cosmo, a) * Om_in
-        R_in = mass_in.get_radius(cosmo, M, a)
+class MassTranslator:
+    """Translate between mass definitions, assuming an NFW profile.
+
+    This is the callable returned by :func:`mass_translator`. Instances
+    can be called as ``f(cosmo, M, a)`` and keep the overdensities for
+    the most recent scale factors, as well as the most recently translated
+    mass arrays, for the last cosmology they were called with. Repeated
+    translations of the same mass grid (e.g. within a halo model
+    calculation) are therefore only computed once. The stored quantities
+    are discarded whenever the cosmology, the mass definitions or the
+    parameters of the concentration change.
 
-        Om_out = cosmo.omega_x(a, mass_out.rho_type)
-        D_out = mass_out.get_Delta(cosmo, a) * Om_out
+    Args:
+        mass_in (:class:`MassDef` or :obj:`str`): mass definition of the
+            input mass.
+        mass_out (:class:`MassDef` or :obj:`str`): mass definition of the
+            output mass.
+        concentration (:class:`~pyccl.halos.halo_model_base.Concentration` or :obj:`str`):
+            concentration-mass relation to use for the mass conversion. It must
+            be calibrated for masses using the ``mass_in`` definition.
+        n_cache (:obj:`int`): maximum number of scale factors and of
+            translated mass arrays to keep.
+    """ # noqa
+
+    def __init__(self, *, mass_in, mass_out, concentration, n_cache=16):
+        self.mass_in = MassDef.create_instance(mass_in)
+        self.mass_out = MassDef.create_instance(mass_out)
+        self.concentration = Concentration.create_instance(
+            concentration, mass_def=self.mass_in)
+        if self.concentration.mass_def != self.mass_in:
+            raise ValueError("mass_def of concentration doesn't match "
+                             "mass_in")
+        self.n_cache = n_cache
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Release all the quantities stored by this translator."""
+        self._state = None
+        self._deltas = OrderedDict()
+        self._cache = OrderedDict()
+
+    def _check_state(self, cosmo):
+        # Reset the stored quantities if the cosmology, the mass definitions
+        # or the concentration have changed.
+        state = hash_((cosmo, self.mass_in, self.mass_out,
+                       vars(self.concentration)))
+        if state != self._state:
+            self.clear_cache()
+            self._state = state
+
+    def _get_deltas(self, cosmo, a):
+        # Overdensities of both definitions w.r.t. the same density.
+        if a in self._deltas:
+            self._deltas.move_to_end(a)
+        else:
+            mass_in, mass_out = self.mass_in, self.mass_out
+            D_in = (mass_in.get_Delta(cosmo, a)
+                    * cosmo.omega_x(a, mass_in.rho_type))
+            D_out = (mass_out.get_Delta(cosmo, a)
+                     * cosmo.omega_x(a, mass_out.rho_type))
+            self._deltas[a] = D_in, D_out
+            while len(self._deltas) > self.n_cache:
+                self._deltas.popitem(last=False)
+        return self._deltas[a]
+
+    def _translate(self, cosmo, M, a):
+        D_in, D_out = self._get_deltas(cosmo, a)
+        c_in = self.concentration(cosmo, M, a)
+        R_in = self.mass_in.get_radius(cosmo, M, a)
         c_out = convert_concentration(
             cosmo, c_old=c_in, Delta_old=D_in, Delta_new=D_out)
         R_out = R_in * c_out/c_in
-        return mass_out.get_mass(cosmo, R_out, a)
+        return self.mass_out.get_mass(cosmo, R_out, a)
+
+    def __call__(self, cosmo, M, a):
+        if self.mass_in == self.mass_out:
+            return M
 
-    return translate
+        M_use = np.atleast_1d(np.asarray(M, dtype=float))
+        self._check_state(cosmo)
+        key = (a, M_use.shape, M_use.tobytes())
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        else:
+            self._cache[key] = self._translate(cosmo, M_use, a)
+            while len(self._cache) > self.n_cache:
+                self._cache.popitem(last=False)
+        M_out = self._cache[key].copy()
+
+        if np.ndim(M) == 0:
+            return M_out[0]
+        return M_out
@@ -2,6 +2,8 @@ __all__ = ("halomod_mean_profile_1pt", "halomod_bias_1pt",)
 
 import numpy as np
 
+from .halo_model import _use_workspace
+
 
 def _Ix1(func, cosmo, hmc, k, a, prof):
     # I_X_1 dispatcher for internal use
@@ -33,7 +35,7 @@ def _Ix1(func, cosmo, hmc, k, a, prof):
     out = np.zeros([na, nk])
     for ia, aa in enumerate(a_use):
         i11 = func(cosmo, k_use, aa, prof)
-        norm = prof.get_normalization(cosmo, aa, hmc=hmc)
+        norm = hmc.get_normalization(cosmo, aa, prof)
         out[ia] = i11 / norm
 
     if np.ndim(a) == 0:
@@ -43,6 +45,7 @@ def _Ix1(func, cosmo, hmc, k, a, prof):
     return out
 
 
+@_use_workspace
 def halomod_mean_profile_1pt(cosmo, hmc, k, a, prof):
     """ Returns the mass-weighted mean halo profile.
 
@@ -56,6 +59,7 @@ def halomod_mean_profile_1pt(cosmo, hmc, k, a, prof):
     return _Ix1("I_0_1", cosmo, hmc, k, a, prof)
 
 
+@_use_workspace
 def halomod_bias_1pt(cosmo, hmc, k, a, prof):
     """ Returns the mass-and-bias-weighted mean halo profile.
 
@@ -4,8 +4,10 @@ import numpy as np
 
 from .. import Pk2D
 from . import Profile2pt
+from .halo_model import _use_workspace
 
 
+@_use_workspace
 def halomod_power_spectrum(cosmo, hmc, k, a, prof, *,
                            prof2=None, prof_2pt=None,
                            p_of_k_a=None,
@@ -101,12 +103,12 @@ def halomod_power_spectrum(cosmo, hmc, k, a, prof, *,
     out = np.zeros([na, nk])
     for ia, aa in enumerate(a_use):
         # normalizations
-        norm1 = prof.get_normalization(cosmo, aa, hmc=hmc)
+        norm1 = hmc.get_normalization(cosmo, aa, prof)
 
         if prof2 == prof:
             norm2 = norm1
         else:
-            norm2 = prof2.get_normalization(cosmo, aa, hmc=hmc)
+            norm2 = hmc.get_normalization(cosmo, aa, prof2)
 
         if get_2h:
             # bias factors
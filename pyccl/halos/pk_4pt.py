@@ -7,8 +7,10 @@ import numpy as np
 
 from .. import CCLWarning, Tk3D
 from . import HaloProfileNFW, Profile2pt
+from .halo_model import _use_workspace
 
 
+@_use_workspace
 def halomod_trispectrum_1h(cosmo, hmc, k, a, prof, *,
                            prof2=None, prof3=None, prof4=None,
                            prof12_2pt=None, prof34_2pt=None):
@@ -75,22 +77,22 @@ def halomod_trispectrum_1h(cosmo, hmc, k, a, prof, *,
     out = np.zeros([na, nk, nk])
     for ia, aa in enumerate(a_use):
         # normalizations
-        norm1 = prof.get_normalization(cosmo, aa, hmc=hmc)
+        norm1 = hmc.get_normalization(cosmo, aa, prof)
 
         if prof2 == prof:
             norm2 = norm1
         else:
-            norm2 = prof2.get_normalization(cosmo, aa, hmc=hmc)
+            norm2 = hmc.get_normalization(cosmo, aa, prof2)
 
         if prof3 == prof:
             norm3 = norm1
         else:
-            norm3 = prof3.get_normalization(cosmo, aa, hmc=hmc)
+            norm3 = hmc.get_normalization(cosmo, aa, prof3)
 
         if prof4 == prof2:
             norm4 = norm2
         else:
-            norm4 = prof4.get_normalization(cosmo, aa, hmc=hmc)
+            norm4 = hmc.get_normalization(cosmo, aa, prof4)
 
         # trispectrum
         tk_1h = hmc.I_0_22(cosmo, k_use, aa,
@@ -178,6 +180,7 @@ def halomod_Tk3D_1h(cosmo, hmc, prof, *,
                 extrap_order_hik=extrap_order_hik, is_logt=use_log)
 
 
+@_use_workspace
 def halomod_Tk3D_SSC_linear_bias(cosmo, hmc, *, prof,
                                  bias1=1, bias2=1, bias3=1, bias4=1,
                                  is_number_counts1=False,
@@ -274,7 +277,7 @@ def halomod_Tk3D_SSC_linear_bias(cosmo, hmc, *, prof,
     nk = len(k_use)
     dpk12, dpk34 = [np.zeros([na, nk]) for _ in range(2)]
     for ia, aa in enumerate(a_arr):
-        norm = prof.get_normalization(cosmo, aa, hmc=hmc)**2
+        norm = hmc.get_normalization(cosmo, aa, prof)**2
         i12 = hmc.I_1_2(cosmo, k_use, aa, prof, prof2=prof, prof_2pt=prof_2pt)
 
         pk = pk2d(k_use, aa, cosmo=extrap)
@@ -316,6 +319,7 @@ def halomod_Tk3D_SSC_linear_bias(cosmo, hmc, *, prof,
                 extrap_order_hik=extrap_order_hik, is_logt=use_log)
 
 
+@_use_workspace
 def halomod_Tk3D_SSC(
         cosmo, hmc, prof, *, prof2=None, prof3=None, prof4=None,
         prof12_2pt=None, prof34_2pt=None,
@@ -409,28 +413,28 @@ def halomod_Tk3D_SSC(
     dpk12, dpk34 = [np.zeros((len(a_arr), len(k_use))) for _ in range(2)]
     for ia, aa in enumerate(a_arr):
         # normalizations & I11 integral
-        norm1 = prof.get_normalization(cosmo, aa, hmc=hmc)
+        norm1 = hmc.get_normalization(cosmo, aa, prof)
         i11_1 = hmc.I_1_1(cosmo, k_use, aa, prof)
 
         if prof2 == prof:
             norm2 = norm1
             i11_2 = i11_1
         else:
-            norm2 = prof2.get_normalization(cosmo, aa, hmc=hmc)
+            norm2 = hmc.get_normalization(cosmo, aa, prof2)
             i11_2 = hmc.I_1_1(cosmo, k_use, aa, prof2)
 
         if prof3 == prof:
             norm3 = norm1
             i11_3 = i11_1
         else:
-            norm3 = prof3.get_normalization(cosmo, aa, hmc=hmc)
+            norm3 = hmc.get_normalization(cosmo, aa, prof3)
             i11_3 = hmc.I_1_1(cosmo, k_use, aa, prof3)
 
         if prof4 == prof2:
             norm4 = norm2
             i11_4 = i11_2
         else:
-            norm4 = prof4.get_normalization(cosmo, aa, hmc=hmc)
+            norm4 = hmc.get_normalization(cosmo, aa, prof4)
             i11_4 = hmc.I_1_1(cosmo, k_use, aa, prof4)
 
         # I12 integral
@@ -1,7 +1,8 @@
 __all__ = ("HaloProfileCIBShang12",)
 
+from collections import OrderedDict
+
 import numpy as np
-from scipy.integrate import simpson
 from scipy.special import lambertw
 
 from . import HaloProfileNFW, HaloProfileCIB
@@ -85,6 +86,11 @@ class HaloProfileCIBShang12(HaloProfileCIB):
         "nu", "alpha", "T0", "beta", "gamma", "s_z", "log10Meff", "siglog10M",
         "Mmin", "L0", "mass_def", "concentration", "precision_fftlog",)
     _one_over_4pi = 0.07957747154
+    # Tables of the satellite luminosity integral, shared by all instances
+    # (e.g. profiles for different frequencies), and their resolution.
+    _lumsat_tables = OrderedDict()
+    _n_lumsat_tables = 8
+    _lumsat_dlog10M = 0.005
 
     def __init__(self, *, mass_def, concentration, nu_GHz, alpha=0.36,
                  T0=24.4, beta=1.75, gamma=1.7, s_z=3.6, log10Meff=12.6,
@@ -196,22 +202,46 @@ class HaloProfileCIBShang12(HaloProfileCIB):
         Lumcen = np.heaviside(M-self.Mmin, 1)*Lum
         return Lumcen
 
-    def _Lumsat(self, M, a):
-        if not np.max(M) > self.Mmin:
-            return np.zeros_like(M)
+    def _get_lumsat_table(self, log10M_max):
+        # Satellite luminosity at a=1 tabulated in log10(M) from Mmin to at
+        # least `log10M_max`. The redshift dependence of the luminosity is
+        # a global factor, so the same table serves all scale factors.
+        key = (self.Mmin, self.log10Meff, self.siglog10M, self.L0)
+        table = self._lumsat_tables.get(key)
+        if table is not None and table[0][-1] >= log10M_max:
+            self._lumsat_tables.move_to_end(key)
+            return table
 
-        res = np.zeros_like(M)
-        M_use = M[M >= self.Mmin, None]
-        logM = np.log10(M_use)
         LOGM_MIN = np.log10(self.Mmin)
-        nm = max(2, 10*int(np.max(logM) - LOGM_MIN))
-        msub = np.linspace(LOGM_MIN, np.max(logM), nm+1)[None, :]
-
-        Lum = self._Lum(msub, a)
-        dnsubdlnm = self.dNsub_dlnM_TinkerWetzel10(10**msub, M_use)
-        integ = dnsubdlnm * Lum
-        Lumsat = simpson(integ, x=np.log(10)*msub)
-        res[-len(Lumsat):] = Lumsat
+        LOGM_MAX = max(log10M_max, 16.)
+        nm = max(2, int(np.ceil((LOGM_MAX - LOGM_MIN)
+                                / self._lumsat_dlog10M))) + 1
+        lM = np.linspace(LOGM_MIN, LOGM_MAX, nm)
+
+        # Trapezoidal weights in ln(m) for the integrals from Mmin to
+        # each of the parent masses (rows).
+        w = np.tril(np.full((nm, nm), np.log(10)*(lM[1]-lM[0])))
+        w[:, 0] *= 0.5
+        w[np.diag_indices(nm)] *= 0.5
+        w[0, 0] = 0
+        dnsubdlnm = self.dNsub_dlnM_TinkerWetzel10(10**lM[None, :],
+                                                   10**lM[:, None])
+        Lumsat = np.einsum('ji,ji,i->j', w, dnsubdlnm, self._Lum(lM, 1.))
+
+        table = self._lumsat_tables[key] = (lM, Lumsat)
+        while len(self._lumsat_tables) > self._n_lumsat_tables:
+            self._lumsat_tables.popitem(last=False)
+        return table
+
+    def _Lumsat(self, M, a):
+        res = np.zeros(np.shape(M))
+        good = M >= self.Mmin
+        if not np.any(good):
+            return res
+
+        logM = np.log10(M[good])
+        lM, Lumsat = self._get_lumsat_table(np.max(logM))
+        res[good] = a**(-self.s_z) * np.interp(logM, lM, Lumsat)
         return res
 
     def _real(self, cosmo, r, M, a):
@@ -232,6 +262,13 @@ class HaloProfileCIBShang12(HaloProfileCIB):
             prof = np.squeeze(prof, axis=0)
         return prof
 
+    def _fourier_lum(self, cosmo, k, M, a):
+        # Frequency-independent part of the Fourier-space profile.
+        Lc = self._Lumcen(M, a)
+        Ls = self._Lumsat(M, a)
+        uk = self.pNFW._fourier(cosmo, k, M, a)/M[:, None]
+        return (Lc[:, None]+Ls[:, None]*uk)*self._one_over_4pi
+
     def _fourier(self, cosmo, k, M, a):
         M_use = np.atleast_1d(M)
         k_use = np.atleast_1d(k)
@@ -239,15 +276,48 @@ class HaloProfileCIBShang12(HaloProfileCIB):
         # (redshifted) Frequency dependence
         spec_nu = self._spectrum(self.nu/a, a)
 
-        Lc = self._Lumcen(M_use, a)
-        Ls = self._Lumsat(M_use, a)
-        uk = self.pNFW._fourier(cosmo, k_use, M_use, a)/M_use[:, None]
+        prof = self._fourier_lum(cosmo, k_use, M_use, a)*spec_nu
+
+        if np.ndim(k) == 0:
+            prof = np.squeeze(prof, axis=-1)
+        if np.ndim(M) == 0:
+            prof = np.squeeze(prof, axis=0)
+        return prof
+
+    def fourier_multifrequency(self, cosmo, k, M, a, nu_GHz):
+        """ Returns the Fourier-space profile for several frequencies
+        at once. This is equivalent to calling :meth:`fourier` on copies
+        of this profile with different values of ``nu_GHz``, but all
+        the frequency-independent quantities (satellite and central
+        luminosities, satellite density profile) are only computed once.
+
+        Args:
+            cosmo (:class:`~pyccl.cosmology.Cosmology`): a Cosmology object.
+            k (:obj:`float` or `array`): comoving wavenumber (in :math:`Mpc^{-1}`).
+            M (:obj:`float` or `array`): halo mass.
+            a (:obj:`float`): scale factor.
+            nu_GHz (:obj:`float` or `array`): frequencies in GHz.
+
+        Returns:
+            (:obj:`float` or `array`): Fourier-space profile. The shape of the
+            output will be ``(N_nu, N_M, N_k)`` where ``N_nu``, ``N_M`` and
+            ``N_k`` are the sizes of ``nu_GHz``, ``M`` and ``k``. If any of
+            them are scalars, the corresponding dimension will be
+            squeezed out on output.
+        """ # noqa
+        M_use = np.atleast_1d(M)
+        k_use = np.atleast_1d(k)
+        nu_use = np.atleast_1d(nu_GHz).astype(float)
 
-        prof = (Lc[:, None]+Ls[:, None]*uk)*spec_nu*self._one_over_4pi
+        spec_nu = self._spectrum(nu_use/a, a)
+        prof = (spec_nu[:, None, None]
+                * self._fourier_lum(cosmo, k_use, M_use, a)[None, :, :])
 
         if np.ndim(k) == 0:
             prof = np.squeeze(prof, axis=-1)
         if np.ndim(M) == 0:
+            prof = np.squeeze(prof, axis=1)
+        if np.ndim(nu_GHz) == 0:
             prof = np.squeeze(prof, axis=0)
         return prof
 
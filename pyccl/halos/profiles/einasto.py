@@ -100,6 +100,30 @@ class HaloProfileEinasto(HaloProfileMatter):
                     * np.exp(2/alpha)
                     * gamma(3/alpha) * gammainc(3/alpha, 2/alpha*c**alpha))
 
+    @property
+    def _template_grids(self):
+        alphas = np.linspace(0.1, 0.5, 21)
+        if self.truncated:
+            return [np.geomspace(1., 100., 32), alphas]
+        return [alphas]
+
+    def _template_scales(self, cosmo, M, a):
+        R_M = self.mass_def.get_radius(cosmo, M, a) / a
+        c_M = self.concentration(cosmo, M, a)
+        R_s = R_M / c_M
+        alpha = self._get_alpha(cosmo, M, a)
+        norm = self._norm(M, R_s, c_M, alpha)
+        if self.truncated:
+            return R_s, norm, np.array([c_M, alpha]).T
+        return R_s, norm, alpha[:, None]
+
+    def _template_real(self, x, pars):
+        alpha = pars[:, -1:]
+        prof = np.exp(-2. * (x[None, :]**alpha - 1) / alpha)
+        if self.truncated:
+            prof[x[None, :] > pars[:, :1]] = 0
+        return prof
+
     def _real(self, cosmo, r, M, a):
         r_use = np.atleast_1d(r)
         M_use = np.atleast_1d(M)
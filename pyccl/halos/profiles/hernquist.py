@@ -82,6 +82,27 @@ class HaloProfileHernquist(HaloProfileMatter):
         # Hernquist normalization from mass, radius and concentration
         return M / (2 * np.pi * Rs**3 * (c / (1 + c))**2)
 
+    @property
+    def _template_grids(self):
+        if self.truncated:
+            return [np.geomspace(1., 100., 64)]
+        return []
+
+    def _template_scales(self, cosmo, M, a):
+        R_M = self.mass_def.get_radius(cosmo, M, a) / a
+        c_M = self.concentration(cosmo, M, a)
+        R_s = R_M / c_M
+        norm = self._norm(M, R_s, c_M)
+        if self.truncated:
+            return R_s, norm, c_M[:, None]
+        return R_s, norm, np.zeros([len(M), 0])
+
+    def _template_real(self, x, pars):
+        prof = np.tile(1 / (x * (1 + x)**3), (len(pars), 1))
+        if self.truncated:
+            prof[x[None, :] > pars[:, :1]] = 0
+        return prof
+
     def _real(self, cosmo, r, M, a):
         r_use = np.atleast_1d(r)
         M_use = np.atleast_1d(M)
@@ -1,6 +1,7 @@
 import warnings
 import pyccl
 import numpy as np
+from ... import unlock_instance
 from .hod import HaloProfileHOD
 
 
@@ -138,6 +139,7 @@ class SatelliteShearHOD(HaloProfileHOD):
         self.rmin = rmin
         self.N_r = N_r
         self.N_jn = N_jn
+        self._jn_table = self._radial_weights = None
         super().__init__(mass_def=mass_def,
                          concentration=concentration,
                          log10Mmin_0=log10Mmin_0,
@@ -388,48 +390,37 @@ class SatelliteShearHOD(HaloProfileHOD):
         M_use = np.atleast_1d(M)
         k_use = np.atleast_1d(k)
         l_arr = np.arange(2, self.lmax+1, 2, dtype='int32')
-        if not self.integration_method == 'FFTLog':
-            # Define the r-integral sampling and the sph. bessel
-            # function sampling. The bessel function will be sampled
-            # and interpolated to gain speed.
-            r_use = np.linspace(self.rmin,
-                                self.mass_def.get_radius(cosmo, M_use, a) / a,
-                                self.N_r).T
-            x_jn = np.geomspace(k_use.min() * r_use.min(),
-                                k_use.max() * r_use.max(),
-                                self.N_jn)
-            jn = np.empty(shape=(len(l_arr), len(x_jn)))
-        prof = np.zeros(shape=(len(M_use), len(k_use)))
-        # Loop over all multipoles:
-        for j, l in enumerate(l_arr):
-            if self.integration_method == 'FFTLog':
-                prof += (self._fftlog_wrap(cosmo, k_use, M_use, a,
-                                           ell=int(l), fourier_out=True)
-                         * (1j**l).real * (2*l+1) * self._angular_fl[j]
-                         / (4*np.pi))
-            else:
-                from scipy.special import spherical_jn
-                jn[j] = spherical_jn(l_arr[j], x_jn)
-                k_dot_r = np.multiply.outer(k_use, r_use)
-                jn_interp = np.interp(k_dot_r, x_jn, jn[j])
-                integrand = (r_use**2 * jn_interp *
-                             self._real(cosmo, r_use, M_use, a))
-                if self.integration_method == 'simpson':
-                    from scipy.integrate import simpson
-                    for i, M_i in enumerate(M_use):
-                        prof[i, :] += (simpson(integrand[:, i, :],
-                                               r_use[i, :]).T
-                                       * (1j**l).real * (2*l+1)
-                                       * self._angular_fl[j])
-                elif self.integration_method == 'spline':
-                    from pyccl.pyutils import _spline_integrate
-                    for i, M_i in enumerate(M_use):
-                        prof[i, :] += (_spline_integrate(r_use[i, :],
-                                                         integrand[:, i, :],
-                                                         r_use[i, 0],
-                                                         r_use[i, -1]).T
-                                       * (1j**l).real*(2*l+1)
-                                       * self._angular_fl[j])
+        # Weights of each multipole in the plane-wave expansion.
+        w_l = ((1j**l_arr).real * (2*l_arr+1)
+               * self._angular_fl[:len(l_arr), 0])
+
+        if self.integration_method == 'FFTLog':
+            # All multipoles in a single FFTLog call.
+            p_l = self._fftlog_wrap(cosmo, k_use, M_use, a,
+                                    ell=l_arr, fourier_out=True)
+            prof = np.einsum('l,lmk->mk', w_l / (4*np.pi), p_l)
+        else:
+            # Define the r-integral sampling.
+            r_vir = self.mass_def.get_radius(cosmo, M_use, a) / a
+            r_use = np.linspace(self.rmin, r_vir, self.N_r).T
+            # Real-space profile times the quadrature weights.
+            dr = (r_vir - self.rmin) / (self.N_r - 1)
+            prof_r = self._real(cosmo, r_use, M_use, a).reshape(r_use.shape)
+            f_r = (r_use**2 * prof_r * dr[:, None]
+                   * self._get_radial_weights()[None, :])
+            # Plane-wave expansion kernel sum_l w_l j_l(x), sampled
+            # and interpolated from the tabulated Bessel functions.
+            x_jn, jn = self._get_jn_table(l_arr, k_use.min() * r_use.min(),
+                                          k_use.max() * r_use.max())
+            kernel = w_l @ jn
+            # Radial integrals for all masses and wavenumbers, in chunks
+            # of wavenumbers to bound the memory used.
+            prof = np.empty(shape=(len(M_use), len(k_use)))
+            n_chunk = max(1, 2**22 // r_use.size)
+            for i in range(0, len(k_use), n_chunk):
+                k_dot_r = np.multiply.outer(k_use[i:i+n_chunk], r_use)
+                prof[:, i:i+n_chunk] = np.einsum(
+                    'kmr,mr->mk', np.interp(k_dot_r, x_jn, kernel), f_r)
 
         if np.ndim(k) == 0:
             prof = np.squeeze(prof, axis=-1)
@@ -437,3 +428,45 @@ class SatelliteShearHOD(HaloProfileHOD):
             prof = np.squeeze(prof, axis=0)
 
         return prof
+
+    @unlock_instance(mutate=False)
+    def _get_jn_table(self, l_arr, x_min, x_max):
+        # Spherical Bessel functions of orders `l_arr`, tabulated on
+        # `N_jn` logarithmically-spaced points over [x_min, x_max]. The
+        # table is stored and reused as long as it covers the requested
+        # range with a similar (at most 25% coarser) sampling. New tables
+        # are padded so that small changes in the range (e.g. due to
+        # changes in the cosmology) don't require recomputing them.
+        from scipy.special import spherical_jn
+        dlx = np.log(x_max / x_min) / (self.N_jn - 1)
+        if self._jn_table is not None:
+            l_tab, x_tab, jn = self._jn_table
+            dlx_tab = np.log(x_tab[-1] / x_tab[0]) / (len(x_tab) - 1)
+            if (np.array_equal(l_tab, l_arr) and x_tab[0] <= x_min
+                    and x_tab[-1] >= x_max and dlx_tab <= dlx * 1.25):
+                return x_tab, jn
+
+        x_min, x_max = x_min / 2, x_max * 2
+        n_x = int(np.ceil(np.log(x_max / x_min) / dlx)) + 1
+        x_tab = np.geomspace(x_min, x_max, n_x)
+        jn = spherical_jn(l_arr[:, None], x_tab[None, :])
+        self._jn_table = (l_arr.copy(), x_tab, jn)
+        return x_tab, jn
+
+    @unlock_instance(mutate=False)
+    def _get_radial_weights(self):
+        # Weights of the radial quadrature for `N_r` equally-spaced
+        # points with unit spacing. Both methods are linear in the
+        # integrand, so the weights are the integrals of unit vectors.
+        key = (self.integration_method, self.N_r)
+        weights = self._radial_weights
+        if weights is None or weights[0] != key:
+            x = np.arange(self.N_r, dtype=float)
+            if self.integration_method == 'simpson':
+                from scipy.integrate import simpson
+                w = simpson(np.eye(self.N_r), x=x)
+            else:
+                from pyccl.pyutils import _spline_integrate
+                w = _spline_integrate(x, np.eye(self.N_r), x[0], x[-1])
+            weights = self._radial_weights = (key, w)
+        return weights[1]
@@ -1,5 +1,7 @@
 __all__ = ("HaloProfilePressureGNFW",)
 
+from collections import OrderedDict
+
 import numpy as np
 
 from ... import UnlockInstance
@@ -41,6 +43,15 @@ class HaloProfilePressureGNFW(HaloProfilePressure):
     <https://arxiv.org/abs/1303.5080>`_ paper. The profile is
     calculated in physical (non-comoving) units of :math:`\\mathrm{eV/cm^3}`.
 
+    The Fourier-space profile is computed from a template of the
+    dimensionless profile, obtained with a single FFTLog transform. Templates
+    for the most recently used values of ``alpha``, ``beta``, ``gamma``,
+    ``c500`` and ``x_out`` are kept in memory, so switching back and forth
+    between them is free. When sampling over the shape parameters, use
+    :meth:`~pyccl.halos.profiles.profile_base.HaloProfile.use_fourier_template`
+    with grids of (``alpha``, ``beta``, ``gamma``, ``c500``) to interpolate
+    across precomputed templates instead.
+
     Args:
         mass_def (:class:`~pyccl.halos.massdef.MassDef` or :obj:`str`):
             a mass definition object, or a name string.
@@ -72,6 +83,9 @@ class HaloProfilePressureGNFW(HaloProfilePressure):
         "mass_bias", "P0", "c500", "alpha", "alpha_P", "beta", "gamma",
         "P0_hexp", "qrange", "nq", "x_out", "mass_def", "precision_fftlog",)
 
+    # Number of Fourier-space templates kept in memory.
+    _n_cached_templates = 8
+
     def __init__(self, *, mass_def, mass_bias=0.8, P0=6.41,
                  c500=1.81, alpha=1.33, alpha_P=0.12,
                  beta=4.13, gamma=0.31, P0_hexp=-1.,
@@ -90,6 +104,8 @@ class HaloProfilePressureGNFW(HaloProfilePressure):
 
         # Interpolator for dimensionless Fourier-space profile
         self._fourier_interp = None
+        # Recently used interpolators, keyed by shape parameters.
+        self._fourier_interps = OrderedDict()
         super().__init__(mass_def=mass_def)
 
     def update_parameters(self, *, mass_bias=None, P0=None,
@@ -101,7 +117,9 @@ class HaloProfilePressureGNFW(HaloProfilePressure):
         .. note::
 
             A change in ``alpha``, ``beta``, ``gamma``, ``c500``, or ``x_out``
-            recomputes the Fourier-space template, which may be slow.
+            recomputes the Fourier-space template, unless it was recently
+            used. A change in ``x_out`` also discards any template created
+            with :meth:`use_fourier_template`.
 
         Args:
             mass_bias (:obj:`float`):
@@ -148,6 +166,7 @@ class HaloProfilePressureGNFW(HaloProfilePressure):
         if x_out is not None and x_out != self.x_out:
             re_fourier = True
             self.x_out = x_out
+            self._fourier_template = None
 
         if re_fourier and (self._fourier_interp is not None):
             self._fourier_interp = self._integ_interp()
@@ -159,28 +178,46 @@ class HaloProfilePressureGNFW(HaloProfilePressure):
         f2 = (1+(self.c500*x)**self.alpha)**exponent
         return f1*f2
 
+    def _template_scales(self, cosmo, M, a):
+        mb = self.mass_bias
+        R = self.mass_def.get_radius(cosmo, M * mb, a) / a
+        nn = self._norm(cosmo, M, a, mb)
+        pars = np.tile([self.alpha, self.beta, self.gamma, self.c500],
+                       (len(M), 1))
+        return R, nn, pars
+
+    def _template_real(self, x, pars):
+        if pars.shape[-1] != 4:
+            raise ValueError("GNFW templates must be tabulated over "
+                             "(alpha, beta, gamma, c500).")
+        alpha, beta, gamma, c500 = (p[:, None] for p in pars.T)
+        cx = c500 * x[None, :]
+        prof = cx**(-gamma) * (1+cx**alpha)**(-(beta-gamma)/alpha)
+        prof[:, x > self.x_out] = 0
+        return prof
+
     def _integ_interp(self):
         # Precomputes the Fourier transform of the profile in terms
         # of the scaled radius x and creates a spline interpolator
-        # for it.
+        # for it. Interpolators for recently used shape parameters
+        # are reused.
         from scipy.interpolate import interp1d
-        from scipy.integrate import quad
-
-        def integrand(x):
-            return self._form_factor(x)*x
-
-        q_arr = np.geomspace(self.qrange[0], self.qrange[1], self.nq)
-        # We use the `weight` feature of quad to quickly estimate
-        # the Fourier transform. We could use the existing FFTLog
-        # framework, but this is a lot less of a kerfuffle.
-        f_arr = np.array([quad(integrand,
-                               a=1e-4, b=self.x_out,  # limits of integration
-                               weight="sin",  # fourier sine weight
-                               wvar=q)[0] / q
-                          for q in q_arr])
-        Fq = interp1d(np.log(q_arr), f_arr,
-                      fill_value="extrapolate",
-                      bounds_error=False)
+
+        key = (self.alpha, self.beta, self.gamma, self.c500, self.x_out,
+               repr(self.precision_fftlog))
+        Fq = self._fourier_interps.pop(key, None)
+        if Fq is None:
+            lq_arr = np.log(np.geomspace(self.qrange[0], self.qrange[1],
+                                         self.nq))
+            pars = np.array([[self.alpha, self.beta, self.gamma, self.c500]])
+            # 3D Fourier transform divided by 4*pi.
+            f_arr = self._template_transform(lq_arr, pars)[0] / (4*np.pi)
+            Fq = interp1d(lq_arr, f_arr,
+                          fill_value="extrapolate",
+                          bounds_error=False)
+        self._fourier_interps[key] = Fq
+        while len(self._fourier_interps) > self._n_cached_templates:
+            self._fourier_interps.popitem(last=False)
         return Fq
 
     def _norm(self, cosmo, M, a, mb):
@@ -219,6 +256,8 @@ class HaloProfilePressureGNFW(HaloProfilePressure):
     def _fourier(self, cosmo, k, M, a):
         # Fourier-space profile.
         # Output in units of eV * Mpc^3 / cm^3.
+        if self._fourier_template is not None:
+            return self._fourier_from_template(cosmo, k, M, a)
 
         # Tabulate if not done yet
         if self._fourier_interp is None:
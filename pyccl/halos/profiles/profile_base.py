@@ -6,9 +6,10 @@ from typing import Callable
 
 import numpy as np
 
-from ... import CCLAutoRepr, FFTLogParams, unlock_instance
+from ... import CCLAutoRepr, FFTLogParams, UnlockInstance, unlock_instance
 from ... import physical_constants as const
-from ...pyutils import resample_array, _fftlog_transform
+from ...pyutils import (resample_array, _fftlog_transform,
+                        _fftlog_transform_multi)
 from .. import MassDef
 
 
@@ -48,6 +49,8 @@ class HaloProfile(CCLAutoRepr):
 
         # Initialize FFTLog.
         self.precision_fftlog = FFTLogParams()
+        # Dimensionless Fourier-space template (see `use_fourier_template`).
+        self._fourier_template = None
 
         self._is_number_counts = is_number_counts
 
@@ -122,6 +125,123 @@ class HaloProfile(CCLAutoRepr):
         """
         return self.precision_fftlog['plaw_projected']
 
+    def use_fourier_template(self, param_grids=None, *, q_min=1E-3,
+                             q_max=1E3, n_per_decade=64, method='linear'):
+        """Tabulate the dimensionless Fourier-space profile once, and use it
+        to compute :meth:`fourier` by interpolation for any cosmology, mass
+        and scale factor, instead of carrying out one FFTLog transform per
+        call.
+
+        This is only available for profiles whose real-space shape can be
+        written as :math:`\\rho(r)=\\rho_0\\,f(r/r_s|{\\bf p})`, where
+        the amplitude :math:`\\rho_0` and scale radius :math:`r_s` depend on
+        cosmology, mass and scale factor, and :math:`{\\bf p}` is a (possibly
+        empty) set of dimensionless shape parameters (e.g. concentration, or
+        the :math:`\\alpha` index of an Einasto profile). The Fourier-space
+        profile is then :math:`\\rho_0\\,r_s^3\\,U(k\\,r_s|{\\bf p})`,
+        where :math:`U` is computed with FFTLog (using the accuracy
+        parameters in ``precision_fftlog``) on a grid of :math:`q=k\\,r_s`
+        and :math:`{\\bf p}`.
+
+        Subclasses opt in by implementing ``_template_scales``, which returns
+        :math:`(r_s, \\rho_0, {\\bf p})` for a given cosmology, mass and
+        scale factor, and ``_template_real``, which returns
+        :math:`f(x|{\\bf p})`. They may also define default parameter grids
+        in ``_template_grids``.
+
+        The template is not updated automatically if parameters of the
+        profile that determine its shape (other than :math:`{\\bf p}`) are
+        modified. Call this method again in that case.
+
+        Args:
+            param_grids (:obj:`list`): list of 1D arrays containing the
+                values of each shape parameter on which the template will be
+                tabulated. If ``None``, the profile's defaults are used.
+                Shape parameters outside of these grids will raise an error.
+            q_min (:obj:`float`): minimum value of :math:`q=k\\,r_s`. The
+                template is assumed constant for smaller values.
+            q_max (:obj:`float`): maximum value of :math:`q`. The template is
+                assumed to vanish for larger values.
+            n_per_decade (:obj:`int`): number of samples per decade in
+                :math:`q`.
+            method (:obj:`str`): interpolation method (any of those
+                supported by :class:`scipy.interpolate.RegularGridInterpolator`).
+        """ # noqa
+        if not (hasattr(self, "_template_scales") and
+                hasattr(self, "_template_real")):
+            raise NotImplementedError(
+                f"{type(self).__name__} does not support Fourier templates.")
+        if param_grids is None:
+            param_grids = getattr(self, "_template_grids", ())
+        param_grids = [np.asarray(g, dtype=float) for g in param_grids]
+        if any(g.ndim != 1 or g.size < 2 for g in param_grids):
+            raise ValueError("Parameter grids must be 1D arrays with at "
+                             "least two elements.")
+
+        lq_arr = np.linspace(np.log(q_min), np.log(q_max),
+                             int(n_per_decade*np.log10(q_max/q_min))+1)
+        shape = tuple(g.size for g in param_grids)
+        if param_grids:
+            pars = np.array(np.meshgrid(*param_grids, indexing='ij'))
+            pars = pars.reshape([len(param_grids), -1]).T
+        else:
+            # No shape parameters: a single profile, interpolated in q only.
+            pars = np.zeros([1, 0])
+        u_q = self._template_transform(lq_arr, pars)
+        u_q = np.moveaxis(u_q.reshape(shape + (lq_arr.size,)), -1, 0)
+
+        from scipy.interpolate import RegularGridInterpolator
+        interp = RegularGridInterpolator([lq_arr] + param_grids, u_q,
+                                         method=method)
+        with UnlockInstance(self, mutate=False):
+            self._fourier_template = interp
+
+    def _template_transform(self, lq_arr, pars):
+        # Fourier transform of the dimensionless real-space profile for
+        # each set of shape parameters in `pars` (shape (n_p, n_par)),
+        # sampled at the values of ln(q) in `lq_arr`.
+        n_q = len(lq_arr)
+        x_min = self.precision_fftlog['padding_lo_fftlog'] * np.exp(lq_arr[0])
+        x_max = self.precision_fftlog['padding_hi_fftlog'] * np.exp(lq_arr[-1])
+        n_x = (int(np.log10(x_max / x_min)) *
+               self.precision_fftlog['n_per_decade'])
+        x_arr = np.geomspace(x_min, x_max, n_x)
+
+        # Transform the grid points in batches, and resample onto the q grid.
+        n_batch = max(1, int(2**22 // n_x))
+        u_q = np.zeros([len(pars), n_q])
+        for i0 in range(0, len(pars), n_batch):
+            p = pars[i0:i0+n_batch]
+            f_x = self._template_real(x_arr, p).reshape([len(p), n_x])
+            q_arr, u = _fftlog_transform(
+                x_arr, f_x, 3, 0, self.precision_fftlog['plaw_fourier'])
+            u_q[i0:i0+n_batch] = resample_array(
+                np.log(q_arr), u.reshape([len(p), n_x]), lq_arr,
+                self.precision_fftlog['extrapol'],
+                self.precision_fftlog['extrapol'], 0, 0)
+        return u_q * (2 * np.pi)**3
+
+    def _fourier_from_template(self, cosmo, k, M, a):
+        k_use = np.atleast_1d(k)
+        M_use = np.atleast_1d(M)
+        R_s, norm, pars = self._template_scales(cosmo, M_use, a)
+        pars = np.asarray(pars).reshape([len(M_use), -1])
+
+        lq = np.log(k_use[None, :] * R_s[:, None])
+        lq_min, lq_max = self._fourier_template.grid[0][[0, -1]]
+        pts = np.empty(lq.shape + (1 + pars.shape[1],))
+        pts[..., 0] = np.clip(lq, lq_min, lq_max)
+        pts[..., 1:] = pars[:, None, :]
+        prof = self._fourier_template(pts)
+        prof[lq > lq_max] = 0
+        prof *= (norm * R_s**3)[:, None]
+
+        if np.ndim(k) == 0:
+            prof = np.squeeze(prof, axis=-1)
+        if np.ndim(M) == 0:
+            prof = np.squeeze(prof, axis=0)
+        return prof
+
     _real: Callable       # implementation of the real profile
 
     _fourier: Callable    # implementation of the Fourier profile
@@ -130,6 +250,10 @@ class HaloProfile(CCLAutoRepr):
 
     _cumul2d: Callable    # implementation of the cumulative surface density
 
+    _template_scales: Callable  # scale radius, amplitude and shape params
+
+    _template_real: Callable    # dimensionless real-space profile shape
+
     def real(self, cosmo, r, M, a):
         """
         real(cosmo, r, M, a)
@@ -179,6 +303,8 @@ class HaloProfile(CCLAutoRepr):
         """ # noqa
         if getattr(self, "_fourier", None):
             return self._fourier(cosmo, k, M, a)
+        if getattr(self, "_fourier_template", None) is not None:
+            return self._fourier_from_template(cosmo, k, M, a)
         return self._fftlog_wrap(cosmo, k, M, a, fourier_out=True)
 
     def projected(self, cosmo, r_t, M, a):
@@ -382,7 +508,9 @@ class HaloProfile(CCLAutoRepr):
         #  \rho(k) = 4\pi \int dr r^2 \rho(r) j_ell(k r)
         # if fourier_out == True, and
         #  \rho(r) = \frac{1}{2\pi^2} \int dk k^2 \rho(k) j_ell(k r)
-        # otherwise.
+        # otherwise. If `ell` is an array, the transforms for all its
+        # values are computed in a single FFTLog call and stacked along
+        # a new first axis.
 
         # Select which profile should be the input
         if fourier_out:
@@ -405,31 +533,37 @@ class HaloProfile(CCLAutoRepr):
                self.precision_fftlog['n_per_decade'])
         r_arr = np.geomspace(k_min, k_max, n_k)
 
-        p_k_out = np.zeros([nM, k_use.size])
         # Compute real profile values
         p_real_M = p_func(cosmo, r_arr, M_use, a)
         # Power-law index to pass to FFTLog.
         plaw_index = self._get_plaw_fourier(cosmo, a)
 
         # Compute Fourier profile through fftlog
-        k_arr, p_fourier_M = _fftlog_transform(r_arr, p_real_M,
-                                               3, ell, plaw_index)
-        lk_arr = np.log(k_arr)
-
-        for im, p_k_arr in enumerate(p_fourier_M):
-            # Resample into input k values
-            p_fourier = resample_array(lk_arr, p_k_arr, lk_use,
-                                       self.precision_fftlog['extrapol'],
-                                       self.precision_fftlog['extrapol'],
-                                       0, 0)
-            p_k_out[im, :] = p_fourier
+        if np.ndim(ell) == 0:
+            k_arr, p_fourier_M = _fftlog_transform(r_arr, p_real_M,
+                                                   3, ell, plaw_index)
+            k_arr = k_arr[None, :]
+            p_fourier_M = p_fourier_M.reshape([1, nM, -1])
+        else:
+            k_arr, p_fourier_M = _fftlog_transform_multi(
+                r_arr, p_real_M.reshape([nM, -1]), 3, ell, plaw_index)
+
+        # Resample into input k values
+        p_k_out = np.array([
+            resample_array(np.log(k_l), p_l, lk_use,
+                           self.precision_fftlog['extrapol'],
+                           self.precision_fftlog['extrapol'],
+                           0, 0)
+            for k_l, p_l in zip(k_arr, p_fourier_M)])
         if fourier_out:
             p_k_out *= (2 * np.pi)**3
 
         if np.ndim(k) == 0:
             p_k_out = np.squeeze(p_k_out, axis=-1)
         if np.ndim(M) == 0:
-            p_k_out = np.squeeze(p_k_out, axis=0)
+            p_k_out = np.squeeze(p_k_out, axis=1)
+        if np.ndim(ell) == 0:
+            p_k_out = p_k_out[0]
         return p_k_out
 
     def _projected_fftlog_wrap(self, cosmo, r_t, M, a, is_cumul2d=False):
@@ -447,7 +581,6 @@ class HaloProfile(CCLAutoRepr):
                  self.precision_fftlog['n_per_decade'])
         k_arr = np.geomspace(r_t_min, r_t_max, n_r_t)
 
-        sig_r_t_out = np.zeros([nM, r_t_use.size])
         # Compute Fourier-space profile
         if getattr(self, "_fourier", None):
             # Compute from `_fourier` if available.
@@ -478,14 +611,12 @@ class HaloProfile(CCLAutoRepr):
 
         if is_cumul2d:
             sig_r_t_M /= r_t_arr[None, :]
-        for im, sig_r_t_arr in enumerate(sig_r_t_M):
-            # Resample into input r_t values
-            sig_r_t = resample_array(lr_t_arr, sig_r_t_arr,
+        # Resample into input r_t values
+        sig_r_t_out = resample_array(lr_t_arr, sig_r_t_M.reshape([nM, -1]),
                                      lr_t_use,
                                      self.precision_fftlog['extrapol'],
                                      self.precision_fftlog['extrapol'],
                                      0, 0)
-            sig_r_t_out[im, :] = sig_r_t
 
         if np.ndim(r_t) == 0:
             sig_r_t_out = np.squeeze(sig_r_t_out, axis=-1)
@@ -80,20 +80,28 @@ def sigmaM(cosmo, M, a):
     Args:
         cosmo (:class:`~pyccl.cosmology.Cosmology`): Cosmological parameters.
         M (:obj:`float` or `array`): Halo masses.
-        a (:obj:`float`): scale factor.
+        a (:obj:`float` or `array`): scale factor(s).
 
     Returns:
-        (:obj:`float` or `array`): RMS variance of halo mass.
+        (:obj:`float` or `array`): RMS variance of halo mass. If ``a`` is an
+        array, the output has shape ``(N_a, N_M)``, with any scalar
+        dimensions squeezed out.
     """
     cosmo.compute_sigma()
 
     logM = np.log10(np.atleast_1d(M))
     status = 0
-    sigM, status = lib.sigM_vec(cosmo.cosmo, a, logM,
-                                len(logM), status)
+    if np.ndim(a) == 0:
+        sigM, status = lib.sigM_vec(cosmo.cosmo, a, logM,
+                                    len(logM), status)
+    else:
+        a_use = np.atleast_1d(a).astype(float)
+        sigM, status = lib.sigM_2d_vec(cosmo.cosmo, a_use, logM,
+                                       a_use.size * logM.size, status)
+        sigM = sigM.reshape([a_use.size, logM.size])
     check(status, cosmo=cosmo)
     if np.ndim(M) == 0:
-        sigM = sigM[0]
+        sigM = sigM[..., 0]
     return sigM
 
 
@@ -3,7 +3,9 @@ well as wrappers to automatically vectorize functions.
 """
 __all__ = (
     "CLevelErrors", "ExtrapolationMethods", "IntegrationMethods", "check",
-    "debug_mode", "get_pk_spline_lk", "get_pk_spline_a", "resample_array")
+    "debug_mode", "get_pk_spline_lk", "get_pk_spline_a", "resample_array",
+    "FFTLogPlan", "fftlog_clear_cache", "fftlog_import_wisdom",
+    "fftlog_export_wisdom",)
 
 from enum import Enum
 from typing import Iterable
@@ -470,7 +472,8 @@ def resample_array(x_in, y_in, x_out,
 
     Args:
         x_in (`array`): input x-values.
-        y_in (`array`): input y-values.
+        y_in (`array`): input y-values. If 2D, each row is interpolated
+            (in a single call to the C library).
         x_out (`array`): x-values for output array.
         extrap_lo (:obj:`str`): type of extrapolation for x-values below the
             range of `x_in`. 'none' (for no interpolation), 'constant',
@@ -492,6 +495,16 @@ def resample_array(x_in, y_in, x_out,
         raise ValueError("Invalid extrapolation type.")
 
     status = 0
+    if np.ndim(y_in) == 2:
+        n_f = len(y_in)
+        y_out, status = lib.array_2d_resample(
+            x_in, np.asarray(y_in, dtype=float).flatten(), n_f, x_out,
+            fill_value_lo, fill_value_hi,
+            extrap_types[extrap_lo], extrap_types[extrap_hi],
+            n_f * np.size(x_out), status)
+        check(status)
+        return y_out.reshape([n_f, np.size(x_out)])
+
     y_out, status = lib.array_1d_resample(x_in, y_in, x_out,
                                           fill_value_lo, fill_value_hi,
                                           extrap_types[extrap_lo],
@@ -532,6 +545,155 @@ def _fftlog_transform(rs, frs,
     return ks, fks
 
 
+def _fftlog_transform_multi(rs, frs, dim, mus, power_law_index):
+    # Same as `_fftlog_transform`, for several Bessel function orders
+    # `mus` in a single call. Returns the output abscissas with shape
+    # `(n_mu, n_r)` (they depend on the order) and the transforms with
+    # shape `(n_mu, n_transforms, n_r)`.
+    if np.ndim(rs) != 1:
+        raise ValueError("rs should be a 1D array")
+    if np.ndim(frs) < 1 or np.ndim(frs) > 2:
+        raise ValueError("frs should be a 1D or 2D array")
+    frs = np.atleast_2d(frs)
+    n_transforms, n_r = frs.shape
+    if len(rs) != n_r:
+        raise ValueError(f"rs should have {n_r} elements")
+    mus = np.atleast_1d(np.asarray(mus, dtype=float))
+    n_mu = len(mus)
+
+    status = 0
+    result, status = lib.fftlog_transform_multi(n_transforms,
+                                                rs, frs.flatten(),
+                                                dim, mus, power_law_index,
+                                                n_mu*(n_transforms+1)*n_r,
+                                                status)
+    check(status)
+    result = result.reshape([n_mu, n_transforms + 1, n_r])
+    return result[:, 0], result[:, 1:]
+
+
+class FFTLogPlan:
+    r"""Reusable FFTLog plan. Holds the FFTW plans and transform coefficients
+    for Hankel transforms of arrays with a fixed number of logarithmically
+    spaced samples, so that repeated transforms with the same geometry skip
+    all the setup.
+
+    FFTLog transforms performed internally by CCL (correlation functions,
+    halo profiles, etc.) already reuse plans through an internal cache (see
+    :func:`fftlog_clear_cache`). This class gives explicit control over the
+    plan lifetime, and allows the more expensive ``FFTW_MEASURE`` planner.
+
+    Args:
+        n_r (:obj:`int`): number of samples of the input arrays.
+        dlogr (:obj:`float`): spacing of the input arrays in
+            :math:`\ln(r)`.
+        dim (:obj:`int`): dimensionality of the transform (2 or 3).
+        mu (:obj:`float`): Bessel function order.
+        power_law_index (:obj:`float`): power-law index used to
+            pre-whiten the input arrays.
+        measure (:obj:`bool`): if ``True``, FFTW plans are optimized with
+            ``FFTW_MEASURE``, using any wisdom previously imported with
+            :func:`fftlog_import_wisdom`.
+    """
+    def __init__(self, n_r, dlogr, dim, mu, power_law_index, *,
+                 measure=False):
+        if dim not in [2, 3]:
+            raise ValueError("`dim` must be 2 or 3")
+        self.n_r = int(n_r)
+        self.dlogr = float(dlogr)
+        self.dim = dim
+        self.mu = mu
+        self.power_law_index = power_law_index
+        mu_c = mu + 0.5 if dim == 3 else mu
+        status = 0
+        self.plan, status = lib.fftlog_plan_new(
+            self.n_r, self.dlogr, float(dim), mu_c,
+            0.5*dim+power_law_index, int(measure), status)
+        check(status)
+
+    def __del__(self):
+        # lib may be freed before the plan at interpreter shutdown, so
+        # check that lib.fftlog_plan_free is still a real function.
+        if getattr(self, "plan", None) is None:
+            return
+        if lib is not None and getattr(lib, "fftlog_plan_free",
+                                       None) is not None:
+            lib.fftlog_plan_free(self.plan)
+
+    def __call__(self, rs, frs):
+        """Transform one or several arrays.
+
+        Args:
+            rs (`array`): logarithmically spaced values of the input
+                coordinate. Must be compatible with the plan.
+            frs (`array`): 1D or 2D (one array per row) input arrays
+                sampled at ``rs``.
+
+        Returns:
+            Tuple of output coordinates and transformed arrays.
+        """
+        rs = np.asarray(rs, dtype=float)
+        frs = np.asarray(frs, dtype=float)
+        if rs.shape != (self.n_r,):
+            raise ValueError(f"rs should have {self.n_r} elements")
+        if np.ndim(frs) < 1 or np.ndim(frs) > 2:
+            raise ValueError("frs should be a 1D or 2D array")
+        if frs.shape[-1] != self.n_r:
+            raise ValueError(f"frs should have {self.n_r} columns")
+        n_transforms = 1 if np.ndim(frs) == 1 else frs.shape[0]
+
+        status = 0
+        result, status = lib.fftlog_plan_transform(
+            self.plan, n_transforms, rs, frs.flatten(),
+            (n_transforms + 1) * self.n_r, status)
+        check(status)
+        result = result.reshape([n_transforms + 1, self.n_r])
+        ks = result[0]
+        fks = result[1:]
+        if np.ndim(frs) == 1:
+            fks = fks.squeeze()
+        return ks, fks
+
+
+def fftlog_clear_cache(*, measure=None):
+    """Free the FFTLog plans cached internally by CCL.
+
+    Args:
+        measure (:obj:`bool`): if not ``None``, choose whether plans cached
+            from now on are optimized with ``FFTW_MEASURE`` (``True``) or
+            ``FFTW_ESTIMATE`` (``False``, default).
+    """
+    if measure is None:
+        lib.fftlog_clear_cache()
+    else:
+        lib.fftlog_set_cache_measure(int(measure))
+
+
+def fftlog_import_wisdom(fname):
+    """Import FFTW wisdom from a file.
+
+    Args:
+        fname (:obj:`str`): file name.
+
+    Returns:
+        :obj:`bool`: whether the wisdom could be imported.
+    """
+    return bool(lib.fftlog_import_wisdom(str(fname)))
+
+
+def fftlog_export_wisdom(fname):
+    """Export the FFTW wisdom accumulated by ``FFTW_MEASURE`` plans to a
+    file, for later use with :func:`fftlog_import_wisdom`.
+
+    Args:
+        fname (:obj:`str`): file name.
+
+    Returns:
+        :obj:`bool`: whether the wisdom could be exported.
+    """
+    return bool(lib.fftlog_export_wisdom(str(fname)))
+
+
 def _spline_integrate(x, ys, a, b):
     if np.ndim(x) != 1:
         raise ValueError("x should be a 1D array")
@@ -160,3 +160,44 @@ def test_baccoemu_baryons_As_sigma8():
 
     err = np.abs(fk1 / fk2 - 1)
     assert np.allclose(err, 0, atol=BEMUNL_TOLERANCE, rtol=0)
+
+
+@pytest.mark.parametrize("emu_class",
+                         [ccl.BaccoemuLinear, ccl.BaccoemuNonlinear])
+def test_baccoemu_batch(emu_class):
+    bemu = emu_class()
+    cosmos = [ccl.Cosmology(Omega_c=0.27, Omega_b=0.05, h=h, n_s=0.96,
+                            m_nu=0.1, **amp)
+              for h, amp in [(0.67, {"sigma8": 0.83}),
+                             (0.7, {"A_s": 2.2E-9})]]
+    a = np.array([0.6, 1.0])
+    ks, pks = bemu.get_pk_at_a_batch(cosmos, a)
+    assert pks.shape == (2, 2, ks.shape[-1])
+    pk2ds = bemu.get_pk2d_batch(cosmos)
+    for cosmo, k, pk, pk2d in zip(cosmos, ks, pks, pk2ds):
+        k1, pk1 = bemu.get_pk_at_a(cosmo, a)
+        assert np.allclose(k, k1, atol=0, rtol=1E-10)
+        assert np.allclose(pk, pk1, atol=0, rtol=1E-6)
+        kk = k[10:-10]
+        assert np.allclose(pk2d(kk, 1.0), bemu.get_pk2d(cosmo)(kk, 1.0),
+                           atol=0, rtol=1E-6)
+
+
+def test_baccoemu_baryons_batch():
+    baryons = ccl.BaccoemuBaryons()
+    cosmo = ccl.CosmologyVanillaLCDM()
+    k = np.logspace(-2, 0.5, 32)
+    a = np.array([0.7, 1.0])
+    M_cs = [12.5, 13.5, 14.5]
+    fka = baryons.boost_factor_batch(
+        cosmo, k, a, [{"log10_M_c": M_c} for M_c in M_cs])
+    assert fka.shape == (3, 2, 32)
+    for M_c, f in zip(M_cs, fka):
+        bar = ccl.BaccoemuBaryons(log10_M_c=M_c)
+        assert np.allclose(f, bar.boost_factor(cosmo, k, a),
+                           atol=0, rtol=1E-6)
+
+    with pytest.raises(ValueError):
+        baryons.boost_factor_batch(cosmo, k, a, [{"M_c": 13.}])
+    with pytest.raises(ValueError):
+        baryons.boost_factor_batch([cosmo]*2, k, a, [{}]*3)
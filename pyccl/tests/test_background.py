@@ -230,3 +230,65 @@ def test_input_arrays_raises():
                                 n_s=0.965, A_s=2e-9,
                                 growth={'a': input_a_array,
                                         'growth_rate': input_fgrowth})
+
+
+def test_background_E_spline():
+    # E(a) from its spline in the distance and growth integrals should
+    # agree with the analytic calculation.
+    kw = dict(Omega_c=0.25, Omega_b=0.05, h=0.7, sigma8=0.8, n_s=0.96,
+              m_nu=[0.02, 0.05, 0.1], w0=-0.9, wa=0.1,
+              transfer_function='bbks', matter_power_spectrum='linear')
+    a = np.linspace(0.1, 1, 32)
+
+    cosmo = ccl.Cosmology(**kw)
+    ccl.gsl_params.BACKGROUND_E_SPLINE = True
+    cosmo_sp = ccl.Cosmology(**kw)
+    ccl.gsl_params.reload()
+
+    # Growth is computed first to check that it triggers the E(a) spline.
+    cosmo_sp.compute_growth()
+    assert cosmo_sp.has_distances
+    for func in [ccl.comoving_radial_distance, ccl.growth_factor,
+                 ccl.growth_rate]:
+        assert np.allclose(func(cosmo_sp, a), func(cosmo, a),
+                           atol=0, rtol=1E-5)
+    assert np.allclose(ccl.scale_factor_of_chi(cosmo_sp, [100., 3000.]),
+                       ccl.scale_factor_of_chi(cosmo, [100., 3000.]),
+                       atol=0, rtol=1E-5)
+
+
+def test_scale_dependent_growth():
+    a = np.array([0.9, 0.2, 0.5, 1.])
+    k = np.array([1E-6, 1E-2, 1.])
+
+    # No scale dependence in GR
+    gf = ccl.scale_dependent_growth_factor(COSMO, k, a)
+    fg = ccl.scale_dependent_growth_rate(COSMO, k, a)
+    assert gf.shape == fg.shape == (a.size, k.size)
+    assert np.allclose(gf, ccl.growth_factor(COSMO, a)[:, None],
+                       atol=0, rtol=1E-5)
+    assert np.allclose(fg, ccl.growth_rate(COSMO, a)[:, None],
+                       atol=0, rtol=1E-5)
+    assert np.shape(ccl.scale_dependent_growth_factor(COSMO, k, 0.5)) == (3,)
+    assert np.shape(ccl.scale_dependent_growth_factor(COSMO, 0.1, a)) == (4,)
+    assert np.ndim(ccl.scale_dependent_growth_factor(COSMO, 0.1, 0.5)) == 0
+
+    # mu(k, a) in mu-Sigma modified gravity. On large scales, mu tends to
+    # mu_0*c1_mg, which is what the scale-independent growth uses.
+    cosmo = ccl.Cosmology(
+        Omega_c=0.27, Omega_b=0.045, h=0.67, sigma8=0.8, n_s=0.96,
+        transfer_function='bbks', matter_power_spectrum='linear',
+        mg_parametrization=ccl.modified_gravity.MuSigmaMG(
+            mu_0=0.1, sigma_0=0.1, c1_mg=1.5, lambda_mg=1.))
+    gf = ccl.scale_dependent_growth_factor(cosmo, k, a)
+    fg = ccl.scale_dependent_growth_rate(cosmo, k, a)
+    assert np.allclose(gf[:, 0], ccl.growth_factor(cosmo, a),
+                       atol=0, rtol=1E-4)
+    assert np.allclose(fg[:, 0], ccl.growth_rate(cosmo, a),
+                       atol=0, rtol=1E-4)
+    # Less growth on small scales, where mu is smaller.
+    assert gf[3, 2] < gf[3, 0]
+    assert fg[3, 2] < fg[3, 0]
+
+    with pytest.raises(ccl.CCLError):
+        ccl.scale_dependent_growth_factor(COSMO, k, 1.1)
@@ -65,3 +65,39 @@ def test_baryons_in_cosmology():
 def test_baryons_in_cosmology_error():
     with pytest.raises(ValueError):
         ccl.CosmologyVanillaLCDM(baryonic_effects=3.1416)
+
+
+def test_baryons_boost_cache():
+    bar2 = ccl.BaryonsSchneider15()
+    pk = COSMO.get_nonlin_power()
+    pkb = bar2.include_baryonic_effects(COSMO, pk)
+    assert len(bar2._boost_cache) == 1
+    # Same parameters, cosmology and grid: the boost factor is reused.
+    bar2.include_baryonic_effects(COSMO, pk)
+    assert len(bar2._boost_cache) == 1
+    # New parameters are a new entry.
+    bar2.update_parameters(eta_b=0.6)
+    pkb2 = bar2.include_baryonic_effects(COSMO, pk)
+    assert len(bar2._boost_cache) == 2
+    k_arr = np.geomspace(1E-2, 1, 10)
+    assert not np.allclose(pkb(k_arr, 0.5), pkb2(k_arr, 0.5))
+    bar2.clear_cache()
+    assert bar2._boost_cache is None
+
+
+def test_baryons_lazy():
+    pk = COSMO.get_nonlin_power()
+    pkb = bar.include_baryonic_effects(COSMO, pk)
+    pkb_lazy = bar.include_baryonic_effects(COSMO, pk, lazy=True)
+    assert isinstance(pkb_lazy, ccl.BoostedPk2D)
+
+    k_arr = np.geomspace(1E-2, 1, 10)
+    a_arr = np.array([0.5, 1.0])
+    fka = bar.boost_factor(COSMO, k_arr, a_arr)
+    assert np.allclose(pkb_lazy(k_arr, a_arr), pk(k_arr, a_arr)*fka,
+                       atol=0, rtol=1E-10)
+    assert np.allclose(pkb_lazy(k_arr, 0.5), pkb(k_arr, 0.5),
+                       atol=0, rtol=1E-5)
+    assert np.shape(pkb_lazy(1., 0.5)) == ()
+    assert np.allclose(pkb_lazy.to_pk2d()(k_arr, 0.5), pkb(k_arr, 0.5),
+                       atol=0, rtol=1E-10)
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+import pyccl as ccl
+
+
+def test_boltzmann_pool():
+    cosmos = [ccl.CosmologyVanillaLCDM(transfer_function="boltzmann_camb",
+                                       Omega_c=Omega_c)
+              for Omega_c in [0.24, 0.25, 0.26]]
+    with ccl.BoltzmannPool(max_workers=2) as pool:
+        pks = pool.compute(cosmos)
+        for cosmo, pk in zip(cosmos, pks):
+            assert cosmo.has_linear_power
+            assert cosmo.get_linear_power() is pk
+
+        # Already computed.
+        assert pool.submit(cosmos[0]).result() is pks[0]
+
+    # Same result as computing it in this process.
+    k = np.geomspace(1E-3, 1, 32)
+    cosmo = ccl.CosmologyVanillaLCDM(transfer_function="boltzmann_camb",
+                                     Omega_c=0.25)
+    assert np.allclose(pks[1](k, 0.7), cosmo.linear_matter_power(k, 0.7),
+                       atol=0, rtol=1E-10)
+    assert np.isclose(cosmos[1].sigma8(), 0.81, rtol=1E-6)
+
+
+def test_boltzmann_pool_nonlin_camb():
+    cosmo = ccl.CosmologyVanillaLCDM(transfer_function="boltzmann_camb",
+                                     matter_power_spectrum="camb")
+    with ccl.BoltzmannPool(max_workers=1) as pool:
+        pool.submit(cosmo).result()
+    assert cosmo.has_linear_power
+    assert cosmo.has_nonlin_power
+
+
+def test_boltzmann_pool_raises():
+    with ccl.BoltzmannPool(max_workers=1) as pool:
+        with pytest.raises(ValueError):
+            pool.submit(ccl.CosmologyVanillaLCDM(transfer_function="bbks"))
+
+
+@pytest.mark.parametrize("transfer_function",
+                         ["boltzmann_camb", "boltzmann_class"])
+@pytest.mark.parametrize("amplitude", [{"A_s": 2.2E-9}, {"sigma8": 0.78}])
+def test_boltzmann_primordial_rescaling(transfer_function, amplitude):
+    def get_pk(n_s):
+        cosmo = ccl.Cosmology(Omega_c=0.25, Omega_b=0.05, h=0.67, n_s=n_s,
+                              transfer_function=transfer_function,
+                              **amplitude)
+        return cosmo.get_linear_power()
+
+    k = np.geomspace(1E-4, 5, 64)
+    caching = ccl.Caching._enabled
+    try:
+        ccl.Caching.disable()
+        pk_direct = get_pk(0.93)
+        ccl.Caching.enable()
+        ccl.Caching.clear_cache()
+        pk_cached = [get_pk(n_s) for n_s in [0.96, 0.93]]
+        # Both spectra come from the same Boltzmann run.
+        info = ccl.boltzmann._get_fiducial_pk_arrays.cache_info
+        assert (info.misses, info.hits) == (1, 1)
+    finally:
+        ccl.Caching._enabled = caching
+
+    for a in [0.3, 1.0]:
+        assert np.allclose(pk_cached[1](k, a), pk_direct(k, a),
+                           atol=0, rtol=1E-5)
@@ -120,4 +120,55 @@ def test_cells_mg():
     assert np.all(np.fabs(1 - cl1 / cl0) < 1E-10)
 
 
+def _get_tracers(cosmo):
+    return [ccl.WeakLensingTracer(cosmo, dndz=(ZZ, NN)),
+            ccl.NumberCountsTracer(cosmo, has_rsd=False, dndz=(ZZ, NN),
+                                   bias=(ZZ, np.ones_like(ZZ)))]
+
+
+@pytest.mark.parametrize('n_workers', [1, 2])
+def test_cells_derivatives(n_workers):
+    ell = np.geomspace(10, 1000, 8)
+    der = ccl.AngularClDerivatives(COSMO, _get_tracers, ell,
+                                   params=['sigma8', 'Omega_c'],
+                                   n_workers=n_workers)
+    assert der.pairs == [(0, 0), (0, 1), (1, 1)]
+    dcl = der()
+    assert dcl.shape == (2, 3, ell.size)
+
+    # Linear power spectrum scales exactly as sigma8^2.
+    assert np.allclose(dcl[0], 2 * der.cl_fiducial / COSMO['sigma8'],
+                       atol=0, rtol=1E-6)
+
+    # Higher-order stencils agree.
+    der5 = ccl.AngularClDerivatives(COSMO, _get_tracers, ell,
+                                    params=['Omega_c'], stencil=5,
+                                    steps={'Omega_c': 0.005})
+    assert np.allclose(der5()[0], dcl[1], atol=0, rtol=1E-3)
+
+
+@pytest.mark.parametrize('n_workers', [1, 2])
+def test_cells_derivatives_accuracy_params(n_workers):
+    # Perturbed cosmologies use the accuracy parameters of the fiducial one.
+    ell = np.geomspace(10, 1000, 8)
+    kw = {'params': ['Omega_c'], 'n_workers': n_workers}
+    dcl0 = ccl.AngularClDerivatives(COSMO, _get_tracers, ell, **kw)()
+    der = ccl.AngularClDerivatives(COSMO, _get_tracers, ell, **kw)
+    ccl.gsl_params.INTEGRATION_LIMBER_EPSREL = 1E-2
+    try:
+        dcl1 = der()
+        assert ccl.gsl_params.INTEGRATION_LIMBER_EPSREL == 1E-2
+    finally:
+        ccl.gsl_params.reload()
+    assert np.allclose(dcl1, dcl0, atol=0, rtol=1E-10)
+
+
+def test_cells_derivatives_errors():
+    with pytest.raises(ValueError):
+        ccl.AngularClDerivatives(COSMO, _get_tracers, [10.], params=['A_s'])
+    with pytest.raises(ValueError):
+        ccl.AngularClDerivatives(COSMO, _get_tracers, [10.],
+                                 params=['h'], stencil=4)
+
+
 ccl.gsl_params.reload()  # reset to the default parameters
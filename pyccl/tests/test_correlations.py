@@ -133,4 +133,68 @@ def test_correlation_zero_ends():
         ccl.correlation(COSMO, ell=ell, C_ell=C_ell, theta=theta)
 
 
+@pytest.mark.parametrize('method', ['bessel', 'legendre', 'fftlog'])
+def test_correlation_batched(method):
+    z = np.linspace(0., 1., 200)
+    lens = [ccl.WeakLensingTracer(
+        COSMO, dndz=(z, np.exp(-0.5*((z-z0)/0.1)**2)))
+        for z0 in [0.4, 0.6, 0.8]]
+    ell = np.geomspace(2, 3000, 64)
+    cls = np.array([[ccl.angular_cl(COSMO, t1, t2, ell) for t2 in lens]
+                    for t1 in lens[:2]])
+    cls[1, 2] = 0
+    theta = np.geomspace(0.1, 5., 4)
+
+    w = ccl.correlation(COSMO, ell=ell, C_ell=cls, theta=theta,
+                        type='NN', method=method)
+    assert w.shape == (2, 3, 4)
+    assert np.all(w[1, 2] == 0)
+    for i in range(2):
+        for j in range(2 if i == 1 else 3):
+            w_ref = ccl.correlation(COSMO, ell=ell, C_ell=cls[i, j],
+                                    theta=theta, type='NN', method=method)
+            assert np.allclose(w[i, j], w_ref, atol=0, rtol=1E-10)
+
+    w = ccl.correlation(COSMO, ell=ell, C_ell=cls[0], theta=1.,
+                        type='NN', method=method)
+    assert w.shape == (3,)
+
+
+@pytest.mark.parametrize('typ', ['NN', 'NG', 'GG+', 'GG-'])
+def test_correlation_legendre_multi(typ):
+    z = np.linspace(0., 1., 200)
+    lens = [ccl.WeakLensingTracer(
+        COSMO, dndz=(z, np.exp(-0.5*((z-z0)/0.1)**2)))
+        for z0 in [0.4, 0.6]]
+    ell = np.unique(np.geomspace(2, 60000, 200).astype(int)).astype(float)
+    cls = np.array([ccl.angular_cl(COSMO, lens[0], t, ell) for t in lens])
+    theta = np.geomspace(0.1, 5., 8)
+
+    xi = ccl.LegendreCorrelation(theta=theta, type=typ)
+    w = xi(COSMO, ell=ell, C_ell=cls)
+    assert w.shape == (2, 8)
+    # The weights are computed only once
+    pl = xi._pl
+    w2 = xi(COSMO, ell=ell, C_ell=np.vstack([cls, 0*cls[0]]))
+    assert xi._pl is pl
+    assert np.all(w2[:2] == w)
+    assert np.all(w2[2] == 0)
+
+    for c, wc in zip(cls, w):
+        if typ in ['NN', 'NG']:
+            w_ref = ccl.correlation(COSMO, ell=ell, C_ell=c, theta=theta,
+                                    type=typ, method='legendre')
+            assert np.allclose(wc, w_ref, atol=0, rtol=1E-10)
+        else:
+            # Full-sky vs. flat-sky
+            w_ref = ccl.correlation(COSMO, ell=ell, C_ell=c, theta=theta,
+                                    type=typ, method='fftlog')
+            assert np.allclose(wc, w_ref, atol=0, rtol=5E-2)
+
+    with pytest.raises(ValueError):
+        ccl.LegendreCorrelation(theta=theta, type='blah')
+    with pytest.raises(ValueError):
+        xi(COSMO, ell=ell, C_ell=cls[:, :-1])
+
+
 ccl.gsl_params.reload()  # reset to the default parameters
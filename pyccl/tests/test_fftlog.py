@@ -69,3 +69,40 @@ def test_fftlog_shapes():
     r, fr = _fftlog_transform(k_arr, fk_arr,
                               2, 0, 1.5)
     assert fr.shape == (nt, nk)
+
+
+@pytest.mark.parametrize('dim', [2, 3])
+def test_fftlog_plan(dim, tmp_path):
+    import pyccl as ccl
+
+    nk = 1024
+    k_arr = np.logspace(-4, 4, nk)
+    fk_arr = np.array([fk(k_arr, alpha, 0, dim) for alpha in [1.2, 1.5]])
+    plan = ccl.FFTLogPlan(nk, np.log(k_arr[1]/k_arr[0]), dim, 0, -1.5,
+                          measure=True)
+
+    # Agrees with the (internally cached) transform and can be reused
+    r_ref, fr_ref = _fftlog_transform(k_arr, fk_arr, dim, 0, -1.5)
+    for i in range(2):
+        r, fr = plan(k_arr, fk_arr)
+        assert np.allclose(r, r_ref, atol=0, rtol=1E-12)
+        assert np.allclose(fr, fr_ref, atol=0, rtol=1E-10)
+    r, fr = plan(k_arr, fk_arr[0])
+    assert fr.shape == (nk,)
+
+    # Geometry must match the plan
+    with pytest.raises(ValueError):
+        plan(k_arr[1:], fk_arr[:, 1:])
+    with pytest.raises(ccl.CCLError):
+        plan(np.logspace(-3, 3, nk), fk_arr)
+    with pytest.raises(ValueError):
+        ccl.FFTLogPlan(nk, 0.1, 4, 0, -1.5)
+
+    fname = str(tmp_path / "wisdom.dat")
+    assert ccl.fftlog_export_wisdom(fname)
+    assert ccl.fftlog_import_wisdom(fname)
+    ccl.fftlog_clear_cache(measure=True)
+    r, fr = _fftlog_transform(k_arr, fk_arr, dim, 0, -1.5)
+    assert np.allclose(fr, fr_ref, atol=0, rtol=1E-10)
+    ccl.fftlog_clear_cache(measure=False)
+    ccl.fftlog_clear_cache()
@@ -25,6 +25,18 @@ def test_bM_subclasses_smoke(bM_class):
         assert np.shape(b) == np.shape(m)
 
 
+@pytest.mark.parametrize('bM_class', HBFS)
+def test_bM_2d(bM_class):
+    bM = bM_class(mass_def=ccl.halos.MassDef(200, 'critical'))
+    a_arr = np.array([0.1, 0.5, 1.0])
+    m_arr = np.geomspace(1E11, 1E15, 8)
+    b2d = bM(COSMO, m_arr, a_arr)
+    assert b2d.shape == (len(a_arr), len(m_arr))
+    b1d = np.array([bM(COSMO, m_arr, a) for a in a_arr])
+    assert np.allclose(b2d, b1d, atol=0, rtol=1E-10)
+    assert np.shape(bM(COSMO, 1E13, a_arr)) == a_arr.shape
+
+
 @pytest.mark.parametrize('bM_pair', zip(HBFS, MDFS))
 def test_bM_mdef_raises(bM_pair):
     bM_class, mdef = bM_pair
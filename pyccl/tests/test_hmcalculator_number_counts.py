@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 import pyccl as ccl
 import scipy.integrate
 
@@ -163,3 +164,66 @@ def test_hmcalculator_number_counts_scipy_dblquad():
 
     mtot_hmc = hmc.number_counts(cosmo, selection=sel, a_min=amin, a_max=amax)
     assert np.allclose(mtot_hmc, mtot, atol=0, rtol=0.02)
+
+
+def test_hmcalculator_number_counts_bins():
+    cosmo = ccl.Cosmology(
+        Omega_c=0.27, Omega_b=0.045, h=0.67, sigma8=0.8, n_s=0.96,
+        transfer_function='bbks', matter_power_spectrum='linear')
+    mdef = ccl.halos.MassDef(200, 'matter')
+    hmf = ccl.halos.MassFuncTinker10(mass_def=mdef, mass_def_strict=False)
+    hbf = ccl.halos.HaloBiasTinker10(mass_def=mdef, mass_def_strict=False)
+
+    m_edges = [1e14, 3e14, 1e15]
+    a_edges = [0.5, 0.7, 1.0]
+
+    def sel_bin(m, a, im, ia):
+        m = np.atleast_1d(m)
+        a = np.atleast_1d(a)
+        msk_m = (m > m_edges[im]) & (m < m_edges[im+1])
+        msk_a = (a > a_edges[ia]) & (a < a_edges[ia+1])
+        return (msk_m[:, None] & msk_a[None, :]).astype(float)
+
+    def sel_all(m, a):
+        return np.array([[sel_bin(m, a, im, ia) for ia in range(2)]
+                         for im in range(2)])
+
+    for method in ['simpson', 'spline']:
+        hmc = ccl.halos.HMCalculator(mass_function=hmf, halo_bias=hbf,
+                                     mass_def=mdef,
+                                     integration_method_M=method)
+        nc = hmc.number_counts(cosmo, selection=sel_all)
+        assert nc.shape == (2, 2)
+        for im in range(2):
+            for ia in range(2):
+                nc_bin = hmc.number_counts(
+                    cosmo, selection=lambda m, a: sel_bin(m, a, im, ia))
+                assert np.allclose(nc[im, ia], nc_bin, atol=0, rtol=1e-12)
+
+
+def test_hmcalculator_number_counts_shapes():
+    cosmo = ccl.Cosmology(
+        Omega_c=0.27, Omega_b=0.045, h=0.67, sigma8=0.8, n_s=0.96,
+        transfer_function='bbks', matter_power_spectrum='linear')
+    mdef = ccl.halos.MassDef(200, 'matter')
+    hmf = ccl.halos.MassFuncTinker10(mass_def=mdef, mass_def_strict=False)
+    hbf = ccl.halos.HaloBiasTinker10(mass_def=mdef, mass_def_strict=False)
+    hmc = ccl.halos.HMCalculator(mass_function=hmf, halo_bias=hbf,
+                                 mass_def=mdef, nM=128)
+
+    def sel_m(m, a):
+        return ((m > 1e14) & (m < 1e15)).astype(float)
+
+    # Mass-only selections must have shape (nM, 1)
+    nc = hmc.number_counts(cosmo, selection=lambda m, a: sel_m(m, a)[:, None],
+                           na=128)
+    nc_full = hmc.number_counts(
+        cosmo, selection=lambda m, a: sel_m(m, a)[:, None] * np.ones_like(a),
+        na=128)
+    assert np.allclose(nc, nc_full, atol=0, rtol=1e-12)
+    # ... and (nM,) is ambiguous when nM == na.
+    with pytest.raises(ValueError):
+        hmc.number_counts(cosmo, selection=sel_m, na=128)
+    with pytest.raises(ValueError):
+        hmc.number_counts(cosmo, selection=lambda m, a: np.ones([3, 128]),
+                          na=128)
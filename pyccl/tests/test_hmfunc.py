@@ -39,6 +39,24 @@ def test_nM_subclasses_smoke(nM_class):
         assert np.shape(n) == np.shape(m)
 
 
+@pytest.mark.parametrize('nM', [
+    nM_class() for nM_class in HMFS[:-1]] + [
+    ccl.halos.MassFuncWatson13(mass_def=M200m),
+    ccl.halos.MassFuncBocquet16(mass_def=M200c),
+    ccl.halos.MassFuncBocquet16(mass_def=M500c),
+    ccl.halos.MassFuncTinker10(mass_def=M200c, norm_all_z=True)])
+def test_nM_2d(nM):
+    # A single call on an array of scale factors must agree with
+    # calls at each scale factor.
+    a_arr = np.array([0.1, 0.5, 1.0])
+    m_arr = np.geomspace(1E11, 1E15, 8)
+    n2d = nM(COSMO, m_arr, a_arr)
+    assert n2d.shape == (len(a_arr), len(m_arr))
+    n1d = np.array([nM(COSMO, m_arr, a) for a in a_arr])
+    assert np.allclose(n2d, n1d, atol=0, rtol=1E-10)
+    assert np.shape(nM(COSMO, 1E13, a_arr)) == a_arr.shape
+
+
 @pytest.mark.parametrize('nM_pair', zip(HMFS, MDFS))
 def test_nM_mdef_raises(nM_pair):
     nM_class, mdef = nM_pair
@@ -29,3 +29,12 @@ def test_sigmaM_smoke(m):
     s = ccl.sigmaM(COSMO, m, a)
     assert np.all(np.isfinite(s))
     assert np.shape(s) == np.shape(m)
+
+
+@pytest.mark.parametrize('m', [1e14, np.array([1e12, 1e14, 1e15])])
+def test_sigmaM_2d(m):
+    a = np.array([0.3, 0.8, 1.0])
+    s = ccl.sigmaM(COSMO, m, a)
+    assert np.shape(s) == np.shape(a) + np.shape(m)
+    s1d = np.array([ccl.sigmaM(COSMO, m, aa) for aa in a])
+    assert np.allclose(s, s1d, atol=0, rtol=1E-12)
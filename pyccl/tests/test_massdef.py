@@ -120,3 +120,52 @@ def test_mass_translator():
                                            concentration=cm)
     cosmo = ccl.CosmologyVanillaLCDM()
     assert translator(cosmo, 1e14, 1) == 1e14
+
+
+def test_concentration_translation_table():
+    # The tabulated inverse must agree with the C root finder, including
+    # concentrations outside of the table range.
+    c_old = np.geomspace(0.1, 3E4, 128)
+    for Delta_new in [50., 178., 500., 2000.]:
+        c_new = ccl.halos.massdef.convert_concentration(
+            COSMO, c_old=c_old, Delta_old=200., Delta_new=Delta_new)
+        c_new_c, status = ccl.lib.convert_concentration_vec(
+            COSMO.cosmo, 200., c_old, Delta_new, c_old.size, 0)
+        assert status == 0
+        assert np.allclose(c_new, c_new_c, atol=0, rtol=1E-4)
+
+    c_new = ccl.halos.massdef.convert_concentration(
+        COSMO, c_old=5., Delta_old=200., Delta_new=500.)
+    assert np.isscalar(c_new)
+
+
+def test_mass_translator_cache():
+    cm = ccl.halos.Concentration.create_instance(
+        "Duffy08", mass_def="200m")
+    translator = ccl.halos.mass_translator(mass_in="200m", mass_out="500c",
+                                           concentration=cm)
+    assert isinstance(translator, ccl.halos.MassTranslator)
+    M = np.geomspace(1E10, 1E15, 32)
+    m1 = translator(COSMO, M, 0.5)
+    m1[:] = 0  # Modifying the output must not alter the cache.
+    m2 = translator(COSMO, M, 0.5)
+    translator.clear_cache()
+    m3 = translator(COSMO, M, 0.5)
+    assert np.all(m2 == m3)
+    assert np.allclose(translator(COSMO, M[3], 0.5), m3[3], rtol=1E-10)
+
+    # A different cosmology resets the stored quantities.
+    cosmo = ccl.CosmologyVanillaLCDM()
+    m4 = translator(cosmo, M, 0.5)
+    assert not np.allclose(m4, m3, atol=0, rtol=1E-6)
+
+    # So does changing the concentration.
+    cm.A *= 1.1
+    m5 = translator(cosmo, M, 0.5)
+    assert not np.allclose(m5, m4, atol=0, rtol=1E-6)
+
+    # Only the most recent scale factors are kept.
+    for a in np.linspace(0.5, 1., 2 * translator.n_cache):
+        translator(cosmo, M, a)
+    assert len(translator._deltas) == translator.n_cache
+    assert len(translator._cache) == translator.n_cache
@@ -18,3 +18,27 @@ def test_nu_masses_smoke(split):
 def test_neutrinos_raises():
     with pytest.raises(ValueError):
         ccl.nu_masses(Omega_nu_h2=0.1, mass_split='blah')
+
+
+def test_omeganuh2_phase_space():
+    # Omega_nu h^2 a^4 of a single massive species is proportional to the
+    # phase-space integral evaluated at m a / T.
+    from scipy.integrate import quad
+    m_nu, T_CMB, T_ncdm = 0.1, 2.7255, 0.71611
+    a = np.geomspace(1E-3, 1, 16)
+    # Normalize by the massless limit.
+    a_use = np.concatenate([[1E-7], a])
+    omnuh2, status = ccl.ccllib.Omeganuh2_vec(
+        1, T_CMB, T_ncdm, a_use, [m_nu], a_use.size, 0)
+    assert status == 0
+    ratio = omnuh2[1:] * a**4 / (omnuh2[0] * 1E-28)
+
+    c = ccl.physical_constants
+    mnuOT = m_nu * a * c.EV_IN_J / (c.KBOLTZ * T_CMB * T_ncdm)
+
+    def integral(r):
+        return quad(lambda x: x**2*np.sqrt(x**2+r**2)/(np.exp(x)+1),
+                    0, 100, epsrel=1E-10)[0]
+
+    ratio_expected = np.array([integral(r) for r in mnuOT]) / integral(0)
+    assert np.allclose(ratio, ratio_expected, atol=0, rtol=1E-5)
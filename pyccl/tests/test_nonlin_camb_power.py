@@ -53,6 +53,29 @@ def test_nonlin_camb_power():
         assert np.allclose(pk_camb, pk_nonlin_ccl, rtol=3e-5)
 
 
+def test_nonlin_camb_power_sigma8():
+    # sigma8-normalized cosmologies match those with the equivalent A_s,
+    # for both the linear and the non-linear power spectra.
+    kw = dict(Omega_c=0.25, Omega_b=0.05, h=0.7, n_s=0.97, m_nu=0.0,
+              transfer_function="boltzmann_camb",
+              matter_power_spectrum="camb")
+    cosmo_s8 = ccl.Cosmology(sigma8=0.81, **kw)
+    pk_lin, pk_nl = ccl.boltzmann.get_camb_pk_lin(cosmo_s8, nonlin=True)
+    assert np.isclose(ccl.sigma8(cosmo_s8, p_of_k_a=pk_lin), 0.81,
+                      rtol=1e-6)
+
+    A_s = 2.1e-9 * (0.81 / ccl.sigma8(ccl.Cosmology(A_s=2.1e-9, **kw)))**2
+    cosmo_As = ccl.Cosmology(A_s=A_s, **kw)
+    k = np.geomspace(1E-3, 5, 64)
+    for a in [0.5, 1.0]:
+        assert np.allclose(pk_lin(k, a),
+                           ccl.linear_matter_power(cosmo_As, k, a),
+                           rtol=1e-4)
+        assert np.allclose(pk_nl(k, a),
+                           ccl.nonlin_matter_power(cosmo_As, k, a),
+                           rtol=1e-4)
+
+
 def test_nonlin_camb_power_raises():
     # Test that it raises when (trf, mps) == (no camb, camb).
     with pytest.raises(ccl.CCLError):
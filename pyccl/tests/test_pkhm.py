@@ -296,3 +296,44 @@ def test_hmcalculator_inconsistent_mass_def_raises():
     prof = ccl.halos.HaloProfilePressureGNFW(mass_def="500c")
     with pytest.raises(ValueError):
         hmc._check_mass_def(prof)
+
+
+def test_hmcalculator_workspace():
+    # Check that halo model ingredients are computed once per call to the
+    # halo model functions, and recomputed in later calls.
+    hmc = ccl.halos.HMCalculator(
+        mass_function=HMF, halo_bias=HBF, mass_def=M200)
+    prof = ccl.halos.HaloProfilePressureGNFW(mass_def=M200)
+    fourier = prof._fourier
+    ncalls = []
+
+    def counting_fourier(*args):
+        ncalls.append(1)
+        return fourier(*args)
+
+    with ccl.UnlockInstance(prof):
+        prof._fourier = counting_fourier
+
+    # The Fourier profile is shared by the 1-halo and 2-halo terms.
+    pk1 = ccl.halos.halomod_power_spectrum(COSMO, hmc, KK, AA, prof)
+    assert len(ncalls) == 1
+    assert len(hmc._ws_arrays) == 0
+    pk2 = ccl.halos.halomod_power_spectrum(COSMO, hmc, KK, AA, prof)
+    assert len(ncalls) == 2
+    assert np.all(pk1 == pk2)
+    hmc_fresh = ccl.halos.HMCalculator(
+        mass_function=HMF, halo_bias=HBF, mass_def=M200)
+    pk3 = ccl.halos.halomod_power_spectrum(
+        COSMO, hmc_fresh, KK, AA, P3)
+    assert np.allclose(pk1, pk3, rtol=1E-12)
+
+    # Changes to the profile between calls are always taken into account.
+    prof.mass_bias = 0.7
+    pk4 = ccl.halos.halomod_power_spectrum(COSMO, hmc, KK, AA, prof)
+    assert len(ncalls) == 3
+    assert not np.allclose(pk1, pk4, rtol=1E-3)
+
+    # Outside of the halo model functions, nothing is memoized.
+    hmc.I_1_1(COSMO, KK, AA, prof)
+    hmc.I_1_1(COSMO, KK, AA, prof)
+    assert len(ncalls) == 5
@@ -165,6 +165,33 @@ def test_cib_smoke():
         assert getattr(p, n) == 1234.
 
 
+def test_cib_multifrequency():
+    c = ccl.halos.ConcentrationDuffy08(mass_def='200c')
+    nus = np.array([143., 217., 353.])
+    ps = [ccl.halos.HaloProfileCIBShang12(concentration=c, nu_GHz=nu,
+                                          mass_def='200c') for nu in nus]
+    k = np.geomspace(1E-3, 10, 16)
+    M = np.array([1E14, 1E9, 1E12, 3E10])
+    pk = ps[0].fourier_multifrequency(COSMO, k, M, 0.5, nus)
+    assert pk.shape == (3, 4, 16)
+    for p, pk_nu in zip(ps, pk):
+        assert np.allclose(p.fourier(COSMO, k, M, 0.5), pk_nu,
+                           atol=0, rtol=1E-12)
+    assert ps[0].fourier_multifrequency(COSMO, 0.1, 1E13, 0.5,
+                                        217.).shape == ()
+
+    # Masses need not be sorted, and those below Mmin have no satellites.
+    Ls = ps[1]._Lumsat(M, 0.5)
+    assert Ls[1] == 0
+    assert np.all(Ls[[0, 2, 3]] > 0)
+    assert np.allclose(Ls, [ps[1]._Lumsat(np.array([m]), 0.5)[0]
+                            for m in M], atol=0, rtol=1E-12)
+
+    # The satellite luminosity table is shared across frequencies.
+    key = (ps[0].Mmin, ps[0].log10Meff, ps[0].siglog10M, ps[0].L0)
+    assert key in ccl.halos.HaloProfileCIBShang12._lumsat_tables
+
+
 def test_cib_2pt_raises():
     c = ccl.halos.ConcentrationDuffy08(mass_def='200c')
     p_cib = ccl.halos.HaloProfileCIBShang12(concentration=c, nu_GHz=217,
@@ -220,6 +247,44 @@ def test_gnfw_refourier():
     assert p_f1 != p_f2
 
 
+def test_gnfw_template_cache():
+    p = ccl.halos.HaloProfilePressureGNFW(mass_def='200c')
+    p_f1 = p.fourier(COSMO, 1., 1E13, 1)
+    interp = p._fourier_interp
+    # Recently used templates are not recomputed.
+    p.update_parameters(alpha=1.32)
+    assert p._fourier_interp is not interp
+    p.update_parameters(alpha=1.33)
+    assert p._fourier_interp is interp
+    assert p.fourier(COSMO, 1., 1E13, 1) == p_f1
+
+
+def test_gnfw_fourier_template():
+    p = ccl.halos.HaloProfilePressureGNFW(mass_def='200c', x_out=6.)
+    k = np.geomspace(1E-2, 10, 32)
+    M = np.geomspace(1E13, 1E15, 4)
+    grids = [np.linspace(1.0, 1.6, 7), np.linspace(3.8, 4.4, 7),
+             np.linspace(0.2, 0.4, 5), np.linspace(1.5, 2.1, 7)]
+    p.use_fourier_template(grids)
+    p.update_parameters(alpha=1.27, beta=4.21, gamma=0.33, c500=1.71)
+    fk_templ = p.fourier(COSMO, k, M, 1.)
+    assert np.ndim(p.fourier(COSMO, 1., 1E13, 1.)) == 0
+
+    p_direct = ccl.halos.HaloProfilePressureGNFW(
+        mass_def='200c', x_out=6., alpha=1.27, beta=4.21, gamma=0.33,
+        c500=1.71)
+    fk_direct = p_direct.fourier(COSMO, k, M, 1.)
+    assert np.allclose(fk_templ, fk_direct, rtol=5E-3, atol=0)
+
+    # Changing the truncation radius discards the template.
+    p.update_parameters(x_out=5.)
+    assert p._fourier_template is None
+
+    # Templates must span all four shape parameters.
+    with pytest.raises(ValueError):
+        p.use_fourier_template(grids[:2])
+
+
 def test_hod_smoke():
     prof_class = ccl.halos.HaloProfileHOD
     c = ccl.halos.ConcentrationDuffy08(mass_def='200c')
@@ -583,6 +648,44 @@ def test_einasto_projected_accuracy():
     assert np.all(res2 < 6e-2)
 
 
+@pytest.mark.parametrize("prof_class,truncated", [
+    (ccl.halos.HaloProfileEinasto, False),
+    (ccl.halos.HaloProfileEinasto, True),
+    (ccl.halos.HaloProfileHernquist, False),
+    (ccl.halos.HaloProfileHernquist, True)])
+def test_fourier_template(prof_class, truncated):
+    cM = ccl.halos.ConcentrationDuffy08(mass_def='200c')
+    p = prof_class(mass_def='200c', concentration=cM, truncated=truncated)
+    M = np.geomspace(1E12, 1E15, 4)
+    a = 0.7
+    k = np.geomspace(1E-2, 10, 64)
+    fk_fftlog = p.fourier(COSMO, k, M, a)
+
+    p.use_fourier_template()
+    fk_templ = p.fourier(COSMO, k, M, a)
+    assert fk_templ.shape == fk_fftlog.shape
+    assert np.ndim(p.fourier(COSMO, 1., 1E13, a)) == 0
+    res = np.fabs(fk_templ - fk_fftlog) / M[:, None]
+    assert np.all(res < 5E-3)
+
+    # Shape parameters outside of the template grids raise an error.
+    if prof_class == ccl.halos.HaloProfileEinasto:
+        p.update_parameters(alpha=1.)
+        with pytest.raises(ValueError):
+            p.fourier(COSMO, k, M, a)
+
+
+def test_fourier_template_raises():
+    p = ccl.halos.HaloProfilePressureGNFW(mass_def='200c')
+    with pytest.raises(NotImplementedError):
+        p.use_fourier_template()
+
+    cM = ccl.halos.ConcentrationDuffy08(mass_def='200c')
+    p = ccl.halos.HaloProfileEinasto(mass_def='200c', concentration=cM)
+    with pytest.raises(ValueError):
+        p.use_fourier_template(param_grids=[[0.2]])
+
+
 def test_HaloProfile_abstractmethods():
     # Test that `HaloProfile` and its subclasses can't be instantiated if
     # either `_real` or `_fourier` have not been defined.
@@ -654,6 +757,38 @@ def test_IA_profile():
                                     integration_method="something_else")
 
 
+@pytest.mark.parametrize('method', ['FFTLog', 'simpson', 'spline'])
+def test_IA_profile_vectorized(method):
+    # Batched multipoles and masses match separate evaluations.
+    cosmo = ccl.CosmologyVanillaLCDM()
+    k_arr = np.geomspace(1E-2, 1e2, 64)
+    M_arr = np.geomspace(1E12, 1E15, 4)
+    cM = ccl.halos.ConcentrationDuffy08(mass_def="200m")
+    p = ccl.halos.SatelliteShearHOD(concentration=cM, mass_def="200m",
+                                    integration_method=method, N_r=128)
+    s_g = p._usat_fourier(cosmo, k_arr, M_arr, 1.)
+    assert s_g.shape == (len(M_arr), len(k_arr))
+    for M, s in zip(M_arr, s_g):
+        assert np.allclose(p._usat_fourier(cosmo, k_arr, M, 1.), s,
+                           atol=1E-4*np.amax(np.abs(s)), rtol=1E-4)
+
+    if method == 'FFTLog':
+        l_arr = np.array([2, 4, 6])
+        p_l = p._fftlog_wrap(cosmo, k_arr, M_arr, 1., ell=l_arr,
+                             fourier_out=True)
+        assert p_l.shape == (len(l_arr), len(M_arr), len(k_arr))
+        for l, pl in zip(l_arr, p_l):
+            assert np.allclose(p._fftlog_wrap(cosmo, k_arr, M_arr, 1.,
+                                              ell=int(l), fourier_out=True),
+                               pl, atol=0, rtol=1E-10)
+    else:
+        # The Bessel function table is reused.
+        p._usat_fourier(cosmo, k_arr, M_arr, 1.)
+        table = p._jn_table
+        p._usat_fourier(cosmo, k_arr[1:-1], M_arr, 1.)
+        assert p._jn_table is table
+
+
 def test_prefactor():
     cosmo = ccl.Cosmology(Omega_c=0.27, Omega_b=0.045, h=0.67,
                           sigma8=0.83, n_s=0.96)
@@ -63,3 +63,21 @@ def test_resample_extrapolation(extrap):
         f_arr_x_pred = f(r_arr_x)
         res = np.fabs(f_arr_x / f_arr_x_pred - 1)
         assert np.all(res[id_extrap] < 1E-10)
+
+
+def test_resample_2d():
+    r_arr_x = np.geomspace(0.01, 200, 64)
+    f_arr = np.array([R_ARR**tilt for tilt in [-1., -2., 0.5]])
+    f_arr_x = ccl.resample_array(R_ARR, f_arr, r_arr_x,
+                                 'logx_logy', 'constant', 0, 3)
+    assert f_arr_x.shape == (3, 64)
+    for f, fx in zip(f_arr, f_arr_x):
+        fx_1d = ccl.resample_array(R_ARR, f, r_arr_x,
+                                   'logx_logy', 'constant', 0, 3)
+        assert np.all(fx == fx_1d)
+    assert np.all(f_arr_x[:, r_arr_x > R_END] == 3)
+
+    with pytest.raises(ccl.CCLError):
+        ccl.resample_array(R_ARR, f_arr[:, :-1], r_arr_x)
+    with pytest.raises(ccl.CCLError):
+        ccl.resample_array(R_ARR, f_arr, r_arr_x)
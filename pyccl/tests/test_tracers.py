@@ -357,6 +357,59 @@ def test_tracer_magnification_kernel_spline_vs_gsl_intergation(z_min, z_max,
                            atol=1e-8, rtol=1e-5)
 
 
+@pytest.mark.parametrize('z_min', [0.0, 0.3])
+def test_lensing_kernels_batched(z_min):
+    z = np.linspace(z_min, 1., 2000)
+    nz = np.array([dndz(z), np.exp(-((z-0.7)/0.15)**2)])
+    s = 0.1 * np.ones_like(z)
+
+    chi, w = ccl.get_lensing_kernels(COSMO, z=z, nz=nz, mag_bias=s)
+    assert w.shape == (2, chi.size)
+    for n, wb in zip(nz, w):
+        chi_1, w_1 = ccl.get_lensing_kernel(COSMO, dndz=(z, n),
+                                            mag_bias=(z, s))
+        assert np.allclose(chi, chi_1, atol=0, rtol=1e-12)
+        assert np.allclose(wb, w_1, atol=1e-10, rtol=1e-4)
+
+    with pytest.raises(ValueError):
+        ccl.get_lensing_kernels(COSMO, z=z, nz=nz[:, :-1])
+
+
+@pytest.mark.parametrize('shift, stretch', [(0., 1.), (0.05, 1.), (0., 1.2)])
+def test_tracer_nz_transform(shift, stretch):
+    z = np.linspace(0., 1.5, 2000)
+    z_mean = 0.5  # dndz is symmetric around 0.5
+    n = dndz(z)
+    n_t = dndz(z_mean + (z - z_mean - shift) / stretch)
+    s = (z, 0.1 * np.ones_like(z))
+    b = (z, np.sqrt(1 + z))
+
+    for make in [
+            lambda nz: ccl.WeakLensingTracer(COSMO, dndz=(z, nz),
+                                             ia_bias=b),
+            lambda nz: ccl.NumberCountsTracer(COSMO, dndz=(z, nz), bias=b,
+                                              mag_bias=s, has_rsd=True)]:
+        tr = make(n).with_nz_transform(shift=shift, stretch=stretch)
+        kernels, _ = tr.get_kernel()
+        kernels_t, _ = make(n_t).get_kernel()
+        for w, w_t in zip(kernels, kernels_t):
+            assert np.allclose(w, w_t, atol=1e-4 * np.amax(np.fabs(w_t)),
+                               rtol=0)
+        assert np.allclose(tr.get_dndz(z), n_t / stretch)
+
+    # transforms are relative to the original N(z)
+    tr = ccl.WeakLensingTracer(COSMO, dndz=(z, n))
+    w0, _ = tr.get_kernel()
+    tr.with_nz_transform(shift=0.1).with_nz_transform(shift=0.)
+    w1, _ = tr.get_kernel()
+    assert np.allclose(w0[0], w1[0], atol=1e-4 * np.amax(w0[0]), rtol=0)
+
+    with pytest.raises(ValueError):
+        tr.with_nz_transform(stretch=-1)
+    with pytest.raises(ValueError):
+        tr.with_nz_transform(shift=10.)
+
+
 def test_tracer_delta_function_nz():
     z = np.linspace(0., 1., 2000)
     z_s_idx = int(z.size*0.8)
@@ -491,3 +544,27 @@ def test_tracer_repr():
     tr6.add_tracer(COSMO, transfer_ka=(a, lk, t_ka), extrap_order_lok=0)
     tr7.add_tracer(COSMO, transfer_ka=(a, lk, t_ka), extrap_order_lok=1)
     assert tr6 != tr7
+
+
+@pytest.mark.parametrize('c2_mg,lambda_mg', [(1., 0.), (1.1, 0.), (1., 1.),
+                                             (1.1, 1.)])
+def test_tracer_mg_transfer(c2_mg, lambda_mg):
+    from pyccl.modified_gravity import MuSigmaMG
+    cosmo = ccl.CosmologyVanillaLCDM(
+        transfer_function='bbks', matter_power_spectrum='linear',
+        mg_parametrization=MuSigmaMG(mu_0=0.1, sigma_0=0.2, c2_mg=c2_mg,
+                                     lambda_mg=lambda_mg))
+    z = np.linspace(0., 2., 64)
+    nz = np.exp(-0.5*((z-0.8)/0.2)**2)
+    tr = ccl.WeakLensingTracer(cosmo, dndz=(z, nz))
+
+    # Scale-independent Sigma gives a factorizable transfer function.
+    scale_independent = (c2_mg == 1) or (lambda_mg == 0)
+    assert tr._trc[0].transfer.is_factorizable == scale_independent
+
+    lk = np.log(np.geomspace(1E-3, 1, 8))
+    a = np.linspace(0.5, 1., 4)
+    sig = ccl.tracers._Sig_MG(cosmo, a, np.exp(lk)).reshape([a.size, -1],
+                                                            order='F')
+    assert np.allclose(tr.get_transfer(lk, a)[0], 1 + sig.T,
+                       atol=0, rtol=1E-3)
@@ -34,12 +34,13 @@ from . import ccllib as lib
 from .pyutils import check
 from .errors import CCLWarning
 from ._core.parameters import physical_constants
-from ._core import CCLObject, UnlockInstance, unlock_instance
+from ._core import CCLObject, unlock_instance
 from .pyutils import (_check_array_params, NoneArr, _vectorize_fn6,
                       _get_spline1d_arrays, _get_spline2d_arrays)
 
 
-__all__ = ("get_density_kernel", "get_lensing_kernel", "get_kappa_kernel",
+__all__ = ("get_density_kernel", "get_lensing_kernel", "get_lensing_kernels",
+           "get_kappa_kernel",
            "Tracer", "NzTracer", "NumberCountsTracer", "WeakLensingTracer",
            "CMBLensingTracer", "tSZTracer", "CIBTracer", "ISWTracer",)
 
@@ -168,6 +169,64 @@ def get_lensing_kernel(cosmo, *, dndz, mag_bias=None, n_chi=None):
     return chi, wchi
 
 
+def get_lensing_kernels(cosmo, *, z, nz, mag_bias=None, n_chi=None):
+    r"""Batched version of :func:`get_lensing_kernel` for a stack of
+    redshift distributions sampled on a common redshift grid (e.g.
+    tomographic bins, or realizations of the same bin drawn for
+    photo-z marginalization). The geometric part of the lensing kernel
+    integral is tabulated once on a :math:`(\chi, z)` grid, and the
+    kernels of all distributions are then obtained from a single matrix
+    product with the stack of normalized :math:`N(z)`.
+
+    .. note:: Integrals over redshift are carried out with the trapezoidal
+              rule on the input redshift grid, which should therefore be
+              reasonably well sampled.
+
+    Args:
+        cosmo (:class:`~pyccl.cosmology.Cosmology`): cosmology object used to
+            transform redshifts into distances.
+        z (`array`): redshift values at which all distributions are sampled,
+            in increasing order.
+        nz (`array`): array of shape ``(n_bins, z.size)`` containing the
+            redshift distributions. The units are arbitrary; each ``N(z)``
+            will be normalized to unity.
+        mag_bias (`array`): magnification bias :math:`s(z)` sampled at
+            ``z``. Must be broadcastable to the shape of ``nz``. If ``None``,
+            ``s=0`` will be assumed.
+        n_chi (:obj:`int`): number of samples in radial distance. If
+            ``None``, it is chosen as in :func:`get_lensing_kernel`.
+
+    Returns:
+        Tuple of arrays ``(chi, w_chi)``, where ``chi`` has size ``n_chi``
+        and ``w_chi`` has shape ``(n_bins, n_chi)``.
+    """
+    # we need the distance functions at the C layer
+    cosmo.compute_distances()
+
+    z_n = np.atleast_1d(np.asarray(z, dtype=float))
+    n = np.atleast_2d(np.asarray(nz, dtype=float))
+    if n.ndim != 2 or n.shape[-1] != z_n.size:
+        raise ValueError("`nz` must have shape (n_bins, z.size).")
+    has_magbias = mag_bias is not None
+    if has_magbias:
+        s = np.broadcast_to(mag_bias, n.shape).flatten()
+    else:
+        s = NoneArr
+    _check_background_spline_compatibility(cosmo, z_n)
+
+    if n_chi is None:
+        n_chi = lib.get_nchi_lensing_kernel_wrapper(z_n)
+
+    status = 0
+    chi, status = lib.get_chis_lensing_kernel_wrapper(cosmo.cosmo, z_n[-1],
+                                                      n_chi, status)
+    wchi, status = lib.get_lensing_kernel_multi_wrapper(
+        cosmo.cosmo, z_n, n.flatten(), int(has_magbias), s,
+        chi, len(n) * n_chi, status)
+    check(status, cosmo=cosmo)
+    return chi, wchi.reshape([len(n), n_chi])
+
+
 def get_kappa_kernel(cosmo, *, z_source, n_samples=100):
     """This convenience function returns the radial kernel for
     CMB-lensing-like tracers.
@@ -456,8 +515,19 @@ class Tracer(CCLObject):
         # Getting MG transfer function and building a k-array
         mg_transfer = self._get_MG_transfer_function(cosmo, z_b)
 
+        if len(mg_transfer) == 2:
+            # Scale-independent Sigma: the transfer function stays
+            # factorizable.
+            mg_transfer_a = mg_transfer
+            if bias_transfer_a is not None:
+                mg_transfer_a = (mg_transfer[0],
+                                 bias_transfer_a[1] * mg_transfer[1])
+            self.add_tracer(cosmo, kernel=kernel, transfer_a=mg_transfer_a,
+                            transfer_k=bias_transfer_k,
+                            der_bessel=der_bessel, der_angles=der_angles)
+
         # case with no astro biases
-        if ((bias_transfer_a is None) and (bias_transfer_k is None)):
+        elif ((bias_transfer_a is None) and (bias_transfer_k is None)):
             self.add_tracer(cosmo, kernel=kernel, transfer_ka=mg_transfer,
                             der_bessel=der_bessel, der_angles=der_angles)
 
@@ -492,7 +562,9 @@ class Tracer(CCLObject):
             taking into consideration the given sizes of the arrays for z and k
             The MG parameter array goes then as a multiplicative factor within
             the MG transfer function. If k is not specified then only a 1D
-            array for Sigma(a,k=0) is used.
+            array for Sigma(a,k=0) is used. If Sigma does not depend on k
+            (``lambda_mg = 0`` or ``c2_mg = 1``), the factorized transfer
+            function ``(a, t_a)`` is returned instead of ``(a, lk, t_ka)``.
 
         Args:
             cosmo (:class:`~pyccl.cosmology.Cosmology`): cosmology object used
@@ -520,6 +592,12 @@ class Tracer(CCLObject):
                 z = np.concatenate((z_0_to_zmin, z))
             a = 1./(1.+z)
         a.sort()
+        if cosmo['lambda_mg'] == 0 or cosmo['c2_mg'] == 1:
+            # Sigma(a,k) does not depend on k: return the factorized
+            # transfer function (a, 1 + Sigma(a)).
+            mg_transfer = (a, 1 + _Sig_MG(cosmo, a, np.ones(1)))
+            return mg_transfer
+
         # Scale-dependant MG case with an array of k
         nk = lib.get_pk_spline_nk(cosmo.cosmo)
         status = 0
@@ -722,6 +800,13 @@ class NzTracer(Tracer):
     :func:`NumberCountsTracer` and :func:`WeakLensingTracer`.
     """
 
+    def __init__(self):
+        super().__init__()
+        # Radial kernels that depend on the redshift distribution,
+        # stored as (tracer index, kernel type, kernel options).
+        self._nz_kernels = []
+        self._nz_cache = {}
+
     def get_dndz(self, z):
         """Get the redshift distribution for this tracer.
 
@@ -734,6 +819,105 @@ class NzTracer(Tracer):
         """
         return self._dndz(z)
 
+    @unlock_instance(mutate=False)
+    def _set_nz(self, cosmo, dndz):
+        """Store the redshift distribution used to build this tracer."""
+        from scipy.interpolate import interp1d
+        z_n, n = _check_array_params(dndz, 'dndz')
+        self._dndz = interp1d(z_n, n, bounds_error=False, fill_value=0)
+        self._nz_info = {"cosmo": cosmo, "z": z_n, "n": n}
+
+    @unlock_instance(mutate=False)
+    def _tag_nz_kernel(self, kind, **kwargs):
+        """Label the radial kernel of the last tracer added as dependent
+        on the redshift distribution (``kind`` is ``'density'`` or
+        ``'lensing'``).
+        """
+        self._nz_kernels.append((len(self._trc)-1, kind, kwargs))
+
+    def _get_nz_kernel(self, tr, kind, pz, mag_bias=None, factor=1.):
+        # Radial kernel for a normalized redshift distribution ``pz``,
+        # sampled on the original redshift grid. All the geometric
+        # quantities are computed once and cached.
+        info = self._nz_info
+        cosmo, z = info["cosmo"], info["z"]
+        if kind == "density":
+            if kind not in self._nz_cache:
+                a = 1./(1.+z)
+                chi = cosmo.comoving_radial_distance(a)
+                hz = (cosmo['h'] * cosmo.h_over_h0(a)
+                      / physical_constants.CLIGHT_HMPC)
+                self._nz_cache[kind] = chi, hz
+            chi, hz = self._nz_cache[kind]
+            return chi, hz * pz
+
+        chi, _ = _get_spline1d_arrays(tr.kernel.spline)
+        key = (kind, chi.size)
+        if key not in self._nz_cache:
+            status = 0
+            g, status = lib.get_lensing_kernel_weights_wrapper(
+                cosmo.cosmo, z, chi, chi.size * z.size, status)
+            check(status, cosmo=cosmo)
+            self._nz_cache[key] = g.reshape([chi.size, z.size])
+        if mag_bias is not None:
+            pz = pz * (1 - 2.5 * np.interp(z, *mag_bias))
+        return chi, factor * (self._nz_cache[key] @ pz)
+
+    @unlock_instance
+    def with_nz_transform(self, *, shift=0., stretch=1.):
+        r"""Update the radial kernels of this tracer for a shifted and
+        stretched version of its original redshift distribution:
+
+        .. math::
+            N'(z) = \frac{1}{s}\,N\left(\bar{z}+
+            \frac{z-\bar{z}-\Delta z}{s}\right),
+
+        where :math:`\bar{z}` is the mean redshift of the original
+        distribution, :math:`\Delta z` is the shift and :math:`s` is the
+        stretch. This is a fast path for photo-z marginalization: the
+        distance and lensing-geometry quantities are computed on the
+        first call and reused afterwards, and the kernel splines are
+        updated in place rather than rebuilt. Transfer functions (bias,
+        RSDs, intrinsic alignments, modified gravity) are not affected.
+
+        The transformation is always applied to the redshift distribution
+        this tracer was created with, not to the result of previous calls.
+        :math:`N'(z)` is evaluated on the original redshift grid, and
+        redshift integrals are carried out with the trapezoidal rule,
+        so results differ slightly from building a new tracer.
+
+        Args:
+            shift (:obj:`float`): redshift shift :math:`\Delta z`.
+            stretch (:obj:`float`): stretch factor :math:`s`.
+
+        Returns:
+            :class:`NzTracer`: this tracer, updated in place.
+        """
+        if not hasattr(self, "_nz_info"):
+            raise ValueError("This tracer does not store the redshift "
+                             "distribution needed to transform it.")
+        if stretch <= 0:
+            raise ValueError("stretch must be positive.")
+
+        from scipy.interpolate import interp1d
+        z, n0 = self._nz_info["z"], self._nz_info["n"]
+        norm0 = np.sum(0.5 * np.diff(z) * (n0[1:] + n0[:-1]))
+        z_mean = np.sum(0.5 * np.diff(z) * ((z*n0)[1:] + (z*n0)[:-1])) / norm0
+        n = np.interp(z_mean + (z - z_mean - shift) / stretch, z, n0,
+                      left=0., right=0.) / stretch
+        norm = np.sum(0.5 * np.diff(z) * (n[1:] + n[:-1]))
+        if not norm > 0:
+            raise ValueError("The transformed redshift distribution has "
+                             "no support over the original redshift range.")
+        self._dndz = interp1d(z, n, bounds_error=False, fill_value=0)
+
+        for itr, kind, kwargs in self._nz_kernels:
+            tr = self._trc[itr]
+            chi, w = self._get_nz_kernel(tr, kind, n / norm, **kwargs)
+            status = lib.cl_tracer_update_kernel(tr, chi, w, 0)
+            check(status)
+        return self
+
 
 def NumberCountsTracer(cosmo, *, dndz, bias=None, mag_bias=None,
                        has_rsd, n_samples=256):
@@ -773,10 +957,7 @@ def NumberCountsTracer(cosmo, *, dndz, bias=None, mag_bias=None,
     # we need the distance functions at the C layer
     cosmo.compute_distances()
 
-    from scipy.interpolate import interp1d
-    z_n, n = _check_array_params(dndz, 'dndz')
-    with UnlockInstance(tracer, mutate=False):
-        tracer._dndz = interp1d(z_n, n, bounds_error=False, fill_value=0)
+    tracer._set_nz(cosmo, dndz)
 
     kernel_d = None
     if bias is not None:  # Has density term
@@ -788,6 +969,7 @@ def NumberCountsTracer(cosmo, *, dndz, bias=None, mag_bias=None,
         # Reverse order for increasing a
         t_a = (1./(1+z_b[::-1]), b[::-1])
         tracer.add_tracer(cosmo, kernel=kernel_d, transfer_a=t_a)
+        tracer._tag_nz_kernel("density")
 
     if has_rsd:  # Has RSDs
         # Kernel
@@ -799,6 +981,7 @@ def NumberCountsTracer(cosmo, *, dndz, bias=None, mag_bias=None,
         t_a = (a_s, -cosmo.growth_rate(a_s))
         tracer.add_tracer(cosmo, kernel=kernel_d,
                           transfer_a=t_a, der_bessel=2)
+        tracer._tag_nz_kernel("density")
     if mag_bias is not None:  # Has magnification bias
         # Kernel
         chi, w = get_lensing_kernel(cosmo, dndz=dndz, mag_bias=mag_bias,
@@ -814,6 +997,9 @@ def NumberCountsTracer(cosmo, *, dndz, bias=None, mag_bias=None,
             z_b, _ = _check_array_params(dndz, 'dndz')
             tracer._MG_add_tracer(cosmo, kernel_m, z_b,
                                   der_bessel=-1, der_angles=1)
+        tracer._tag_nz_kernel("lensing", factor=-2.,
+                              mag_bias=_check_array_params(mag_bias,
+                                                           'mag_bias'))
     return tracer
 
 
@@ -849,10 +1035,8 @@ def WeakLensingTracer(cosmo, *, dndz, has_shear=True, ia_bias=None,
     # we need the distance functions at the C layer
     cosmo.compute_distances()
 
-    from scipy.interpolate import interp1d
-    z_n, n = _check_array_params(dndz, 'dndz')
-    with UnlockInstance(tracer, mutate=False):
-        tracer._dndz = interp1d(z_n, n, bounds_error=False, fill_value=0)
+    tracer._set_nz(cosmo, dndz)
+    z_n = tracer._nz_info["z"]
 
     if has_shear:
         kernel_l = get_lensing_kernel(cosmo, dndz=dndz, n_chi=n_samples)
@@ -864,6 +1048,7 @@ def WeakLensingTracer(cosmo, *, dndz, has_shear=True, ia_bias=None,
             # MG case
             tracer._MG_add_tracer(cosmo, kernel_l, z_n,
                                   der_bessel=-1, der_angles=2)
+        tracer._tag_nz_kernel("lensing")
     if ia_bias is not None:  # Has intrinsic alignments
         z_a, tmp_a = _check_array_params(ia_bias, 'ia_bias')
         # Kernel
@@ -885,6 +1070,7 @@ def WeakLensingTracer(cosmo, *, dndz, has_shear=True, ia_bias=None,
         t_a = (1./(1+z_a[::-1]), a[::-1])
         tracer.add_tracer(cosmo, kernel=kernel_i, transfer_a=t_a,
                           der_bessel=-1, der_angles=2)
+        tracer._tag_nz_kernel("density")
     return tracer
 
 
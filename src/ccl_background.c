@@ -47,6 +47,51 @@ static double h_over_h0(double a, ccl_cosmology * cosmo, int *status)
      Om_mass_nu * a*a*a) / (a*a*a));
 }
 
+/* --------- ROUTINE: h_over_h0_E ---------
+INPUT: scale factor, cosmology, E(a) spline (may be NULL)
+TASK: Compute E(a)=H(a)/H0, interpolating the E(a) spline if one is passed
+      and a is within its range, and computing it analytically otherwise.
+*/
+static double h_over_h0_E(double a, ccl_cosmology * cosmo, gsl_spline * E, int *status)
+{
+  double hnorm;
+
+  // Note: gsl_spline_eval_e returns an error outside of the spline range
+  if ((E != NULL) && (gsl_spline_eval_e(E, a, NULL, &hnorm) == GSL_SUCCESS))
+    return hnorm;
+  return h_over_h0(a, cosmo, status);
+}
+
+/* --------- ROUTINE: background_E_spline ---------
+INPUT: cosmology
+TASK: Return the E(a) spline to be used in background integrals, or NULL if
+      E(a) should be computed analytically.
+*/
+static gsl_spline * background_E_spline(ccl_cosmology * cosmo)
+{
+  if (cosmo->gsl_params.BACKGROUND_E_SPLINE && cosmo->computed_distances)
+    return cosmo->data.E;
+  return NULL;
+}
+
+/* --------- ROUTINE: omega_m_from_E ---------
+INPUT: scale factor, E(a), cosmology
+TASK: Compute Omega_m(a) given E(a), calling the massive neutrino density
+      function at most once.
+*/
+static double omega_m_from_E(double a, double hnorm, ccl_cosmology * cosmo, int *status)
+{
+  double OmNuh2 = 0;
+
+  if ((cosmo->params.N_nu_mass)>1e-12) {
+    OmNuh2 = ccl_Omeganuh2(a, cosmo->params.N_nu_mass, cosmo->params.m_nu,
+                           cosmo->params.T_CMB, cosmo->params.T_ncdm, status);
+  }
+
+  return (cosmo->params.Omega_c + cosmo->params.Omega_b) / (a*a*a) / hnorm / hnorm +
+      OmNuh2 / (cosmo->params.h) / (cosmo->params.h) / hnorm / hnorm;
+}
+
 /* --------- ROUTINE: ccl_omega_x ---------
 INPUT: cosmology object, scale factor, species label
 TASK: Compute the density relative to critical, Omega(a) for a given species.
@@ -131,6 +176,7 @@ double ccl_rho_x(ccl_cosmology * cosmo, double a, ccl_species_x_label label, int
 // Structure to hold parameters of chi_integrand
 typedef struct {
   ccl_cosmology *cosmo;
+  gsl_spline *E;
   int * status;
 } chipar;
 
@@ -141,9 +187,41 @@ TASK: compute the integrand of the comoving distance
 static double chi_integrand(double a, void * params_void)
 {
   ccl_cosmology * cosmo = ((chipar *)params_void)->cosmo;
+  gsl_spline * E = ((chipar *)params_void)->E;
   int *status = ((chipar *)params_void)->status;
 
-  return ccl_constants.CLIGHT_HMPC/(a*a*h_over_h0(a, cosmo, status));
+  return ccl_constants.CLIGHT_HMPC/(a*a*h_over_h0_E(a, cosmo, E, status));
+}
+
+// Structure to hold parameters of the growth ODE systems
+typedef struct {
+  ccl_cosmology *cosmo;
+  gsl_spline *E;
+  double k;
+} growthpar;
+
+/* --------- ROUTINE: mu_MG_from_E ---------
+INPUT: scale factor, wavenumber, E(a), cosmology
+TASK: Compute mu(a,k) given E(a). This is the same as ccl_mu_MG, but does not
+      need the distance splines, so it can be evaluated at any scale factor.
+*/
+static double mu_MG_from_E(double a, double k, double hnorm, ccl_cosmology * cosmo)
+{
+  double s1_k, s2_k, om_l;
+
+  if (k==0.0) {
+    s1_k = cosmo->params.c1_mg;
+  }
+  else {
+    s2_k = cosmo->params.lambda_mg*(hnorm*cosmo->params.H0)/k/(ccl_constants.CLIGHT/1000);
+    s1_k = (1.0+cosmo->params.c1_mg*s2_k*s2_k)/(1.0+s2_k*s2_k);
+  }
+  om_l =
+    cosmo->params.Omega_l *
+    pow(a,-3 * (1 + cosmo->params.w0 + cosmo->params.wa)) *
+    exp(3 * cosmo->params.wa * (a-1)) / hnorm / hnorm;
+
+  return cosmo->params.mu_0 * om_l / cosmo->params.Omega_l * s1_k;
 }
 
 /* --------- ROUTINE: growth_ode_system ---------
@@ -153,10 +231,11 @@ TASK: Define the ODE system to be solved in order to compute the growth (of the
 static int growth_ode_system(double a,const double y[],double dydt[],void *params)
 {
   int status = 0;
-  ccl_cosmology * cosmo = params;
+  ccl_cosmology * cosmo = ((growthpar *)params)->cosmo;
+  gsl_spline * E = ((growthpar *)params)->E;
 
-  double hnorm=h_over_h0(a,cosmo, &status);
-  double om=ccl_omega_x(cosmo, a, ccl_species_m_label, &status);
+  double hnorm=h_over_h0_E(a, cosmo, E, &status);
+  double om=omega_m_from_E(a, hnorm, cosmo, &status);
 
   dydt[1]=1.5*hnorm*a*om*y[0];
   dydt[0]=y[1]/(a*a*a*hnorm);
@@ -172,12 +251,14 @@ TASK: Define the ODE system to be solved in order to compute the growth (of the
 static int growth_ode_system_muSig(double a,const double y[],double dydt[],void *params)
 {
   int status = 0;
-/* for MG mu(a,k) we set k=0 since it is large scales */
-  ccl_cosmology * cosmo = params;
+/* for the scale-independent growth, k=0 since it is large scales */
+  ccl_cosmology * cosmo = ((growthpar *)params)->cosmo;
+  gsl_spline * E = ((growthpar *)params)->E;
+  double k = ((growthpar *)params)->k;
 
-  double hnorm=h_over_h0(a,cosmo, &status);
-  double om=ccl_omega_x(cosmo, a, ccl_species_m_label, &status);
-  double mu = ccl_mu_MG(cosmo, a, 0.0, &status);
+  double hnorm=h_over_h0_E(a, cosmo, E, &status);
+  double om=omega_m_from_E(a, hnorm, cosmo, &status);
+  double mu = mu_MG_from_E(a, k, hnorm, cosmo);
 
   dydt[1]=1.5*hnorm*a*om*y[0]*(1. + mu);
 
@@ -202,100 +283,87 @@ static double df_integrand(double a,void * spline_void)
 }
 
 /* --------- ROUTINE: growth_factor_and_growth_rate ---------
-INPUT: scale factor, cosmology
+INPUT: wavenumber, array of increasing scale factors, cosmology
 TASK: compute the growth (D(z)) and the growth rate, logarithmic derivative (f?)
+      at all the scale factors a[0..na-1], for the wavenumber k (k=0 for the
+      scale-independent growth). The ODE is integrated once, from
+      EPS_SCALEFAC_GROWTH to a[na-1], stopping at each a[i] on the way.
+      Returns CCL_ERROR_INTEG if the integration fails.
 */
-
-static int growth_factor_and_growth_rate(double a, double *gf, double *fg, ccl_cosmology *cosmo, int *stat)
+static int growth_factor_and_growth_rate(double k, int na, double *a, double *gf, double *fg,
+                                         ccl_cosmology *cosmo, int *stat)
 {
-  if(a < cosmo->gsl_params.EPS_SCALEFAC_GROWTH) {
-    *gf = a;
-    *fg = 1;
-    return 0;
-  }
-  else {
-    int gslstatus;
-    double y[2];
-    double ainit = cosmo->gsl_params.EPS_SCALEFAC_GROWTH;
+  int gslstatus = GSL_SUCCESS;
+  double y[2];
+  double ainit = cosmo->gsl_params.EPS_SCALEFAC_GROWTH;
+  gsl_spline *E = background_E_spline(cosmo);
+  growthpar p;
 
-    // if mu0 == 0, call normal growth_ode_system, otherwise call growth_ode_system_muSig
-    if (cosmo->params.mu_0 > 1e-12 || cosmo->params.mu_0 < -1e-12) {
-      gsl_odeiv2_system sys = {growth_ode_system_muSig, NULL, 2, cosmo};
+  p.cosmo = cosmo;
+  p.E = E;
+  p.k = k;
 
-      gsl_odeiv2_driver *d = gsl_odeiv2_driver_alloc_y_new(
-        &sys, gsl_odeiv2_step_rkck,
-        0.1*cosmo->gsl_params.EPS_SCALEFAC_GROWTH, 0, cosmo->gsl_params.ODE_GROWTH_EPSREL);
+  // if mu0 == 0, call normal growth_ode_system, otherwise call growth_ode_system_muSig
+  gsl_odeiv2_system sys = {growth_ode_system, NULL, 2, &p};
+  if (cosmo->params.mu_0 > 1e-12 || cosmo->params.mu_0 < -1e-12)
+    sys.function = growth_ode_system_muSig;
 
-      if (d == NULL) {
-        return CCL_ERROR_MEMORY;
-      }
+  gsl_odeiv2_driver *d = gsl_odeiv2_driver_alloc_y_new(
+    &sys, gsl_odeiv2_step_rkck,
+    0.1*cosmo->gsl_params.EPS_SCALEFAC_GROWTH, 0, cosmo->gsl_params.ODE_GROWTH_EPSREL);
 
-      y[0] = cosmo->gsl_params.EPS_SCALEFAC_GROWTH;
-      y[1] = (
-        cosmo->gsl_params.EPS_SCALEFAC_GROWTH *
-        cosmo->gsl_params.EPS_SCALEFAC_GROWTH *
-        cosmo->gsl_params.EPS_SCALEFAC_GROWTH *
-        h_over_h0(cosmo->gsl_params.EPS_SCALEFAC_GROWTH, cosmo, stat));
-
-      gslstatus = gsl_odeiv2_driver_apply(d, &ainit, a, y);
-      gsl_odeiv2_driver_free(d);
+  if (d == NULL) {
+    return CCL_ERROR_MEMORY;
+  }
 
-      if(gslstatus != GSL_SUCCESS) {
-        ccl_raise_gsl_warning(gslstatus, "ccl_background.c: growth_factor_and_growth_rate():");
-        return 0;
-      }
+  y[0] = cosmo->gsl_params.EPS_SCALEFAC_GROWTH;
+  y[1] = (
+    cosmo->gsl_params.EPS_SCALEFAC_GROWTH *
+    cosmo->gsl_params.EPS_SCALEFAC_GROWTH *
+    cosmo->gsl_params.EPS_SCALEFAC_GROWTH *
+    h_over_h0(cosmo->gsl_params.EPS_SCALEFAC_GROWTH, cosmo, stat));
 
-      *gf = y[0];
-      *fg = y[1]/(a*a*h_over_h0(a, cosmo, stat)*y[0]);
-      return 0;
+  for (int i=0; i<na; i++) {
+    if (a[i] < cosmo->gsl_params.EPS_SCALEFAC_GROWTH) {
+      gf[i] = a[i];
+      fg[i] = 1;
+      continue;
     }
-    else {
-      gsl_odeiv2_system sys = {growth_ode_system, NULL, 2, cosmo};
 
-      gsl_odeiv2_driver *d = gsl_odeiv2_driver_alloc_y_new(
-        &sys, gsl_odeiv2_step_rkck,
-        0.1*cosmo->gsl_params.EPS_SCALEFAC_GROWTH, 0, cosmo->gsl_params.ODE_GROWTH_EPSREL);
+    // The driver keeps its state, so each step continues from the last one
+    if ((gslstatus == GSL_SUCCESS) && (a[i] > ainit))
+      gslstatus = gsl_odeiv2_driver_apply(d, &ainit, a[i], y);
 
-      if (d == NULL) {
-        return CCL_ERROR_MEMORY;
-      }
-
-      y[0] = cosmo->gsl_params.EPS_SCALEFAC_GROWTH;
-      y[1] = (
-        cosmo->gsl_params.EPS_SCALEFAC_GROWTH *
-        cosmo->gsl_params.EPS_SCALEFAC_GROWTH *
-        cosmo->gsl_params.EPS_SCALEFAC_GROWTH*
-        h_over_h0(cosmo->gsl_params.EPS_SCALEFAC_GROWTH, cosmo, stat));
-
-      gslstatus = gsl_odeiv2_driver_apply(d, &ainit, a, y);
-      gsl_odeiv2_driver_free(d);
-
-      if(gslstatus != GSL_SUCCESS) {
-        ccl_raise_gsl_warning(gslstatus, "ccl_background.c: growth_factor_and_growth_rate():");
-        return 0;
-      }
-
-      *gf = y[0];
-      *fg = y[1]/(a*a*h_over_h0(a, cosmo, stat)*y[0]);
+    gf[i] = y[0];
+    fg[i] = y[1]/(a[i]*a[i]*h_over_h0_E(a[i], cosmo, E, stat)*y[0]);
+  }
+  gsl_odeiv2_driver_free(d);
 
-      return 0;
-    }
+  // A failed step leaves all the later nodes at the last solution, so this
+  // must be reported as an error.
+  if(gslstatus != GSL_SUCCESS) {
+    ccl_raise_gsl_warning(gslstatus, "ccl_background.c: growth_factor_and_growth_rate():");
+    return CCL_ERROR_INTEG;
   }
+
+  return 0;
 }
 
 
-/* --------- ROUTINE: compute_chi ---------
-INPUT: scale factor, cosmology
+/* --------- ROUTINE: compute_chi_E ---------
+INPUT: scale factor, cosmology, E(a) spline (may be NULL)
 OUTPUT: chi -> radial comoving distance
-TASK: compute radial comoving distance at a
+TASK: compute radial comoving distance at a, evaluating E(a) from the
+      spline if one is passed.
 */
-void compute_chi(double a, ccl_cosmology *cosmo, double * chi, int * stat)
+static void compute_chi_E(double a, ccl_cosmology *cosmo, gsl_spline *E, double * chi, int * stat)
 {
   int gslstatus;
   double result;
   chipar p;
 
   p.cosmo=cosmo;
+  p.E=E;
   p.status=stat;
 
   gsl_integration_cquad_workspace * workspace = NULL;
@@ -323,11 +391,22 @@ void compute_chi(double a, ccl_cosmology *cosmo, double * chi, int * stat)
   gsl_integration_cquad_workspace_free(workspace);
 }
 
+/* --------- ROUTINE: compute_chi ---------
+INPUT: scale factor, cosmology
+OUTPUT: chi -> radial comoving distance
+TASK: compute radial comoving distance at a
+*/
+void compute_chi(double a, ccl_cosmology *cosmo, double * chi, int * stat)
+{
+  compute_chi_E(a, cosmo, background_E_spline(cosmo), chi, stat);
+}
+
 
 //Root finding for a(chi)
 typedef struct {
   double chi;
   ccl_cosmology *cosmo;
+  gsl_spline *E;
   int * status;
 } Fpar;
 
@@ -336,7 +415,7 @@ static double fzero(double a,void *params)
   double chi,chia,a_use=a;
 
   chi=((Fpar *)params)->chi;
-  compute_chi(a_use,((Fpar *)params)->cosmo,&chia, ((Fpar *)params)->status);
+  compute_chi_E(a_use,((Fpar *)params)->cosmo,((Fpar *)params)->E,&chia, ((Fpar *)params)->status);
 
   return chi-chia;
 }
@@ -348,6 +427,7 @@ static double dfzero(double a,void *params)
 
   chipar p;
   p.cosmo=cosmo;
+  p.E=((Fpar *)params)->E;
   p.status=stat;
 
   return chi_integrand(a,&p)/cosmo->params.h;
@@ -360,14 +440,14 @@ static void fdfzero(double a,void *params,double *f,double *df)
 }
 
 /* --------- ROUTINE: a_of_chi ---------
-INPUT: comoving distance chi, cosmology, stat, a_old, gsl_root_fdfsolver
+INPUT: comoving distance chi, cosmology, E(a) spline (may be NULL), stat, a_old, gsl_root_fdfsolver
 OUTPUT: scale factor
 TASK: compute the scale factor that corresponds to a given comoving distance chi
 Note: This routine uses a root solver to find an a such that compute_chi(a) = chi.
 The root solver uses the derivative of compute_chi (which is chi_integrand) and
 the value itself.
 */
-static void a_of_chi(double chi, ccl_cosmology *cosmo, int* stat, double *a_old, gsl_root_fdfsolver *s)
+static void a_of_chi(double chi, ccl_cosmology *cosmo, gsl_spline *E, int* stat, double *a_old, gsl_root_fdfsolver *s)
 {
   if(chi==0) {
     *a_old=1;
@@ -379,6 +459,7 @@ static void a_of_chi(double chi, ccl_cosmology *cosmo, int* stat, double *a_old,
 
     p.cosmo=cosmo;
     p.chi=chi;
+    p.E=E;
     p.status=stat;
     FDF.f=&fzero;
     FDF.df=&dfzero;
@@ -468,10 +549,13 @@ void ccl_cosmology_compute_distances(ccl_cosmology * cosmo, int *status)
     }
   }
 
+  // If requested, use the E(a) spline just created in the distance integrals
+  gsl_spline * E_integ = cosmo->gsl_params.BACKGROUND_E_SPLINE ? E : NULL;
+
   // Compute chi(a)
   if (!*status){
     for (int i=0; i<na; i++)
-      compute_chi(a[i], cosmo, &chi_a[i], status);
+      compute_chi_E(a[i], cosmo, E_integ, &chi_a[i], status);
     if (*status){
       *status = CCL_ERROR_INTEG;
       ccl_cosmology_set_status_message(
@@ -492,6 +576,7 @@ void ccl_cosmology_compute_distances(ccl_cosmology * cosmo, int *status)
     gsl_spline_free(E); // Note: you are allowed to call gsl_free() on NULL
     gsl_spline_free(chi);
     E = NULL;
+    E_integ = NULL;
     chi = NULL;
   }
 
@@ -551,7 +636,7 @@ void ccl_cosmology_compute_distances(ccl_cosmology * cosmo, int *status)
     for(int i=1;i<na-1;i++) {
       // we are using the previous value as a guess here to help the root finder
       // as long as we use small steps in a this should be fine
-      a_of_chi(chi_a[i],cosmo, status, &a0, s);
+      a_of_chi(chi_a[i],cosmo, E_integ, status, &a0, s);
       a[i]=a0;
     }
     if(*status) {
@@ -765,6 +850,13 @@ void ccl_cosmology_compute_growth(ccl_cosmology* cosmo, int* status)
   if (cosmo->computed_growth)
     return;
 
+  // The growth ODEs use the E(a) spline if requested, so compute it first
+  if (cosmo->gsl_params.BACKGROUND_E_SPLINE) {
+    ccl_cosmology_compute_distances(cosmo, status);
+    if (*status)
+      return;
+  }
+
   // Create logarithmically and then linearly-spaced values of the scale factor
   int chistatus = 0, na = cosmo->spline_params.A_SPLINE_NA+cosmo->spline_params.A_SPLINE_NLOG-1;
   double *a = NULL;
@@ -901,13 +993,21 @@ void ccl_cosmology_compute_growth(ccl_cosmology* cosmo, int* status)
   }
 
   if (*status == 0) {
+    // Get the growth factor and growth rate at all redshifts in a single
+    // integration of the growth ODE
+    chistatus |= growth_factor_and_growth_rate(0., na, a, y, y2, cosmo, status);
+
     // Get the growth factor and growth rate at z=0
-    chistatus |= growth_factor_and_growth_rate(1., &growth0, &fgrowth0, cosmo, status);
+    if (a[na-1] == 1.) {
+      growth0 = y[na-1];
+      fgrowth0 = y2[na-1];
+    }
+    else {
+      double a1 = 1.;
+      chistatus |= growth_factor_and_growth_rate(0., 1, &a1, &growth0, &fgrowth0, cosmo, status);
+    }
 
-    // Get the growth factor and growth rate at other redshifts
     for(int i=0; i<na; i++) {
-      chistatus |= growth_factor_and_growth_rate(a[i], &(y[i]), &(y2[i]), cosmo, status);
-
       if(cosmo->params.has_mgrowth) {
         if(a[i]>0) {
           // Add modification to f
@@ -1402,3 +1502,46 @@ void ccl_growth_rates(ccl_cosmology * cosmo, int na, double a[], double output[]
     *status |= _status;
   }
 }
+
+/* ----- ROUTINE: ccl_scale_dependent_growths ------
+INPUT: cosmology, array of increasing scale factors, array of wavenumbers
+TASK: compute the scale-dependent growth factor D(k,a) and growth rate f(k,a)
+      by integrating the growth ODE once per wavenumber. D(k,a) is normalized
+      by the large-scale (k=0) growth factor today. Output arrays have size
+      na*nk, with the scale factor varying fastest.
+*/
+void ccl_scale_dependent_growths(ccl_cosmology * cosmo, int na, double a[], int nk, double k[],
+                                 double growth[], double fgrowth[], int * status)
+{
+  int chistatus = 0;
+  double a1 = 1., growth0, fgrowth0;
+
+  for (int i=1; i<na; i++) {
+    if (a[i] < a[i-1]) {
+      *status = CCL_ERROR_INCONSISTENT;
+      ccl_cosmology_set_status_message(
+        cosmo, "ccl_background.c: ccl_scale_dependent_growths(): scale factors must be increasing\n");
+      return;
+    }
+  }
+  if ((na > 0) && (a[na-1] > 1.)) {
+    *status = CCL_ERROR_COMPUTECHI;
+    ccl_cosmology_set_status_message(
+      cosmo, "ccl_background.c: ccl_scale_dependent_growths(): scale factor cannot be larger than 1.\n");
+    return;
+  }
+
+  chistatus |= growth_factor_and_growth_rate(0., 1, &a1, &growth0, &fgrowth0, cosmo, status);
+  for (int j=0; j<nk; j++) {
+    chistatus |= growth_factor_and_growth_rate(k[j], na, a, &(growth[j*na]), &(fgrowth[j*na]),
+                                               cosmo, status);
+    for (int i=0; i<na; i++)
+      growth[i+j*na] /= growth0;
+  }
+
+  if (chistatus) {
+    *status = CCL_ERROR_INTEG;
+    ccl_cosmology_set_status_message(
+      cosmo, "ccl_background.c: ccl_scale_dependent_growths(): integral for linear growth factor didn't converge\n");
+  }
+}
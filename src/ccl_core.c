@@ -79,7 +79,8 @@ ccl_gsl_params ccl_user_gsl_params = {
   GSL_EPSREL_GROWTH,                   // ODE_GROWTH_EPSREL
   1E-6,                                // EPS_SCALEFAC_GROWTH
   true,                                // NZ_NORM_SPLINE_INTEGRATION
-  true                                 // LENSING_KERNEL_SPLINE_INTEGRATION
+  true,                                // LENSING_KERNEL_SPLINE_INTEGRATION
+  false                                // BACKGROUND_E_SPLINE
   };
 
 #undef GSL_EPSREL
@@ -9,6 +9,7 @@
 #include <gsl/gsl_spline.h>
 #include <gsl/gsl_sf_bessel.h>
 #include <gsl/gsl_sf_legendre.h>
+#include <gsl/gsl_blas.h>
 
 #include "ccl.h"
 
@@ -42,123 +43,165 @@ static int taper_cl(int n_ell,double *ell,double *cl, double *ell_limits)
 TASK: For a given tracer, get the correlation function
       Following function takes a function to calculate angular cl as well.
       By default above function will call it using ccl_angular_cl
+      Several power spectra sampled at the same ells (n_cls of them,
+      stored contiguously in cls) are transformed with a single FFTLog call.
 INPUT: type of tracer, number of theta values to evaluate = NL, theta vector
  */
 static void ccl_tracer_corr_fftlog(ccl_cosmology *cosmo,
-                                   int n_ell,double *ell,double *cls,
+                                   int n_ell,double *ell,
+                                   int n_cls,double *cls,
                                    int n_theta,double *theta,double *wtheta,
                                    int corr_type,int do_taper_cl,double *taper_cl_limits,
                                    int *status) {
   int i;
-  double *l_arr,*cl_arr,*th_arr,*wth_arr;
+  int n_l=cosmo->spline_params.N_ELL_CORR;
+  double *l_arr=NULL,*cl_arr=NULL,*th_arr=NULL,*wth_arr=NULL;
+  double **cl_ptr=NULL,**wth_ptr=NULL;
 
-  l_arr=ccl_log_spacing(cosmo->spline_params.ELL_MIN_CORR,cosmo->spline_params.ELL_MAX_CORR,cosmo->spline_params.N_ELL_CORR);
+  l_arr=ccl_log_spacing(cosmo->spline_params.ELL_MIN_CORR,cosmo->spline_params.ELL_MAX_CORR,n_l);
   if(l_arr==NULL) {
     *status=CCL_ERROR_LINSPACE;
-    ccl_cosmology_set_status_message(cosmo, "ccl_correlation.c: ccl_tracer_corr_fftlog(): ran out of memory\n");
+    ccl_cosmology_set_status_message(cosmo, "ccl_correlation.c: ccl_tracer_corr_fftlog(): "
+                                     "could not create the multipole array\n");
     return;
   }
-  cl_arr=malloc(cosmo->spline_params.N_ELL_CORR*sizeof(double));
-  if(cl_arr==NULL) {
-    free(l_arr);
+  cl_arr=malloc(n_cls*n_l*sizeof(double));
+  th_arr=malloc(n_l*sizeof(double));
+  wth_arr=malloc(n_cls*n_l*sizeof(double));
+  cl_ptr=malloc(n_cls*sizeof(double *));
+  wth_ptr=malloc(n_cls*sizeof(double *));
+  if((cl_arr==NULL) || (th_arr==NULL) || (wth_arr==NULL) ||
+     (cl_ptr==NULL) || (wth_ptr==NULL)) {
     *status=CCL_ERROR_MEMORY;
     ccl_cosmology_set_status_message(cosmo, "ccl_correlation.c: ccl_tracer_corr_fftlog(): ran out of memory\n");
-    return;
   }
 
-  //Interpolate input Cl into array needed for FFTLog
-  ccl_f1d_t *cl_spl=ccl_f1d_t_new(n_ell,ell,cls,cls[0],0,
-				  ccl_f1d_extrap_const,
-				  ccl_f1d_extrap_logx_logy,
-				  status);
-  if (*status) {
-    free(l_arr);
-    free(cl_arr);
-    ccl_cosmology_set_status_message(cosmo,
-                                     "ccl_correlation.c: ccl_tracer_corr_fftlog(): "
-                                     "failed to create spline\n");
-    if (cl_spl) ccl_f1d_t_free(cl_spl);
-    return;
-  }
+  //Interpolate input Cls into arrays needed for FFTLog
+  if(*status==0) {
+#pragma omp parallel default(none) \
+                     shared(n_ell, ell, n_cls, cls, n_l, l_arr, cl_arr, \
+                            cl_ptr, wth_arr, wth_ptr, \
+                            do_taper_cl, taper_cl_limits, status)
+    {
+      int local_status=0;
+
+      #pragma omp for schedule(dynamic)
+      for(int j=0; j<n_cls; j++) {
+        double *cl_in=&(cls[j*n_ell]);
+        double *cl_out=&(cl_arr[j*n_l]);
+        int is_zero=1;
+
+        cl_ptr[j]=cl_out;
+        wth_ptr[j]=&(wth_arr[j*n_l]);
+
+        for(int ii=0; ii<n_ell; ii++) {
+          if(cl_in[ii]!=0) {
+            is_zero=0;
+            break;
+          }
+        }
+        if(is_zero || local_status) {
+          //Vanishing power spectra need no spline
+          for(int ii=0; ii<n_l; ii++)
+            cl_out[ii]=0;
+          continue;
+        }
 
-  if(cl_spl==NULL) {
-    free(l_arr);
-    free(cl_arr);
-    *status=CCL_ERROR_MEMORY;
-    ccl_cosmology_set_status_message(cosmo,
-				     "ccl_correlation.c: ccl_tracer_corr_fftlog(): "
-				     "ran out of memory\n");
-    return;
-  }
+        ccl_f1d_t *cl_spl=ccl_f1d_t_new(n_ell,ell,cl_in,cl_in[0],0,
+                                        ccl_f1d_extrap_const,
+                                        ccl_f1d_extrap_logx_logy,
+                                        &local_status);
+        if(cl_spl==NULL) {
+          if(local_status==0)
+            local_status=CCL_ERROR_SPLINE;
+          continue;
+        }
+        for(int ii=0; ii<n_l; ii++)
+          cl_out[ii]=ccl_f1d_t_eval(cl_spl,l_arr[ii]);
+        ccl_f1d_t_free(cl_spl);
 
-  for(i=0;i<cosmo->spline_params.N_ELL_CORR;i++)
-    cl_arr[i]=ccl_f1d_t_eval(cl_spl,l_arr[i]);
-  ccl_f1d_t_free(cl_spl);
+        if (do_taper_cl)
+          taper_cl(n_l,l_arr,cl_out,taper_cl_limits);
+      }
 
-  if (do_taper_cl)
-    taper_cl(cosmo->spline_params.N_ELL_CORR,l_arr,cl_arr,taper_cl_limits);
+      if(local_status) {
+        #pragma omp atomic write
+        *status=local_status;
+      }
+    } //end omp parallel
 
-  th_arr=malloc(sizeof(double)*cosmo->spline_params.N_ELL_CORR);
-  if(th_arr==NULL) {
-    free(l_arr);
-    free(cl_arr);
-    *status=CCL_ERROR_MEMORY;
-    ccl_cosmology_set_status_message(cosmo,
-                                     "ccl_correlation.c: ccl_tracer_corr_fftlog(): "
-                                     "ran out of memory\n");
-    return;
+    if(*status) {
+      ccl_cosmology_set_status_message(cosmo,
+                                       "ccl_correlation.c: ccl_tracer_corr_fftlog(): "
+                                       "failed to create the power spectrum splines\n");
+    }
   }
-  wth_arr=(double *)malloc(sizeof(double)*cosmo->spline_params.N_ELL_CORR);
-  if(wth_arr==NULL) {
-    free(l_arr);
-    free(cl_arr);
-    free(th_arr);
-    *status=CCL_ERROR_MEMORY;
-    ccl_cosmology_set_status_message(cosmo,
-                                     "ccl_correlation.c: ccl_tracer_corr_fftlog(): "
-                                     "ran out of memory\n");
-    return;
+
+  if(*status==0) {
+    for(i=0;i<n_l;i++)
+      th_arr[i]=0;
+    //Although set here to 0, theta is modified by FFTlog to obtain the correlation at ~1/l
+
+    int i_bessel=0;
+    if(corr_type==CCL_CORR_GG) i_bessel=0;
+    if(corr_type==CCL_CORR_GL) i_bessel=2;
+    if(corr_type==CCL_CORR_LP) i_bessel=0;
+    if(corr_type==CCL_CORR_LM) i_bessel=4;
+    ccl_fftlog_ComputeXi2D(i_bessel,0,
+                           n_cls,n_l,l_arr,cl_ptr,
+                           th_arr,wth_ptr,status);
+    if(*status) {
+      ccl_cosmology_set_status_message(cosmo,
+                                       "ccl_correlation.c: ccl_tracer_corr_fftlog(): "
+                                       "FFTLog transform failed\n");
+    }
   }
 
-  for(i=0;i<cosmo->spline_params.N_ELL_CORR;i++)
-    th_arr[i]=0;
-  //Although set here to 0, theta is modified by FFTlog to obtain the correlation at ~1/l
+  // Interpolate to output values of theta
+  if(*status==0) {
+#pragma omp parallel default(none) \
+                     shared(n_cls, n_l, th_arr, wth_ptr, \
+                            n_theta, theta, wtheta, status)
+    {
+      int local_status=0;
+
+      #pragma omp for
+      for(int j=0; j<n_cls; j++) {
+        if(local_status)
+          continue;
+        ccl_f1d_t *wth_spl=ccl_f1d_t_new(n_l,th_arr,
+                                         wth_ptr[j],wth_ptr[j][0],0,
+                                         ccl_f1d_extrap_const,
+                                         ccl_f1d_extrap_const,&local_status);
+        if(wth_spl==NULL) {
+          if(local_status==0)
+            local_status=CCL_ERROR_SPLINE;
+          continue;
+        }
+        for(int ii=0; ii<n_theta; ii++)
+          wtheta[j*n_theta+ii]=ccl_f1d_t_eval(wth_spl,theta[ii]*M_PI/180.);
+        ccl_f1d_t_free(wth_spl);
+      }
 
-  int i_bessel=0;
-  if(corr_type==CCL_CORR_GG) i_bessel=0;
-  if(corr_type==CCL_CORR_GL) i_bessel=2;
-  if(corr_type==CCL_CORR_LP) i_bessel=0;
-  if(corr_type==CCL_CORR_LM) i_bessel=4;
-  ccl_fftlog_ComputeXi2D(i_bessel,0,
-			 1, cosmo->spline_params.N_ELL_CORR,l_arr,&cl_arr,
-			 th_arr,&wth_arr, status);
+      if(local_status) {
+        #pragma omp atomic write
+        *status=local_status;
+      }
+    } //end omp parallel
 
-  // Interpolate to output values of theta
-  ccl_f1d_t *wth_spl=ccl_f1d_t_new(cosmo->spline_params.N_ELL_CORR,th_arr,
-				   wth_arr,wth_arr[0],0,
-				   ccl_f1d_extrap_const,
-				   ccl_f1d_extrap_const, status);
-  if (wth_spl == NULL) {
-    free(l_arr);
-    free(cl_arr);
-    free(th_arr);
-    free(wth_arr);
-    *status = CCL_ERROR_MEMORY;
-    ccl_cosmology_set_status_message(cosmo,
-                                     "ccl_correlation.c: ccl_tracer_corr_fftlog(): "
-                                     "ran out of memory\n");
-    return;
+    if(*status) {
+      ccl_cosmology_set_status_message(cosmo,
+                                       "ccl_correlation.c: ccl_tracer_corr_fftlog(): "
+                                       "failed to create the correlation function splines\n");
+    }
   }
-  for(i=0;i<n_theta;i++)
-    wtheta[i]=ccl_f1d_t_eval(wth_spl,theta[i]*M_PI/180.);
-  ccl_f1d_t_free(wth_spl);
 
   free(l_arr);
   free(cl_arr);
   free(th_arr);
   free(wth_arr);
-
-  return;
+  free(cl_ptr);
+  free(wth_ptr);
 }
 
 typedef struct {
@@ -290,6 +333,161 @@ static void ccl_compute_legendre_polynomial(int corr_type,double theta,int ell_m
       Pl_theta[j]*=(2*j+1.)/((j+0.)*(j+1.));
     }
   }
+  else if((corr_type==CCL_CORR_LP) || (corr_type==CCL_CORR_LM)) {
+    //Wigner-d matrices d^l_{2,+-2} through their three-term recursion
+    //in l, starting from d^2_{2,+-2} (and d^1_{2,+-2}=0).
+    int m2=(corr_type==CCL_CORR_LP) ? 2 : -2;
+    double d_lm1=0,d_l;
+    if(ell_max<2)
+      return;
+    if(corr_type==CCL_CORR_LP)
+      d_l=0.25*(1+cth)*(1+cth);
+    else
+      d_l=0.25*(1-cth)*(1-cth);
+    Pl_theta[2]=5*d_l;
+    for (j=2;j<ell_max;j++) {
+      double d_lp1;
+      double jj=j+0.;
+      double fac=(jj+1)*(2*jj+1)/((jj+1)*(jj+1)-4.);
+      double fac_m1=(jj*jj-4.)/(jj*(2*jj+1));
+      d_lp1=fac*((cth-2.*m2/(jj*(jj+1)))*d_l-fac_m1*d_lm1);
+      d_lm1=d_l;
+      d_l=d_lp1;
+      Pl_theta[j+1]=(2*jj+3)*d_l;
+    }
+  }
+}
+
+/*--------ROUTINE: ccl_correlation_legendre_matrix ------
+TASK: Tabulate the weights of the Legendre (or Wigner-d) sum
+      for a set of angular separations, so that they can be
+      reused for many different power spectra.
+INPUT: cosmology, correlation type, number of theta values, theta array,
+       maximum multipole, output matrix of size n_theta * (ell_max+1).
+ */
+void ccl_correlation_legendre_matrix(ccl_cosmology *cosmo,int corr_type,
+                                     int n_theta,double *theta,int ell_max,
+                                     double *pl_arr,int *status)
+{
+  if((corr_type!=CCL_CORR_GG) && (corr_type!=CCL_CORR_GL) &&
+     (corr_type!=CCL_CORR_LP) && (corr_type!=CCL_CORR_LM)) {
+    *status=CCL_ERROR_INCONSISTENT;
+    ccl_cosmology_set_status_message(cosmo,
+                                     "ccl_correlation.c: ccl_correlation_legendre_matrix(): "
+                                     "unknown correlation type\n");
+    return;
+  }
+  if(ell_max<2) {
+    *status=CCL_ERROR_INCONSISTENT;
+    ccl_cosmology_set_status_message(cosmo,
+                                     "ccl_correlation.c: ccl_correlation_legendre_matrix(): "
+                                     "ell_max must be at least 2\n");
+    return;
+  }
+
+#pragma omp parallel for default(none) \
+                         shared(corr_type, n_theta, theta, ell_max, pl_arr) \
+                         schedule(dynamic)
+  for(int i=0; i<n_theta; i++) {
+    double *row=&(pl_arr[i*(ell_max+1)]);
+    ccl_compute_legendre_polynomial(corr_type, theta[i], ell_max, row);
+    //Same summation range as ccl_tracer_corr_legendre
+    row[0]=0;
+    row[ell_max]=0;
+    for(int j=1; j<ell_max; j++)
+      row[j]/=(M_PI*4);
+  }
+}
+
+/*--------ROUTINE: ccl_correlation_legendre_multi ------
+TASK: Compute the correlation function for many power spectra
+      sampled on the same multipoles, given a matrix of precomputed
+      Legendre weights (see ccl_correlation_legendre_matrix).
+INPUT: cosmology, number of ells, ell array, number of power spectra,
+       power spectra (n_cls * n_ell, ell varying fastest), number of
+       theta values, maximum multipole, Legendre weights,
+       output correlation functions (n_cls * n_theta).
+ */
+void ccl_correlation_legendre_multi(ccl_cosmology *cosmo,
+                                    int n_ell,double *ell,
+                                    int n_cls,double *cls,
+                                    int n_theta,int ell_max,double *pl_arr,
+                                    double *wtheta,int *status)
+{
+  double *cl_arr=malloc(n_cls*(ell_max+1)*sizeof(double));
+  if(cl_arr==NULL) {
+    *status=CCL_ERROR_MEMORY;
+    ccl_cosmology_set_status_message(cosmo,
+                                     "ccl_correlation.c: ccl_correlation_legendre_multi(): "
+                                     "ran out of memory\n");
+    return;
+  }
+
+  //Interpolate all power spectra onto integer multipoles
+#pragma omp parallel default(none) \
+                     shared(cosmo, n_ell, ell, n_cls, cls, ell_max, cl_arr, status)
+  {
+    int local_status=0;
+
+    #pragma omp for schedule(dynamic)
+    for(int i=0; i<n_cls; i++) {
+      double *cl_in=&(cls[i*n_ell]);
+      double *cl_out=&(cl_arr[i*(ell_max+1)]);
+      int is_zero=1;
+      for(int j=0; j<n_ell; j++) {
+        if(cl_in[j]!=0) {
+          is_zero=0;
+          break;
+        }
+      }
+      if(is_zero || local_status) {
+        //Skip splines for vanishing spectra
+        for(int j=0; j<=ell_max; j++)
+          cl_out[j]=0;
+        continue;
+      }
+
+      ccl_f1d_t *cl_spl=ccl_f1d_t_new(n_ell,ell,cl_in,cl_in[0],0,
+                                      ccl_f1d_extrap_const,
+                                      ccl_f1d_extrap_logx_logy,&local_status);
+      if(cl_spl==NULL) {
+        if(local_status==0)
+          local_status=CCL_ERROR_SPLINE;
+        continue;
+      }
+      for(int j=0; j<=ell_max; j++)
+        cl_out[j]=ccl_f1d_t_eval(cl_spl,(double)j);
+      ccl_f1d_t_free(cl_spl);
+    }
+
+    if(local_status) {
+      #pragma omp atomic write
+      *status=local_status;
+    }
+  } //end omp parallel
+
+  if(*status) {
+    ccl_cosmology_set_status_message(cosmo,
+                                     "ccl_correlation.c: ccl_correlation_legendre_multi(): "
+                                     "failed to create the power spectrum splines\n");
+  }
+  else {
+    //w(n_cls, n_theta) = C_ell(n_cls, ell) * P(n_theta, ell)^T
+    gsl_matrix_view cl_m=gsl_matrix_view_array(cl_arr,n_cls,ell_max+1);
+    gsl_matrix_view pl_m=gsl_matrix_view_array(pl_arr,n_theta,ell_max+1);
+    gsl_matrix_view wt_m=gsl_matrix_view_array(wtheta,n_cls,n_theta);
+    int gslstatus=gsl_blas_dgemm(CblasNoTrans,CblasTrans,1.,
+                                 &cl_m.matrix,&pl_m.matrix,
+                                 0.,&wt_m.matrix);
+    if(gslstatus!=GSL_SUCCESS) {
+      ccl_raise_gsl_warning(gslstatus, "ccl_correlation.c: ccl_correlation_legendre_multi():");
+      *status=CCL_ERROR_INTEG;
+      ccl_cosmology_set_status_message(cosmo,
+                                       "ccl_correlation.c: ccl_correlation_legendre_multi(): "
+                                       "Legendre sum failed\n");
+    }
+  }
+  free(cl_arr);
 }
 
 /*--------ROUTINE: ccl_tracer_corr_legendre ------
@@ -306,13 +504,6 @@ static void ccl_tracer_corr_legendre(ccl_cosmology *cosmo,
   double *l_arr = NULL, *cl_arr = NULL, *Pl_theta = NULL;
   ccl_f1d_t *cl_spl;
 
-  if(corr_type==CCL_CORR_LM || corr_type==CCL_CORR_LP){
-    *status=CCL_ERROR_NOT_IMPLEMENTED;
-    ccl_cosmology_set_status_message(cosmo,
-                                     "ccl_correlation.c: ccl_tracer_corr_legendre(): "
-                                     "CCL does not support full-sky xi+- calcuations.\nhttps://arxiv.org/abs/1702.05301 indicates flat-sky to be sufficient.\n");
-  }
-
   if(*status==0) {
     l_arr=malloc(((int)(cosmo->spline_params.ELL_MAX_CORR)+1)*sizeof(double));
     if(l_arr==NULL) {
@@ -339,10 +530,11 @@ static void ccl_tracer_corr_legendre(ccl_cosmology *cosmo,
 			 ccl_f1d_extrap_const,
 			 ccl_f1d_extrap_logx_logy, status);
     if(cl_spl==NULL) {
-      *status=CCL_ERROR_MEMORY;
+      if(*status==0)
+        *status=CCL_ERROR_SPLINE;
       ccl_cosmology_set_status_message(cosmo,
                                        "ccl_correlation.c: ccl_tracer_corr_legendre(): "
-                                       "ran out of memory\n");
+                                       "failed to create the power spectrum spline\n");
     }
   }
 
@@ -358,7 +550,7 @@ static void ccl_tracer_corr_legendre(ccl_cosmology *cosmo,
       *status=taper_cl((int)(cosmo->spline_params.ELL_MAX_CORR)+1,l_arr,cl_arr,taper_cl_limits);
   }
 
-  int local_status, i_L;
+  int local_status, i_L, status_in=*status;
 #pragma omp parallel default(none) \
                      shared(cosmo, theta, cl_arr, wtheta, n_theta, status, corr_type) \
                      private(Pl_theta, i, i_L, local_status)
@@ -391,6 +583,11 @@ static void ccl_tracer_corr_legendre(ccl_cosmology *cosmo,
 
     free(Pl_theta);
   }
+  if((status_in==0) && *status) {
+    ccl_cosmology_set_status_message(cosmo,
+                                     "ccl_correlation.c: ccl_tracer_corr_legendre(): "
+                                     "ran out of memory\n");
+  }
   free(l_arr);
   free(cl_arr);
 }
@@ -410,7 +607,7 @@ void ccl_correlation(ccl_cosmology *cosmo,
                      int *status) {
   switch(flag_method) {
   case CCL_CORR_FFTLOG :
-    ccl_tracer_corr_fftlog(cosmo,n_ell,ell,cls,n_theta,theta,wtheta,corr_type,
+    ccl_tracer_corr_fftlog(cosmo,n_ell,ell,1,cls,n_theta,theta,wtheta,corr_type,
                            do_taper_cl,taper_cl_limits,status);
     break;
   case CCL_CORR_LGNDRE :
@@ -427,6 +624,47 @@ void ccl_correlation(ccl_cosmology *cosmo,
 
 }
 
+/*--------ROUTINE: ccl_correlation_multi ------
+TASK: Same as ccl_correlation, for n_cls power spectra sampled at the
+      same multipoles (stored contiguously in cls). With FFTLog, all
+      power spectra are transformed in a single call.
+ */
+void ccl_correlation_multi(ccl_cosmology *cosmo,
+                           int n_ell,double *ell,int n_cls,double *cls,
+                           int n_theta,double *theta,double *wtheta,
+                           int corr_type,int do_taper_cl,double *taper_cl_limits,int flag_method,
+                           int *status) {
+  int i;
+
+  if(flag_method==CCL_CORR_FFTLOG) {
+    ccl_tracer_corr_fftlog(cosmo,n_ell,ell,n_cls,cls,n_theta,theta,wtheta,corr_type,
+                           do_taper_cl,taper_cl_limits,status);
+    return;
+  }
+
+  for(i=0;i<n_cls;i++) {
+    int j,is_zero=1;
+    for(j=0;j<n_ell;j++) {
+      if(cls[i*n_ell+j]!=0) {
+        is_zero=0;
+        break;
+      }
+    }
+    if(is_zero) {
+      //Short-cut for vanishing power spectra
+      for(j=0;j<n_theta;j++)
+        wtheta[i*n_theta+j]=0;
+      continue;
+    }
+    ccl_correlation(cosmo,n_ell,ell,&(cls[i*n_ell]),
+                    n_theta,theta,&(wtheta[i*n_theta]),
+                    corr_type,do_taper_cl,taper_cl_limits,flag_method,
+                    status);
+    if(*status)
+      break;
+  }
+}
+
 /*--------ROUTINE: ccl_correlation_3d ------
 TASK: Calculate the 3d-correlation function. Do so by using FFTLog.
 
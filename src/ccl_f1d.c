@@ -198,3 +198,49 @@ void ccl_f1d_t_free(ccl_f1d_t *spl)
   }
   free(spl);
 }
+
+//Resamples several arrays sampled at the same x values
+void ccl_f1d_resample_multi(int n_in,double *x_in,int n_f,double *f_in,
+                            int n_out,double *x_out,double y0,double yf,
+                            ccl_f1d_extrap_t extrap_lo_type,
+                            ccl_f1d_extrap_t extrap_hi_type,
+                            double *f_out,int *status)
+{
+#pragma omp parallel default(none) \
+                     shared(n_in, x_in, n_f, f_in, n_out, x_out, y0, yf, \
+                            extrap_lo_type, extrap_hi_type, f_out, status)
+  {
+    int local_status=0;
+
+    #pragma omp for schedule(dynamic)
+    for(int i=0; i<n_f; i++) {
+      ccl_f1d_t *spl;
+
+      if(local_status)
+        continue;
+
+      spl=ccl_f1d_t_new(n_in,x_in,&(f_in[i*n_in]),y0,yf,
+                        extrap_lo_type,extrap_hi_type,&local_status);
+      if(spl==NULL) {
+        if(local_status==0)
+          local_status=CCL_ERROR_MEMORY;
+        continue;
+      }
+
+      for(int j=0; j<n_out; j++) {
+        double ret=ccl_f1d_t_eval(spl,x_out[j]);
+        if(ret!=ret) { //Check for NAN
+          local_status=CCL_ERROR_SPLINE_EV;
+          break;
+        }
+        f_out[i*n_out+j]=ret;
+      }
+      ccl_f1d_t_free(spl);
+    }
+
+    if(local_status) {
+      #pragma omp atomic write
+      *status=local_status;
+    }
+  } //end omp parallel
+}
@@ -107,167 +107,374 @@ static void compute_u_coefficients(int N, double mu, double q, double L, double
     u[N/2] = (creal(u[N/2]) + I*0.0);
 }
 
-/* Compute the discrete Hankel transform of the function a(r).  See the FFTLog
- * documentation (or the Fortran routine of the same name in the FFTLog
- * sources) for a description of exactly what this function computes.
- * If u is NULL, the transform coefficients will be computed anew and discarded
- * afterwards.  If you plan on performing many consecutive transforms, it is
- * more efficient to pre-compute the u coefficients. */
-static void fht(int npk, int N,
-		double *k, double **pk,
-		double *r, double **xi,
-		double dim, double mu, double q, double kcrc,
-		int noring, double complex* u, int *status)
+/* Geometry and precomputed quantities needed to perform discrete Hankel
+ * transforms of arrays with N logarithmically-spaced samples with spacing
+ * dlnk. The u coefficients and FFTW plans only depend on these, and are
+ * therefore computed once and reused across transforms. */
+struct ccl_fftlog_plan {
+  int N;
+  double dlnk;
+  double dim;
+  double mu;
+  double q;
+  double L;
+  double kcrc;
+  double complex *u;
+  fftw_complex *a_tmp;
+  fftw_complex *b_tmp;
+  fftw_plan forward_plan;
+  fftw_plan reverse_plan;
+  int n_users; // Number of transforms currently using a cached plan.
+  int is_cached;
+};
+
+/* Planner flags used for plans stored in the internal cache. */
+static unsigned fftlog_cache_flags = FFTW_ESTIMATE;
+
+/* Internal plan cache used by ccl_fftlog_ComputeXi2D and
+ * ccl_fftlog_ComputeXi3D. */
+#define CCL_FFTLOG_CACHE_SIZE 16
+static ccl_fftlog_plan_t *fftlog_cache[CCL_FFTLOG_CACHE_SIZE];
+static int fftlog_cache_next = 0;
+
+static ccl_fftlog_plan_t *fftlog_plan_new(int N, double dlnk, double dim,
+                                          double mu, double q,
+                                          unsigned flags, int *status)
 {
-  fftw_plan forward_plan, reverse_plan;
-  double L = log(k[N-1]/k[0]) * N/(N-1.);
-  double complex* ulocal = NULL;
-  if(u == NULL) {
-    if(noring)
-      kcrc = goodkr(N, mu, q, L, kcrc);
-
-    ulocal = malloc (sizeof(complex double)*N);
-    if(ulocal==NULL)
-      *status=CCL_ERROR_MEMORY;
+  ccl_fftlog_plan_t *plan;
 
-    if(*status == 0) {
-      compute_u_coefficients(N, mu, q, L, kcrc, ulocal);
-      u = ulocal;
-    }
+  if((N<2) || (dlnk<=0)) {
+    *status=CCL_ERROR_INCONSISTENT;
+    return NULL;
   }
 
-  fftw_complex* a_tmp;
-  fftw_complex* b_tmp;
-  if(*status == 0) {
-    a_tmp = fftw_alloc_complex(N);
-    if(a_tmp==NULL)
-      *status=CCL_ERROR_MEMORY;
+  plan = malloc(sizeof(ccl_fftlog_plan_t));
+  if(plan==NULL) {
+    *status=CCL_ERROR_MEMORY;
+    return NULL;
   }
+  plan->N = N;
+  plan->dlnk = dlnk;
+  plan->dim = dim;
+  plan->mu = mu;
+  plan->q = q;
+  plan->L = N*dlnk;
+  plan->kcrc = goodkr(N, mu, q, plan->L, 1.);
+  plan->n_users = 0;
+  plan->is_cached = 0;
+  plan->a_tmp = NULL;
+  plan->b_tmp = NULL;
+  plan->forward_plan = NULL;
+  plan->reverse_plan = NULL;
+
+  plan->u = malloc(sizeof(complex double)*N);
+  if(plan->u==NULL)
+    *status=CCL_ERROR_MEMORY;
+
   if(*status == 0) {
-    b_tmp = fftw_alloc_complex(N);
-    if(b_tmp==NULL)
+    compute_u_coefficients(N, mu, q, plan->L, plan->kcrc, plan->u);
+
+    // The FFTW planner is not thread-safe
+    #pragma omp critical(ccl_fftw_planner)
+    {
+      plan->a_tmp = fftw_alloc_complex(N);
+      plan->b_tmp = fftw_alloc_complex(N);
+      if((plan->a_tmp!=NULL) && (plan->b_tmp!=NULL)) {
+        plan->forward_plan = fftw_plan_dft_1d(N,
+                                              plan->a_tmp,
+                                              plan->b_tmp,
+                                              -1, flags);
+        plan->reverse_plan = fftw_plan_dft_1d(N,
+                                              plan->b_tmp,
+                                              plan->b_tmp,
+                                              +1, flags);
+      }
+    }
+    if((plan->forward_plan==NULL) || (plan->reverse_plan==NULL))
       *status=CCL_ERROR_MEMORY;
   }
 
-  if(*status == 0) {
-    /* Compute the convolution b = a*u using FFTs */
-    forward_plan = fftw_plan_dft_1d(N,
-                                    (fftw_complex*) a_tmp,
-                                    (fftw_complex*) b_tmp,
-                                    -1, FFTW_ESTIMATE);
-    reverse_plan = fftw_plan_dft_1d(N,
-                                    (fftw_complex*) b_tmp,
-                                    (fftw_complex*) b_tmp,
-                                    +1, FFTW_ESTIMATE);
+  if(*status) {
+    ccl_fftlog_plan_free(plan);
+    return NULL;
   }
+  return plan;
+}
 
-  if(*status == 0) {
-    #pragma omp parallel default(none) \
-                         shared(npk, N, k, pk, r, xi, \
-                                dim, mu, q, kcrc, u, status, \
-                                forward_plan, reverse_plan, \
-                                L, ulocal)
-    {
-      int local_status = 0;
+ccl_fftlog_plan_t *ccl_fftlog_plan_new(int N, double dlnk, double dim,
+                                       double mu, double q, int measure,
+                                       int *status)
+{
+  return fftlog_plan_new(N, dlnk, dim, mu, q,
+                         measure ? FFTW_MEASURE : FFTW_ESTIMATE, status);
+}
 
-      double *prefac_pk=NULL;
-      if(local_status == 0) {
-        prefac_pk = malloc(N*sizeof(double));
-        if(prefac_pk==NULL)
-          local_status=CCL_ERROR_MEMORY;
-      }
+void ccl_fftlog_plan_free(ccl_fftlog_plan_t *plan)
+{
+  if(plan==NULL)
+    return;
+
+  #pragma omp critical(ccl_fftw_planner)
+  {
+    if(plan->forward_plan!=NULL)
+      fftw_destroy_plan(plan->forward_plan);
+    if(plan->reverse_plan!=NULL)
+      fftw_destroy_plan(plan->reverse_plan);
+    fftw_free(plan->a_tmp);
+    fftw_free(plan->b_tmp);
+  }
+  free(plan->u);
+  free(plan);
+}
 
-      double *prefac_xi=NULL;
-      if(local_status == 0) {
-        prefac_xi = malloc(N*sizeof(double));
-        if(prefac_xi==NULL)
-          local_status=CCL_ERROR_MEMORY;
-      }
+static int fftlog_plan_matches(ccl_fftlog_plan_t *plan, int N, double dlnk,
+                               double dim, double mu, double q)
+{
+  return ((plan->N == N) &&
+          (fabs(plan->dlnk/dlnk-1) < 1E-10) &&
+          (plan->dim == dim) && (plan->mu == mu) && (plan->q == q));
+}
 
-      fftw_complex* a=NULL;
-      fftw_complex* b=NULL;
-      if(local_status == 0) {
-        a = fftw_alloc_complex(N);
-        if(a==NULL)
-        local_status=CCL_ERROR_MEMORY;
+/* Return a plan for the given geometry, from the internal cache if possible.
+ * Plans obtained this way must be returned with fftlog_plan_release. */
+static ccl_fftlog_plan_t *fftlog_plan_acquire(int N, double dlnk, double dim,
+                                              double mu, double q, int *status)
+{
+  ccl_fftlog_plan_t *plan = NULL;
+
+  #pragma omp critical(ccl_fftlog_cache)
+  {
+    int ii;
+    for(ii=0; ii < CCL_FFTLOG_CACHE_SIZE; ii++) {
+      ccl_fftlog_plan_t *p = fftlog_cache[ii];
+      if((p != NULL) && fftlog_plan_matches(p, N, dlnk, dim, mu, q)) {
+        plan = p;
+        break;
       }
+    }
 
-      if(local_status == 0) {
-        b = fftw_alloc_complex(N);
-        if(b==NULL)
-          local_status=CCL_ERROR_MEMORY;
+    if(plan == NULL) {
+      plan = fftlog_plan_new(N, dlnk, dim, mu, q, fftlog_cache_flags, status);
+      if(plan != NULL) {
+        // Store in the first slot (round-robin) that is not in use.
+        for(ii=0; ii < CCL_FFTLOG_CACHE_SIZE; ii++) {
+          int islot = (fftlog_cache_next + ii) % CCL_FFTLOG_CACHE_SIZE;
+          ccl_fftlog_plan_t *p = fftlog_cache[islot];
+          if((p == NULL) || (p->n_users == 0)) {
+            ccl_fftlog_plan_free(p);
+            plan->is_cached = 1;
+            fftlog_cache[islot] = plan;
+            fftlog_cache_next = (islot + 1) % CCL_FFTLOG_CACHE_SIZE;
+            break;
+          }
+        }
       }
+    }
 
-      if(local_status == 0) {
-        for(int i = 0; i < N; i++)
-          prefac_pk[i] = pow(k[i], dim/2-q);
+    if(plan != NULL)
+      plan->n_users++;
+  }
 
-        /* Compute k's corresponding to input r's */
-        double k0r0 = kcrc * exp(-L);
-        r[0] = k0r0/k[0];
-        for(int n = 1; n < N; n++)
-          r[n] = r[0] * exp(n*L/N);
+  return plan;
+}
 
-        double one_over_2pi_dhalf = pow(2*M_PI,-dim/2);
-        for(int i = 0; i < N; i++)
-          prefac_xi[i] = one_over_2pi_dhalf * pow(r[i], -dim/2-q);
-
-        #pragma omp for
-        for(int j = 0; j < npk; j++) {
-          for(int i = 0; i < N; i++)
-            a[i] = prefac_pk[i] * pk[j][i];
-
-          fftw_execute_dft(forward_plan,a,b);
-          for(int m = 0; m < N; m++)
-            b[m] *= u[m] / (double)(N);       // divide by N since FFTW doesn't normalize the inverse FFT
-          fftw_execute_dft(reverse_plan,b,b);
-
-          /* Reverse b array */
-          double complex tmp;
-          for(int n = 0; n < N/2; n++) {
-            tmp = b[n];
-            b[n] = b[N-n-1];
-            b[N-n-1] = tmp;
-          }
+static void fftlog_plan_release(ccl_fftlog_plan_t *plan)
+{
+  int do_free = 0;
 
-          for(int i = 0; i < N; i++)
-            xi[j][i] = prefac_xi[i] * creal(b[i]);
-        }
-      }
+  if(plan == NULL)
+    return;
 
-      free(prefac_pk);
-      free(prefac_xi);
-      fftw_free(a);
-      fftw_free(b);
+  #pragma omp critical(ccl_fftlog_cache)
+  {
+    plan->n_users--;
+    do_free = !(plan->is_cached);
+  }
 
-      if (local_status) {
-        #pragma omp atomic write
-        *status = local_status;
+  if(do_free)
+    ccl_fftlog_plan_free(plan);
+}
+
+void ccl_fftlog_clear_cache(void)
+{
+  #pragma omp critical(ccl_fftlog_cache)
+  {
+    int ii;
+    for(ii=0; ii < CCL_FFTLOG_CACHE_SIZE; ii++) {
+      ccl_fftlog_plan_t *p = fftlog_cache[ii];
+      if(p == NULL)
+        continue;
+      if(p->n_users == 0) {
+        ccl_fftlog_plan_free(p);
+        fftlog_cache[ii] = NULL;
       }
-    } //end omp parallel
+      else // Freed once it is no longer used
+        p->is_cached = 0;
+    }
+    fftlog_cache_next = 0;
   }
+}
 
-  if(*status == 0) {
-    fftw_destroy_plan(forward_plan);
-    fftw_destroy_plan(reverse_plan);
+void ccl_fftlog_set_cache_measure(int measure)
+{
+  #pragma omp critical(ccl_fftlog_cache)
+  {
+    fftlog_cache_flags = measure ? FFTW_MEASURE : FFTW_ESTIMATE;
+  }
+  ccl_fftlog_clear_cache();
+}
+
+int ccl_fftlog_import_wisdom(const char *fname)
+{
+  int success;
+  #pragma omp critical(ccl_fftw_planner)
+  {
+    success = fftw_import_wisdom_from_filename(fname);
+  }
+  return success;
+}
+
+int ccl_fftlog_export_wisdom(const char *fname)
+{
+  int success;
+  #pragma omp critical(ccl_fftw_planner)
+  {
+    success = fftw_export_wisdom_to_filename(fname);
   }
+  return success;
+}
+
+/* Compute the discrete Hankel transform of the function a(r).  See the FFTLog
+ * documentation (or the Fortran routine of the same name in the FFTLog
+ * sources) for a description of exactly what this function computes.
+ * The u coefficients and FFTW plans are taken from the input plan. */
+void ccl_fftlog_plan_execute(ccl_fftlog_plan_t *plan, int npk, int nk,
+                             double *k, double **pk,
+                             double *r, double **xi, int *status)
+{
+  int N = plan->N;
+  double dim = plan->dim;
+  double q = plan->q;
+  double L = plan->L;
+  double kcrc = plan->kcrc;
+  double complex *u = plan->u;
+  fftw_plan forward_plan = plan->forward_plan;
+  fftw_plan reverse_plan = plan->reverse_plan;
+
+  // The input arrays must have the size and spacing the plan was made for
+  if((nk < 2) || !fftlog_plan_matches(plan, nk, log(k[nk-1]/k[0])/(nk-1.),
+                                      plan->dim, plan->mu, plan->q)) {
+    *status = CCL_ERROR_INCONSISTENT;
+    return;
+  }
+
+  #pragma omp parallel default(none) \
+                       shared(npk, N, k, pk, r, xi, \
+                              dim, q, kcrc, u, status, \
+                              forward_plan, reverse_plan, L)
+  {
+    int local_status = 0;
+
+    double *prefac_pk=NULL;
+    if(local_status == 0) {
+      prefac_pk = malloc(N*sizeof(double));
+      if(prefac_pk==NULL)
+        local_status=CCL_ERROR_MEMORY;
+    }
+
+    double *prefac_xi=NULL;
+    if(local_status == 0) {
+      prefac_xi = malloc(N*sizeof(double));
+      if(prefac_xi==NULL)
+        local_status=CCL_ERROR_MEMORY;
+    }
+
+    fftw_complex* a=NULL;
+    fftw_complex* b=NULL;
+    if(local_status == 0) {
+      a = fftw_alloc_complex(N);
+      if(a==NULL)
+        local_status=CCL_ERROR_MEMORY;
+    }
+
+    if(local_status == 0) {
+      b = fftw_alloc_complex(N);
+      if(b==NULL)
+        local_status=CCL_ERROR_MEMORY;
+    }
+
+    if(local_status == 0) {
+      for(int i = 0; i < N; i++)
+        prefac_pk[i] = pow(k[i], dim/2-q);
 
-  free(ulocal);
-  //TODO: free this up
-  fftw_free(a_tmp);
-  fftw_free(b_tmp);
+      /* Compute k's corresponding to input r's */
+      double k0r0 = kcrc * exp(-L);
+      r[0] = k0r0/k[0];
+      for(int n = 1; n < N; n++)
+        r[n] = r[0] * exp(n*L/N);
+
+      double one_over_2pi_dhalf = pow(2*M_PI,-dim/2);
+      for(int i = 0; i < N; i++)
+        prefac_xi[i] = one_over_2pi_dhalf * pow(r[i], -dim/2-q);
+
+      #pragma omp for
+      for(int j = 0; j < npk; j++) {
+        for(int i = 0; i < N; i++)
+          a[i] = prefac_pk[i] * pk[j][i];
+
+        fftw_execute_dft(forward_plan,a,b);
+        for(int m = 0; m < N; m++)
+          b[m] *= u[m] / (double)(N);       // divide by N since FFTW doesn't normalize the inverse FFT
+        fftw_execute_dft(reverse_plan,b,b);
+
+        /* Reverse b array */
+        double complex tmp;
+        for(int n = 0; n < N/2; n++) {
+          tmp = b[n];
+          b[n] = b[N-n-1];
+          b[N-n-1] = tmp;
+        }
+
+        for(int i = 0; i < N; i++)
+          xi[j][i] = prefac_xi[i] * creal(b[i]);
+      }
+    }
+
+    free(prefac_pk);
+    free(prefac_xi);
+    fftw_free(a);
+    fftw_free(b);
+
+    if (local_status) {
+      #pragma omp atomic write
+      *status = local_status;
+    }
+  } //end omp parallel
 }
- 
+
+static void fht(int npk, int N,
+                double *k, double **pk,
+                double *r, double **xi,
+                double dim, double mu, double q, int *status)
+{
+  double dlnk = log(k[N-1]/k[0])/(N-1.);
+  ccl_fftlog_plan_t *plan = fftlog_plan_acquire(N, dlnk, dim, mu, q, status);
+
+  if(plan != NULL)
+    ccl_fftlog_plan_execute(plan, npk, N, k, pk, r, xi, status);
+  fftlog_plan_release(plan);
+}
+
 void ccl_fftlog_ComputeXi2D(double mu, double epsilon,
 			    int npk, int N, double *l,double **cl,
 			    double *th, double **xi, int *status)
 {
-  fht(npk, N, l, cl, th, xi, 2., mu, epsilon, 1, 1, NULL, status);
+  fht(npk, N, l, cl, th, xi, 2., mu, epsilon, status);
 }
 
 void ccl_fftlog_ComputeXi3D(double l, double epsilon,
 			    int npk, int N, double *k, double **pk,
 			    double *r, double **xi, int *status)
 {
-  fht(npk, N, k, pk, r, xi, 3., l+0.5, epsilon, 1, 1, NULL, status);
+  fht(npk, N, k, pk, r, xi, 3., l+0.5, epsilon, status);
 }
@@ -183,3 +183,75 @@ double ccl_dlnsigM_dlogM(ccl_cosmology *cosmo, double log_halomass, double a, in
   }
   return -dlsdlgm;
 }
+
+/*----- ROUTINE: ccl_sigmaM_2d -----
+INPUT: ccl_cosmology *cosmo, arrays of scale factors and log10(halo mass)
+TASK: returns sigma(M) and, optionally, dln(sigma^-1)/dlog10(M) on the
+2D grid of (a, M), with the mass being the fastest varying dimension.
+*/
+void ccl_sigmaM_2d(ccl_cosmology *cosmo, int na, double *a_arr,
+                   int nm, double *log_halomass,
+                   double *sigM_arr, double *dlns_arr, int *status)
+{
+  // Check if sigma has already been calculated
+  if (!cosmo->computed_sigma) {
+    *status = CCL_ERROR_SIGMA_INIT;
+    ccl_cosmology_set_status_message(cosmo,
+                                     "ccl_massfunc.c: ccl_sigmaM_2d(): "
+                                     "sigma(M) spline has not been computed!");
+    return;
+  }
+
+  #pragma omp parallel shared(cosmo, na, a_arr, nm, log_halomass, \
+                              sigM_arr, dlns_arr, status) \
+                       default(none)
+  {
+    int ia, im, gslstatus;
+    double lgsigmaM, dlsdlgm;
+    int local_status = 0;
+    gsl_interp_accel *xacc = gsl_interp_accel_alloc();
+    gsl_interp_accel *yacc = gsl_interp_accel_alloc();
+    if ((xacc == NULL) || (yacc == NULL))
+      local_status = CCL_ERROR_MEMORY;
+
+    #pragma omp for
+    for (ia=0; ia<na; ia++) {
+      if (local_status)
+        continue;
+      for (im=0; im<nm; im++) {
+        int ii = ia*nm + im;
+        gslstatus = gsl_spline2d_eval_e(cosmo->data.logsigma,
+                                        log_halomass[im], a_arr[ia],
+                                        xacc, yacc, &lgsigmaM);
+        if (gslstatus != GSL_SUCCESS) {
+          ccl_raise_gsl_warning(gslstatus, "ccl_massfunc.c: ccl_sigmaM_2d():");
+          local_status |= gslstatus;
+        }
+        sigM_arr[ii] = exp(lgsigmaM);
+
+        if (dlns_arr != NULL) {
+          gslstatus = gsl_spline2d_eval_deriv_x_e(cosmo->data.logsigma,
+                                                  log_halomass[im], a_arr[ia],
+                                                  xacc, yacc, &dlsdlgm);
+          if (gslstatus != GSL_SUCCESS) {
+            ccl_raise_gsl_warning(gslstatus, "ccl_massfunc.c: ccl_sigmaM_2d():");
+            local_status |= gslstatus;
+          }
+          dlns_arr[ii] = -dlsdlgm;
+        }
+      }
+    } //end omp for
+
+    gsl_interp_accel_free(xacc);
+    gsl_interp_accel_free(yacc);
+    if (local_status) {
+      #pragma omp atomic write
+      *status = local_status;
+    }
+  } //end omp parallel
+
+  if (*status == CCL_ERROR_MEMORY)
+    ccl_cosmology_set_status_message(cosmo,
+                                     "ccl_massfunc.c: ccl_sigmaM_2d(): "
+                                     "error allocating interpolation accelerators\n");
+}
@@ -56,6 +56,53 @@ double ccl_Sig_MG(ccl_cosmology * cosmo, double a, double k, int *status)
 	return cosmo->params.sigma_0 * ccl_omega_x(cosmo, a, ccl_species_l_label, status)/cosmo->params.Omega_l*s1_k;
 }
 
+/* --------- ROUTINE: musigma_vec ---------
+INPUT: cosmology object, amplitude (mu_0 or sigma_0), scale-dependence
+parameter (c1_mg or c2_mg), arrays of scale factors and wavenumbers
+TASK: Compute mu(a,k) or Sigma(a,k) on a grid of scale factors and
+wavenumbers. The background quantities are evaluated once per scale factor.
+The output has size na*nk, with the scale factor varying fastest.
+*/
+
+static void musigma_vec(ccl_cosmology *cosmo, double amp, double c_mg,
+                        int na, double *a, int nk, double *k,
+                        double *output, int *status)
+{
+  double lambda_h = cosmo->params.lambda_mg*cosmo->params.H0/(ccl_constants.CLIGHT/1000);
+
+  for(int i=0; i < na; i++) {
+    int stat = 0;
+    double f_a = amp*ccl_omega_x(cosmo, a[i], ccl_species_l_label, &stat)/cosmo->params.Omega_l;
+    double s2_a = lambda_h*ccl_h_over_h0(cosmo, a[i], &stat);
+    for(int j=0; j < nk; j++) {
+      double s1_k;
+      if (k[j]==0.0) {
+        s1_k = c_mg;
+      }
+      else {
+        double s2_k = s2_a/k[j];
+        s1_k = (1.0+c_mg*s2_k*s2_k)/(1.0+s2_k*s2_k);
+      }
+      output[i+j*na] = f_a*s1_k;
+    }
+    *status |= stat;
+  }
+}
+
+void ccl_mu_MG_vec(ccl_cosmology * cosmo, int na, double *a, int nk, double *k,
+                   double *output, int *status)
+{
+  musigma_vec(cosmo, cosmo->params.mu_0, cosmo->params.c1_mg,
+              na, a, nk, k, output, status);
+}
+
+void ccl_Sig_MG_vec(ccl_cosmology * cosmo, int na, double *a, int nk, double *k,
+                    double *output, int *status)
+{
+  musigma_vec(cosmo, cosmo->params.sigma_0, cosmo->params.c2_mg,
+              na, a, nk, k, output, status);
+}
+
 /*
  * Spline the linear power spectrum for mu-Sigma MG cosmologies.
  * @param cosmo Cosmological parameters
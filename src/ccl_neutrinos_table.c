@@ -0,0 +1,351 @@
+#include "ccl.h"
+
+/*
+ * Phase-space integral of a single massive neutrino species,
+ *
+ *   I(m/T) = int_0^infty dx x^2 sqrt(x^2 + (m/T)^2) / (exp(x) + 1),
+ *
+ * normalized to its value at the first node. The nodes are linearly spaced
+ * in log(m/T) between log(CCL_NU_MNUT_MIN) and log(CCL_NU_MNUT_MAX), with
+ * CCL_NU_MNUT_N points (the same grid as ccl_linear_spacing).
+ *
+ * The values were computed once with adaptive quadrature at a relative
+ * precision of 1E-13, so that the spline used by ccl_Omeganuh2 does not need
+ * to be built from CCL_NU_MNUT_N numerical integrals at run time.
+ */
+const double ccl_nu_phasespace_table[CCL_NU_MNUT_N] = {
+  1.00000000000000000e+00, 1.00000000002269762e+00, 1.00000000004610734e+00,
+  1.00000000007025114e+00, 1.00000000009515211e+00, 1.00000000012083401e+00,
+  1.00000000014732149e+00, 1.00000000017463964e+00, 1.00000000020281443e+00,
+  1.00000000023187319e+00, 1.00000000026184299e+00, 1.00000000029275316e+00,
+  1.00000000032463232e+00, 1.00000000035751113e+00, 1.00000000039142134e+00,
+  1.00000000042639514e+00, 1.00000000046246584e+00, 1.00000000049966764e+00,
+  1.00000000053803628e+00, 1.00000000057760841e+00, 1.00000000061842154e+00,
+  1.00000000066051431e+00, 1.00000000070392758e+00, 1.00000000074870243e+00,
+  1.00000000079488127e+00, 1.00000000084250873e+00, 1.00000000089162966e+00,
+  1.00000000094229136e+00, 1.00000000099454178e+00, 1.00000000104843068e+00,
+  1.00000000110400999e+00, 1.00000000116133236e+00, 1.00000000122045218e+00,
+  1.00000000128142674e+00, 1.00000000134431333e+00, 1.00000000140917211e+00,
+  1.00000000147606527e+00, 1.00000000154505608e+00, 1.00000000161621072e+00,
+  1.00000000168959691e+00, 1.00000000176528481e+00, 1.00000000184334636e+00,
+  1.00000000192385619e+00, 1.00000000200689088e+00, 1.00000000209252993e+00,
+  1.00000000218085461e+00, 1.00000000227194952e+00, 1.00000000236590147e+00,
+  1.00000000246280019e+00, 1.00000000256273758e+00, 1.00000000266580913e+00,
+  1.00000000277211365e+00, 1.00000000288175217e+00, 1.00000000299482861e+00,
+  1.00000000311145176e+00, 1.00000000323173266e+00, 1.00000000335578587e+00,
+  1.00000000348372953e+00, 1.00000000361568597e+00, 1.00000000375178089e+00,
+  1.00000000389214372e+00, 1.00000000403690925e+00, 1.00000000418621471e+00,
+  1.00000000434020264e+00, 1.00000000449902027e+00, 1.00000000466281858e+00,
+  1.00000000483175411e+00, 1.00000000500598807e+00, 1.00000000518568632e+00,
+  1.00000000537102030e+00, 1.00000000556216695e+00, 1.00000000575930859e+00,
+  1.00000000596263283e+00, 1.00000000617233353e+00, 1.00000000638861142e+00,
+  1.00000000661167210e+00, 1.00000000684172896e+00, 1.00000000707900050e+00,
+  1.00000000732371364e+00, 1.00000000757610175e+00, 1.00000000783640530e+00,
+  1.00000000810487233e+00, 1.00000000838175951e+00, 1.00000000866733041e+00,
+  1.00000000896185792e+00, 1.00000000926562227e+00, 1.00000000957891300e+00,
+  1.00000000990202986e+00, 1.00000001023528018e+00, 1.00000001057898236e+00,
+  1.00000001093346391e+00, 1.00000001129906280e+00, 1.00000001167612806e+00,
+  1.00000001206501854e+00, 1.00000001246610570e+00, 1.00000001287977214e+00,
+  1.00000001330641197e+00, 1.00000001374643244e+00, 1.00000001420025320e+00,
+  1.00000001466830701e+00, 1.00000001515103976e+00, 1.00000001564891261e+00,
+  1.00000001616239986e+00, 1.00000001669199134e+00, 1.00000001723819198e+00,
+  1.00000001780152314e+00, 1.00000001838252150e+00, 1.00000001898174151e+00,
+  1.00000001959975449e+00, 1.00000002023715018e+00, 1.00000002089453655e+00,
+  1.00000002157253931e+00, 1.00000002227180618e+00, 1.00000002299300417e+00,
+  1.00000002373682073e+00, 1.00000002450396508e+00, 1.00000002529516907e+00,
+  1.00000002611118699e+00, 1.00000002695279777e+00, 1.00000002782080299e+00,
+  1.00000002871603133e+00, 1.00000002963933610e+00, 1.00000003059159837e+00,
+  1.00000003157372541e+00, 1.00000003258665515e+00, 1.00000003363135237e+00,
+  1.00000003470881405e+00, 1.00000003582006758e+00, 1.00000003696617279e+00,
+  1.00000003814822258e+00, 1.00000003936734494e+00, 1.00000004062470160e+00,
+  1.00000004192149228e+00, 1.00000004325895331e+00, 1.00000004463836079e+00,
+  1.00000004606102944e+00, 1.00000004752831684e+00, 1.00000004904162210e+00,
+  1.00000005060238806e+00, 1.00000005221210397e+00, 1.00000005387230440e+00,
+  1.00000005558457250e+00, 1.00000005735054187e+00, 1.00000005917189649e+00,
+  1.00000006105037298e+00, 1.00000006298776367e+00, 1.00000006498591554e+00,
+  1.00000006704673394e+00, 1.00000006917218509e+00, 1.00000007136429603e+00,
+  1.00000007362515619e+00, 1.00000007595692297e+00, 1.00000007836181948e+00,
+  1.00000008084213965e+00, 1.00000008340024871e+00, 1.00000008603858626e+00,
+  1.00000008875966873e+00, 1.00000009156609093e+00, 1.00000009446052940e+00,
+  1.00000009744574436e+00, 1.00000010052458332e+00, 1.00000010369998216e+00,
+  1.00000010697496911e+00, 1.00000011035266767e+00, 1.00000011383629905e+00,
+  1.00000011742918593e+00, 1.00000012113475401e+00, 1.00000012495653778e+00,
+  1.00000012889818191e+00, 1.00000013296344581e+00, 1.00000013715620617e+00,
+  1.00000014148046135e+00, 1.00000014594033582e+00, 1.00000015054008262e+00,
+  1.00000015528408870e+00, 1.00000016017687821e+00, 1.00000016522311697e+00,
+  1.00000017042761846e+00, 1.00000017579534539e+00, 1.00000018133141677e+00,
+  1.00000018704111238e+00, 1.00000019292987785e+00, 1.00000019900332915e+00,
+  1.00000020526725830e+00, 1.00000021172763853e+00, 1.00000021839063225e+00,
+  1.00000022526259280e+00, 1.00000023235007407e+00, 1.00000023965985196e+00,
+  1.00000024719886649e+00, 1.00000025497432210e+00, 1.00000026299363376e+00,
+  1.00000027126446955e+00, 1.00000027979467876e+00, 1.00000028859241441e+00,
+  1.00000029766606779e+00, 1.00000030702429199e+00, 1.00000031667601119e+00,
+  1.00000032663043092e+00, 1.00000033689704315e+00, 1.00000034748564048e+00,
+  1.00000035840631973e+00, 1.00000036966949657e+00, 1.00000038128591218e+00,
+  1.00000039326664414e+00, 1.00000040562311909e+00, 1.00000041836709586e+00,
+  1.00000043151077733e+00, 1.00000044506667396e+00, 1.00000045904771295e+00,
+  1.00000047346722831e+00, 1.00000048833897148e+00, 1.00000050367712467e+00,
+  1.00000051949631552e+00, 1.00000053581163062e+00, 1.00000055263862864e+00,
+  1.00000056999335740e+00, 1.00000058789236723e+00, 1.00000060635272781e+00,
+  1.00000062539204415e+00, 1.00000064502847308e+00, 1.00000066528074094e+00,
+  1.00000068616816207e+00, 1.00000070771067384e+00, 1.00000072992878231e+00,
+  1.00000075284369561e+00, 1.00000077647726582e+00, 1.00000080085203225e+00,
+  1.00000082599123963e+00, 1.00000085191886101e+00, 1.00000087865962328e+00,
+  1.00000090623902671e+00, 1.00000093468337292e+00, 1.00000096401978755e+00,
+  1.00000099427624667e+00, 1.00000102548160430e+00, 1.00000105766561931e+00,
+  1.00000109085898270e+00, 1.00000112509334960e+00, 1.00000116040136655e+00,
+  1.00000119681670485e+00, 1.00000123437409050e+00, 1.00000127310933973e+00,
+  1.00000131305939099e+00, 1.00000135426234249e+00, 1.00000139675748456e+00,
+  1.00000144058534324e+00, 1.00000148578771175e+00, 1.00000153240769718e+00,
+  1.00000158048975551e+00, 1.00000163007973963e+00, 1.00000168122493749e+00,
+  1.00000173397412206e+00, 1.00000178837759490e+00, 1.00000184448723539e+00,
+  1.00000190235654829e+00, 1.00000196204071901e+00, 1.00000202359666046e+00,
+  1.00000208708307237e+00, 1.00000215256049385e+00, 1.00000222009136275e+00,
+  1.00000228974007599e+00, 1.00000236157267608e+00, 1.00000243565841340e+00,
+  1.00000251206790503e+00, 1.00000259087329835e+00, 1.00000267215010030e+00,
+  1.00000275597581267e+00, 1.00000284243036819e+00, 1.00000293159620468e+00,
+  1.00000302355834592e+00, 1.00000311840448131e+00, 1.00000321622504984e+00,
+  1.00000331711332624e+00, 1.00000342116551022e+00, 1.00000352848081753e+00,
+  1.00000363916157498e+00, 1.00000375331331770e+00, 1.00000387104488975e+00,
+  1.00000399246854865e+00, 1.00000411770007069e+00, 1.00000424685886302e+00,
+  1.00000438006807602e+00, 1.00000451745472163e+00, 1.00000465914979397e+00,
+  1.00000480528839431e+00, 1.00000495600985917e+00, 1.00000511145789495e+00,
+  1.00000527178071152e+00, 1.00000543713116730e+00, 1.00000560766691260e+00,
+  1.00000578355053982e+00, 1.00000596494973881e+00, 1.00000615203745702e+00,
+  1.00000634499206376e+00, 1.00000654399752054e+00, 1.00000674924355470e+00,
+  1.00000696092584351e+00, 1.00000717924619686e+00, 1.00000740441275182e+00,
+  1.00000763664017001e+00, 1.00000787614984232e+00, 1.00000812317009991e+00,
+  1.00000837793643127e+00, 1.00000864069170659e+00, 1.00000891168640904e+00,
+  1.00000919117887399e+00, 1.00000947943553409e+00, 1.00000977673117308e+00,
+  1.00001008334918762e+00, 1.00001039958185789e+00, 1.00001072573062433e+00,
+  1.00001106210637580e+00, 1.00001140902974517e+00, 1.00001176683141435e+00,
+  1.00001213585242965e+00, 1.00001251644452593e+00, 1.00001290897046125e+00,
+  1.00001331380436209e+00, 1.00001373133208027e+00, 1.00001416195156034e+00,
+  1.00001460607321535e+00, 1.00001506412032137e+00, 1.00001553652941721e+00,
+  1.00001602375072185e+00, 1.00001652624856119e+00, 1.00001704450181128e+00,
+  1.00001757900435195e+00, 1.00001813026553843e+00, 1.00001869881068362e+00,
+  1.00001928518156102e+00, 1.00001988993691704e+00, 1.00002051365300271e+00,
+  1.00002115692412330e+00, 1.00002182036320164e+00, 1.00002250460236120e+00,
+  1.00002321029352736e+00, 1.00002393810904699e+00, 1.00002468874232786e+00,
+  1.00002546290849526e+00, 1.00002626134507611e+00, 1.00002708481269487e+00,
+  1.00002793409579960e+00, 1.00002881000340538e+00, 1.00002971336986346e+00,
+  1.00003064505565464e+00, 1.00003160594820328e+00, 1.00003259696272462e+00,
+  1.00003361904308896e+00, 1.00003467316272210e+00, 1.00003576032552588e+00,
+  1.00003688156683346e+00, 1.00003803795439028e+00, 1.00003923058936839e+00,
+  1.00004046060740936e+00, 1.00004172917970502e+00, 1.00004303751410450e+00,
+  1.00004438685626273e+00, 1.00004577849081966e+00, 1.00004721374261885e+00,
+  1.00004869397796470e+00, 1.00005022060591475e+00, 1.00005179507961794e+00,
+  1.00005341889768862e+00, 1.00005509360562916e+00, 1.00005682079729197e+00,
+  1.00005860211638908e+00, 1.00006043925804788e+00, 1.00006233397041888e+00,
+  1.00006428805632774e+00, 1.00006630337497993e+00, 1.00006838184372393e+00,
+  1.00007052543986141e+00, 1.00007273620251924e+00, 1.00007501623457662e+00,
+  1.00007736770465328e+00, 1.00007979284915915e+00, 1.00008229397440762e+00,
+  1.00008487345879393e+00, 1.00008753375504189e+00, 1.00009027739251999e+00,
+  1.00009310697962817e+00, 1.00009602520626140e+00, 1.00009903484634521e+00,
+  1.00010213876045340e+00, 1.00010533989850625e+00, 1.00010864130255017e+00,
+  1.00011204610962534e+00, 1.00011555755472115e+00, 1.00011917897382352e+00,
+  1.00012291380705509e+00, 1.00012676560191505e+00, 1.00013073801661556e+00,
+  1.00013483482352328e+00, 1.00013905991270757e+00, 1.00014341729559653e+00,
+  1.00014791110874768e+00, 1.00015254561773048e+00, 1.00015732522113532e+00,
+  1.00016225445469953e+00, 1.00016733799556468e+00, 1.00017258066666237e+00,
+  1.00017798744123532e+00, 1.00018356344749959e+00, 1.00018931397344546e+00,
+  1.00019524447179031e+00, 1.00020136056508191e+00, 1.00020766805095618e+00,
+  1.00021417290755910e+00, 1.00022088129913445e+00, 1.00022779958177810e+00,
+  1.00023493430937660e+00, 1.00024229223971917e+00, 1.00024988034080309e+00,
+  1.00025770579732454e+00, 1.00026577601737721e+00, 1.00027409863934547e+00,
+  1.00028268153901401e+00, 1.00029153283689221e+00, 1.00030066090576120e+00,
+  1.00031007437845032e+00, 1.00031978215585160e+00, 1.00032979341517692e+00,
+  1.00034011761846386e+00, 1.00035076452134319e+00, 1.00036174418207069e+00,
+  1.00037306697082973e+00, 1.00038474357932095e+00, 1.00039678503063678e+00,
+  1.00040920268943756e+00, 1.00042200827243399e+00, 1.00043521385918388e+00,
+  1.00044883190321743e+00, 1.00046287524349609e+00, 1.00047735711621533e+00,
+  1.00049229116696337e+00, 1.00050769146324270e+00, 1.00052357250737090e+00,
+  1.00053994924976442e+00, 1.00055683710262255e+00, 1.00057425195401839e+00,
+  1.00059221018241140e+00, 1.00061072867159306e+00, 1.00062982482607965e+00,
+  1.00064951658695822e+00, 1.00066982244821046e+00, 1.00069076147351321e+00,
+  1.00071235331354647e+00, 1.00073461822380438e+00, 1.00075757708294155e+00,
+  1.00078125141165497e+00, 1.00080566339212673e+00, 1.00083083588803801e+00,
+  1.00085679246517190e+00, 1.00088355741262269e+00, 1.00091115576462397e+00,
+  1.00093961332302062e+00, 1.00096895668039454e+00, 1.00099921324386809e+00,
+  1.00103041125959780e+00, 1.00106257983798486e+00, 1.00109574897961751e+00,
+  1.00112994960196189e+00, 1.00116521356683252e+00, 1.00120157370865015e+00,
+  1.00123906386352113e+00, 1.00127771889914707e+00, 1.00131757474560290e+00,
+  1.00135866842698951e+00, 1.00140103809399972e+00, 1.00144472305741039e+00,
+  1.00148976382253108e+00, 1.00153620212463501e+00, 1.00158408096539131e+00,
+  1.00163344465033699e+00, 1.00168433882740149e+00, 1.00173681052652164e+00,
+  1.00179090820036998e+00, 1.00184668176623082e+00, 1.00190418264904202e+00,
+  1.00196346382564649e+00, 1.00202457987027271e+00, 1.00208758700128309e+00,
+  1.00215254312921442e+00, 1.00221950790615133e+00, 1.00228854277645896e+00,
+  1.00235971102891019e+00, 1.00243307785024549e+00, 1.00250871038019507e+00,
+  1.00258667776800170e+00, 1.00266705123048050e+00, 1.00274990411165166e+00,
+  1.00283531194398434e+00, 1.00292335251129017e+00, 1.00301410591330331e+00,
+  1.00310765463199036e+00, 1.00320408359962587e+00, 1.00330348026867688e+00,
+  1.00340593468353956e+00, 1.00351153955416272e+00, 1.00362039033161410e+00,
+  1.00373258528561626e+00, 1.00384822558410902e+00, 1.00396741537487966e+00,
+  1.00409026186930106e+00, 1.00421687542822968e+00, 1.00434736965010729e+00,
+  1.00448186146131224e+00, 1.00462047120880915e+00, 1.00476332275514468e+00,
+  1.00491054357583787e+00, 1.00506226485921291e+00, 1.00521862160872422e+00,
+  1.00537975274782609e+00, 1.00554580122743165e+00, 1.00571691413601760e+00,
+  1.00589324281242343e+00, 1.00607494296139177e+00, 1.00626217477191182e+00,
+  1.00645510303840924e+00, 1.00665389728483379e+00, 1.00685873189170660e+00,
+  1.00706978622616883e+00, 1.00728724477508935e+00, 1.00751129728128408e+00,
+  1.00774213888290110e+00, 1.00797997025601660e+00, 1.00822499776050489e+00,
+  1.00847743358922814e+00, 1.00873749592059703e+00, 1.00900540907456104e+00,
+  1.00928140367207320e+00, 1.00956571679808427e+00, 1.00985859216811580e+00,
+  1.01016028029846217e+00, 1.01047103868007571e+00, 1.01079113195617576e+00,
+  1.01112083210363890e+00, 1.01146041861821234e+00, 1.01181017870359824e+00,
+  1.01217040746445863e+00, 1.01254140810338122e+00, 1.01292349212184773e+00,
+  1.01331697952525990e+00, 1.01372219903204508e+00, 1.01413948828690015e+00,
+  1.01456919407819757e+00, 1.01501167255959990e+00, 1.01546728947591225e+00,
+  1.01593642039320997e+00, 1.01641945093326869e+00, 1.01691677701232974e+00,
+  1.01742880508422795e+00, 1.01795595238790249e+00, 1.01849864719932315e+00,
+  1.01905732908783997e+00, 1.01963244917698526e+00, 1.02022447040973763e+00,
+  1.02083386781825936e+00, 1.02146112879812367e+00, 1.02210675338702917e+00,
+  1.02277125454801610e+00, 1.02345515845717117e+00, 1.02415900479583488e+00,
+  1.02488334704728956e+00, 1.02562875279792887e+00, 1.02639580404289288e+00,
+  1.02718509749614628e+00, 1.02799724490499056e+00, 1.02883287336897489e+00,
+  1.02969262566318265e+00, 1.03057716056585802e+00, 1.03148715319034312e+00,
+  1.03242329532127264e+00, 1.03338629575499219e+00, 1.03437688064414801e+00,
+  1.03539579384638691e+00, 1.03644379727711855e+00, 1.03752167126627359e+00,
+  1.03863021491898389e+00, 1.03977024648012573e+00, 1.04094260370263503e+00,
+  1.04214814421952640e+00, 1.04338774591952221e+00, 1.04466230732620291e+00,
+  1.04597274798058626e+00, 1.04732000882703491e+00, 1.04870505260238467e+00,
+  1.05012886422819318e+00, 1.05159245120598666e+00, 1.05309684401539561e+00,
+  1.05464309651505284e+00, 1.05623228634613153e+00, 1.05786551533839424e+00,
+  1.05954390991861414e+00, 1.06126862152123946e+00, 1.06304082700115621e+00,
+  1.06486172904840326e+00, 1.06673255660469923e+00, 1.06865456528162461e+00,
+  1.07062903778030982e+00, 1.07265728431247442e+00, 1.07474064302265981e+00,
+  1.07688048041149398e+00, 1.07907819175983088e+00, 1.08133520155360063e+00,
+  1.08365296390920696e+00, 1.08603296299931129e+00, 1.08847671347883623e+00,
+  1.09098576091102673e+00, 1.09356168219340444e+00, 1.09620608598346014e+00,
+  1.09892061312390998e+00, 1.10170693706737199e+00, 1.10456676430029677e+00,
+  1.10750183476600639e+00, 1.11051392228668289e+00, 1.11360483498417029e+00,
+  1.11677641569944219e+00, 1.12003054241059852e+00, 1.12336912864926886e+00,
+  1.12679412391528455e+00, 1.13030751408951247e+00, 1.13391132184473431e+00,
+  1.13760760705447073e+00, 1.14139846719965710e+00, 1.14528603777307803e+00,
+  1.14927249268149745e+00, 1.15336004464540864e+00, 1.15755094559635352e+00,
+  1.16184748707176744e+00, 1.16625200060732137e+00, 1.17076685812673764e+00,
+  1.17539447232907790e+00, 1.18013729707351556e+00, 1.18499782776160334e+00,
+  1.18997860171709102e+00, 1.19508219856333131e+00, 1.20031124059835492e+00,
+  1.20566839316769281e+00, 1.21115636503505275e+00, 1.21677790875097092e+00,
+  1.22253582101957026e+00, 1.22843294306359407e+00, 1.23447216098787593e+00,
+  1.24065640614144979e+00, 1.24698865547851012e+00, 1.25347193191845441e+00,
+  1.26010930470525961e+00, 1.26690388976646751e+00, 1.27385885007207267e+00,
+  1.28097739599361859e+00, 1.28826278566384533e+00, 1.29571832533723308e+00,
+  1.30334736975182430e+00, 1.31115332249270677e+00, 1.31913963635758869e+00,
+  1.32730981372488377e+00, 1.33566740692477071e+00, 1.34421601861369666e+00,
+  1.35295930215282145e+00, 1.36190096199091015e+00, 1.37104475405220883e+00,
+  1.38039448612985138e+00, 1.38995401828536069e+00, 1.39972726325483432e+00,
+  1.40971818686240558e+00, 1.41993080844160557e+00, 1.43036920126525158e+00,
+  1.44103749298450490e+00, 1.45193986607776759e+00, 1.46308055831007611e+00,
+  1.47446386320369194e+00, 1.48609413052056483e+00, 1.49797576675739474e+00,
+  1.51011323565399302e+00, 1.52251105871566983e+00, 1.53517381575038048e+00,
+  1.54810614542136538e+00, 1.56131274581602386e+00, 1.57479837503177045e+00,
+  1.58856785177962134e+00, 1.60262605600626240e+00, 1.61697792953535080e+00,
+  1.63162847672880162e+00, 1.64658276516880941e+00, 1.66184592636135742e+00,
+  1.67742315646194617e+00, 1.69331971702430284e+00, 1.70954093577278488e+00,
+  1.72609220739921265e+00, 1.74297899438486481e+00, 1.76020682784832738e+00,
+  1.77778130841990700e+00, 1.79570810714330742e+00, 1.81399296640523655e+00,
+  1.83264170089362533e+00, 1.85166019858510200e+00, 1.87105442176236814e+00,
+  1.89083040806210856e+00, 1.91099427155403601e+00, 1.93155220385167903e+00,
+  1.95251047525548027e+00, 1.97387543592878845e+00, 1.99565351710726024e+00,
+  2.01785123234223862e+00, 2.04047517877858464e+00, 2.06353203846748334e+00,
+  2.08702857971467903e+00, 2.11097165846461543e+00, 2.13536821972090918e+00,
+  2.16022529900357663e+00, 2.18555002384343222e+00, 2.21134961531403373e+00,
+  2.23763138960153807e+00, 2.26440275961284154e+00, 2.29167123662231331e+00,
+  2.31944443195746253e+00, 2.34773005872383500e+00, 2.37653593356942405e+00,
+  2.40586997848888107e+00, 2.43574022266777535e+00, 2.46615480436716128e+00,
+  2.49712197284868243e+00, 2.52865009034043986e+00, 2.56074763404382688e+00,
+  2.59342319818158273e+00, 2.62668549608718394e+00, 2.66054336233582944e+00,
+  2.69500575491717687e+00, 2.73008175745000248e+00, 2.76578058143897154e+00,
+  2.80211156857368371e+00, 2.83908419307015469e+00, 2.87670806405491852e+00,
+  2.91499292799190401e+00, 2.95394867115225690e+00, 2.99358532212729012e+00,
+  3.03391305438472880e+00, 3.07494218886842630e+00, 3.11668319664175275e+00,
+  3.15914670157483668e+00, 3.20234348307587524e+00, 3.24628447886670068e+00,
+  3.29098078780285563e+00, 3.33644367273839038e+00, 3.38268456343563040e+00,
+  3.42971505952018241e+00, 3.47754693348143196e+00, 3.52619213371886087e+00,
+  3.57566278763443490e+00, 3.62597120477142765e+00, 3.67712988000001273e+00,
+  3.72915149674994995e+00, 3.78204893029080269e+00, 3.83583525106002110e+00,
+  3.89052372803934121e+00, 3.94612783217996466e+00, 4.00266123987691103e+00,
+  4.06013783649310245e+00, 4.11857171993363025e+00, 4.17797720427075614e+00,
+  4.23836882342023280e+00, 4.29976133486944700e+00, 4.36216972345806475e+00,
+  4.42560920521174417e+00, 4.49009523122962051e+00, 4.55564349162620807e+00,
+  4.62226991952841448e+00, 4.68999069512843914e+00, 4.75882224979325663e+00,
+  4.82878127023150938e+00, 4.89988470271858922e+00, 4.97214975738073939e+00,
+  5.04559391253906586e+00, 5.12023491911430551e+00, 5.19609080509327725e+00,
+  5.27317988005795169e+00, 5.35152073977811504e+00, 5.43113227086860029e+00,
+  5.51203365551208879e+00, 5.59424437624855919e+00, 5.67778422083242518e+00,
+  5.76267328715845384e+00, 5.84893198825760052e+00, 5.93658105736388464e+00,
+  6.02564155305348237e+00, 6.11613486445726107e+00, 6.20808271654790023e+00,
+  6.30150717550294903e+00, 6.39643065414500178e+00, 6.49287591746033499e+00,
+  6.59086608819732156e+00, 6.69042465254595786e+00, 6.79157546589989281e+00,
+  6.89434275870234980e+00, 6.99875114237730500e+00, 7.10482561534755330e+00,
+  7.21259156914087818e+00, 7.32207479458601540e+00, 7.43330148809988422e+00,
+  7.54629825806756926e+00, 7.66109213131673883e+00, 7.77771055968801406e+00,
+  7.89618142670291956e+00, 8.01653305433115371e+00, 8.13879420985869473e+00,
+  8.26299411285862995e+00, 8.38916244226628294e+00, 8.51732934356048155e+00,
+  8.64752543605272628e+00, 8.77978182028603982e+00, 8.91413008554537889e+00,
+  9.05060231748144162e+00, 9.18923110584974800e+00, 9.33004955236695999e+00,
+  9.47309127868631862e+00, 9.61839043449422881e+00, 9.76598170572997937e+00,
+  9.91590032293060908e+00, 1.00681820697029760e+01, 1.02228632913251971e+01,
+  1.03799809034794652e+01, 1.05395724011184466e+01, 1.07016758674675216e+01,
+  1.08663299831649010e+01, 1.10335740355420402e+01, 1.12034479280465487e+01,
+  1.13759921898098835e+01, 1.15512479853622470e+01, 1.17292571244970247e+01,
+  1.19100620722870509e+01, 1.20937059592555300e+01, 1.22802325917036157e+01,
+  1.24696864621974726e+01, 1.26621127602173278e+01, 1.28575573829710148e+01,
+  1.30560669463748091e+01, 1.32576887962039844e+01, 1.34624710194160588e+01,
+  1.36704624556492860e+01, 1.38817127088992862e+01, 1.40962721593766034e+01,
+  1.43141919755480718e+01, 1.45355241263649173e+01, 1.47603213936805489e+01,
+  1.49886373848610166e+01, 1.52205265455912215e+01, 1.54560441728799614e+01,
+  1.56952464282669286e+01, 1.59381903512348497e+01, 1.61849338728300580e+01,
+  1.64355358294946647e+01, 1.66900559771138219e+01, 1.69485550052812677e+01,
+  1.72110945517867648e+01, 1.74777372173288015e+01, 1.77485465804561251e+01,
+  1.80235872127417309e+01, 1.83029246941929067e+01, 1.85866256289010181e+01,
+  1.88747576609349004e+01, 1.91673894904815114e+01, 1.94645908902378650e+01,
+  1.97664327220580560e+01, 2.00729869538594663e+01, 2.03843266767921776e+01,
+  2.07005261226755017e+01, 2.10216606817063614e+01, 2.13478069204430092e+01,
+  2.16790426000690211e+01, 2.20154466949415415e+01, 2.23570994114284751e+01,
+  2.27040822070389474e+01, 2.30564778098517138e+01, 2.34143702382461747e+01,
+  2.37778448209406044e+01, 2.41469882173425106e+01, 2.45218884382159104e+01,
+  2.49026348666705246e+01, 2.52893182794778291e+01, 2.56820308687191172e+01,
+  2.60808662637707585e+01, 2.64859195536318062e+01, 2.68972873095994593e+01,
+  2.73150676082975572e+01, 2.77393600550638944e+01, 2.81702658077016466e+01,
+  2.86078876006008365e+01, 2.90523297692354134e+01, 2.95036982750419092e+01,
+  2.99621007306854636e+01, 3.04276464257195762e+01, 3.09004463526451971e+01,
+  3.13806132333759109e+01, 3.18682615461151286e+01, 3.23635075526519458e+01,
+  3.28664693260820187e+01, 3.33772667789602338e+01, 3.38960216918917325e+01,
+  3.44228577425681621e+01, 3.49579005352563073e+01, 3.55012776307453706e+01,
+  3.60531185767614986e+01, 3.66135549388551169e+01, 3.71827203317695378e+01,
+  3.77607504512981578e+01, 3.83477831066374577e+01, 3.89439582532440198e+01,
+  3.95494180262029076e+01, 4.01643067741159143e+01, 4.07887710935171413e+01,
+  4.14229598638246799e+01, 4.20670242828364707e+01, 4.27211179027785590e+01,
+  4.33853966669150921e+01, 4.40600189467277588e+01, 4.47451455796746203e+01,
+  4.54409399075362970e+01, 4.61475678153595936e+01, 4.68651977710070895e+01,
+  4.75940008653227764e+01, 4.83341508529225621e+01, 4.90858241936202759e+01,
+  4.98492000944983360e+01, 5.06244605526331881e+01, 5.14117903984863602e+01,
+  5.22113773399704328e+01, 5.30234120072014647e+01, 5.38480879979476725e+01,
+  5.46856019237859599e+01, 5.55361534569766491e+01, 5.63999453780680184e+01,
+  5.72771836242419070e+01, 5.81680773384117629e+01, 5.90728389190849654e+01,
+  5.99916840710014441e+01, 6.09248318565600187e+01, 6.18725047480460972e+01,
+  6.28349286806715597e+01, 6.38123331064403487e+01, 6.48049510488527147e+01,
+  6.58130191584608610e+01, 6.68367777692890712e+01, 6.78764709561322803e+01,
+  6.89323465927463417e+01, 7.00046564109439515e+01, 7.10936560606105274e+01,
+  7.21996051706538964e+01, 7.33227674109029124e+01, 7.44634105549693714e+01,
+  7.56218065440880167e+01, 7.67982315519507068e+01, 7.79929660505490006e+01,
+  7.92062948770419837e+01, 8.04385073016645578e+01, 8.16898970966926186e+01,
+  8.29607626064815804e+01, 8.42514068185950720e+01, 8.55621374360402029e+01,
+  8.68932669506276483e+01, 8.82451127174727361e+01, 8.96179970306566531e+01,
+  9.10122472000646212e+01, 9.24281956294201308e+01, 9.38661798955336337e+01,
+  9.53265428287844117e+01, 9.68096325948549605e+01, 9.83158027777375452e+01,
+  9.98454124640321083e+01, 1.01398826328556794e+02, 1.02976414721289842e+02,
+  1.04578553755665297e+02, 1.06205625398241750e+02, 1.07858017559768314e+02,
+  1.09536124187665735e+02, 1.11240345359948037e+02, 1.12971087380605127e+02,
+  1.14728762876469986e+02, 1.16513790895593431e+02, 1.18326597007149260e+02,
+  1.20167613402894617e+02, 1.22037279000208969e+02, 1.23936039546736708e+02,
+  1.25864347726657826e+02, 1.27822663268612743e+02, 1.29811453055306458e+02,
+  1.31831191234818021e+02, 1.33882359333642682e+02, 1.35965446371492618e+02,
+  1.38080948977884447e+02, 1.40229371510540744e+02, 1.42411226175634283e+02,
+  1.44627033149903554e+02, 1.46877320704667653e+02, 1.49162625331772375e+02,
+  1.51483491871495119e+02, 1.53840473642440401e+02, 1.56234132573456861e+02,
+  1.58665039337607055e+02
+};
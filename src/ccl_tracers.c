@@ -549,6 +549,151 @@ void ccl_get_lensing_mag_kernel(ccl_cosmology *cosmo,
   ccl_f1d_t_free(sz_f);
 }
 
+// Computes the (chi, z) geometric weight matrix of the lensing kernel
+// for redshift distributions sampled on z_arr:
+// 3 * H0^2 * Omega_M / 2 / a * chi_end * w_i * (chi(z_i)-chi_end)/chi(z_i)
+// where w_i are trapezoidal quadrature weights over z > z(chi_end).
+// Applying this matrix to N(z) * (1-5s(z)/2) yields the lensing kernel.
+void ccl_get_lensing_kernel_weights(ccl_cosmology *cosmo,
+                                    int nz, double *z_arr,
+                                    int nchi, double *chi_arr,
+                                    double *g_arr, int *status) {
+  double *chi_of_z_array = malloc(nz*sizeof(double));
+  if(chi_of_z_array == NULL) {
+    *status = CCL_ERROR_MEMORY;
+    ccl_cosmology_set_status_message(
+      cosmo,
+      "ccl_tracers.c: ccl_get_lensing_kernel_weights(): error allocating memory\n");
+    return;
+  }
+
+  for(int i=0; i<nz; i++)
+    chi_of_z_array[i] = ccl_comoving_radial_distance(cosmo, 1./(1+z_arr[i]), status);
+
+  if(*status == 0) {
+    #pragma omp parallel default(none) \
+                         shared(cosmo, nz, z_arr, chi_of_z_array, \
+                                nchi, chi_arr, g_arr, status)
+    {
+      int local_status = *status;
+      double lens_prefac = get_lensing_prefactor(cosmo, &local_status);
+
+      #pragma omp for
+      for(int ichi=0; ichi<nchi; ichi++) {
+        double *g_row = &(g_arr[ichi*nz]);
+        double chi_end = chi_arr[ichi];
+        double a = ccl_scale_factor_of_chi(cosmo, chi_end, &local_status);
+        double z_end = 1./a-1;
+        double prefac = lens_prefac * chi_end / a;
+
+        // Smallest index such that chi_end <= chi_of_z_array[i_chi_end]
+        int i_chi_end = 0;
+        for(int i=0; i<nz; i++) {
+          g_row[i] = 0;
+          if(chi_of_z_array[i] < chi_end)
+            i_chi_end = i+1;
+        }
+        if(i_chi_end >= nz)
+          continue;
+
+        // Trapezoidal weights on [z_arr[i_chi_end], z_arr[nz-1]]
+        for(int i=i_chi_end; i<nz-1; i++) {
+          double hdz = 0.5*(z_arr[i+1]-z_arr[i]);
+          g_row[i] += hdz;
+          g_row[i+1] += hdz;
+        }
+        // Missing interval (z_end, z_arr[i_chi_end]), where the integrand
+        // vanishes at z_end (see integrate_lensing_kernel_spline).
+        if(z_end > z_arr[0])
+          g_row[i_chi_end] += 0.5*(z_arr[i_chi_end]-z_end);
+
+        for(int i=i_chi_end; i<nz; i++) {
+          g_row[i] *= prefac * lensing_kernel_integrand(cosmo,
+                                                        chi_of_z_array[i],
+                                                        chi_end, 1., 1.,
+                                                        &local_status);
+        }
+      } //end omp for
+
+      if(local_status) {
+        #pragma omp atomic write
+        *status = CCL_ERROR_INTEG;
+      }
+    } //end omp parallel
+    if(*status) {
+      ccl_cosmology_set_status_message(
+        cosmo,
+        "ccl_tracers.c: ccl_get_lensing_kernel_weights(): error in computing lensing weights.\n");
+    }
+  }
+
+  free(chi_of_z_array);
+}
+
+// Returns the lensing kernels of n_nz redshift distributions sampled
+// on a common redshift grid. nz_arr (and sz_arr, if not NULL) should have
+// n_nz*nz elements, with redshift being the fastest varying index.
+// The output wL_arr has n_nz*nchi elements, with distance being the
+// fastest varying index.
+void ccl_get_lensing_mag_kernel_multi(ccl_cosmology *cosmo,
+                                      int nz, double *z_arr,
+                                      int n_nz, double *nz_arr,
+                                      int normalize_nz, double *sz_arr,
+                                      int nchi, double *chi_arr,
+                                      double *wL_arr, int *status) {
+  double *g_arr = malloc(nchi*nz*sizeof(double));
+  double *pz_arr = malloc(n_nz*nz*sizeof(double));
+  if((g_arr == NULL) || (pz_arr == NULL)) {
+    *status = CCL_ERROR_MEMORY;
+    ccl_cosmology_set_status_message(
+      cosmo,
+      "ccl_tracers.c: ccl_get_lensing_mag_kernel_multi(): error allocating memory\n");
+  }
+
+  if(*status == 0)
+    ccl_get_lensing_kernel_weights(cosmo, nz, z_arr, nchi, chi_arr,
+                                   g_arr, status);
+
+  if(*status == 0) {
+    // Normalized N(z) * (1-5s(z)/2) for each distribution
+    for(int in=0; in<n_nz; in++) {
+      double *n_row = &(nz_arr[in*nz]);
+      double *p_row = &(pz_arr[in*nz]);
+      double i_nz_norm = 1.;
+
+      if(normalize_nz) {
+        double nz_norm = 0;
+        for(int i=0; i<nz-1; i++)
+          nz_norm += 0.5*(z_arr[i+1]-z_arr[i])*(n_row[i]+n_row[i+1]);
+        i_nz_norm = 1./nz_norm;
+      }
+
+      for(int i=0; i<nz; i++) {
+        double qz = 1.;
+        if(sz_arr != NULL)
+          qz = 1-2.5*sz_arr[in*nz+i];
+        p_row[i] = n_row[i]*qz*i_nz_norm;
+      }
+    }
+
+    #pragma omp parallel for collapse(2) default(none) \
+                             shared(nz, n_nz, nchi, g_arr, pz_arr, wL_arr)
+    for(int in=0; in<n_nz; in++) {
+      for(int ichi=0; ichi<nchi; ichi++) {
+        double *g_row = &(g_arr[ichi*nz]);
+        double *p_row = &(pz_arr[in*nz]);
+        double result = 0;
+        for(int i=0; i<nz; i++)
+          result += g_row[i]*p_row[i];
+        wL_arr[in*nchi+ichi] = result;
+      }
+    } //end omp parallel for
+  }
+
+  free(g_arr);
+  free(pz_arr);
+}
+
 // Returns kernel for CMB lensing
 // 3H0^2Om/2 * chi * (chi_s - chi) / chi_s / a
 void ccl_get_kappa_kernel(ccl_cosmology *cosmo, double chi_source,
@@ -563,6 +708,43 @@ void ccl_get_kappa_kernel(ccl_cosmology *cosmo, double chi_source,
   }
 }
 
+// Finds the lowest and highest radial distances at which the
+// radial kernel is CCL_FRAC_RELEVANT times smaller than its maximum.
+static void set_kernel_limits(ccl_cl_tracer_t *tr,
+                              int n_w, double *chi_w, double *w_w) {
+  int ichi;
+  double w_max = fabs(w_w[0]);
+
+  // Find maximum of radial kernel
+  for (ichi=0; ichi < n_w; ichi++) {
+    if (fabs(w_w[ichi]) >= w_max)
+      w_max = fabs(w_w[ichi]);
+  }
+
+  // Multiply by fraction
+  w_max *= CCL_FRAC_RELEVANT;
+
+  // Initialize as the original edges in case we don't find an interval
+  tr->chi_min = chi_w[0];
+  tr->chi_max = chi_w[n_w-1];
+
+  // Find minimum
+  for (ichi=0; ichi < n_w-1; ichi++) {
+    if (fabs(w_w[ichi+1]) >= w_max) {
+      tr->chi_min = chi_w[ichi];
+      break;
+    }
+  }
+
+  // Find maximum
+  for (ichi=n_w-1; ichi >= 1; ichi--) {
+    if (fabs(w_w[ichi-1]) >= w_max) {
+      tr->chi_max = chi_w[ichi];
+      break;
+    }
+  }
+}
+
 ccl_cl_tracer_t *ccl_cl_tracer_t_new(ccl_cosmology *cosmo,
                                      int der_bessel,
                                      int der_angles,
@@ -627,39 +809,8 @@ ccl_cl_tracer_t *ccl_cl_tracer_t_new(ccl_cosmology *cosmo,
       tr->chi_min = 0;
       tr->chi_max = ccl_comoving_radial_distance(cosmo, cosmo->spline_params.A_SPLINE_MIN, status);
     }
-    else {
-      int ichi;
-      double w_max = fabs(w_w[0]);
-
-      // Find maximum of radial kernel
-      for (ichi=0; ichi < n_w; ichi++) {
-        if (fabs(w_w[ichi]) >= w_max)
-          w_max = fabs(w_w[ichi]);
-      }
-
-      // Multiply by fraction
-      w_max *= CCL_FRAC_RELEVANT;
-
-      // Initialize as the original edges in case we don't find an interval
-      tr->chi_min = chi_w[0];
-      tr->chi_max = chi_w[n_w-1];
-
-      // Find minimum
-      for (ichi=0; ichi < n_w-1; ichi++) {
-        if (fabs(w_w[ichi+1]) >= w_max) {
-          tr->chi_min = chi_w[ichi];
-          break;
-        }
-      }
-
-      // Find maximum
-      for (ichi=n_w-1; ichi >= 1; ichi--) {
-        if (fabs(w_w[ichi-1]) >= w_max) {
-          tr->chi_max = chi_w[ichi];
-          break;
-        }
-      }
-    }
+    else
+      set_kernel_limits(tr, n_w, chi_w, w_w);
   }
 
   if (*status == 0) {
@@ -687,6 +838,24 @@ ccl_cl_tracer_t *ccl_cl_tracer_t_new(ccl_cosmology *cosmo,
   return tr;
 }
 
+void ccl_cl_tracer_t_update_kernel(ccl_cl_tracer_t *tr,
+                                   int n_w, double *chi_w, double *w_w,
+                                   int *status) {
+  // The kernel can only be updated on its original radial grid
+  if ((tr->kernel == NULL) || (tr->kernel->spline->size != (size_t)n_w)) {
+    *status = CCL_ERROR_INCONSISTENT;
+    return;
+  }
+
+  if (gsl_spline_init(tr->kernel->spline, chi_w, w_w, n_w)) {
+    *status = CCL_ERROR_SPLINE;
+    return;
+  }
+  tr->kernel->y_ini = w_w[0];
+  tr->kernel->y_end = w_w[n_w-1];
+  set_kernel_limits(tr, n_w, chi_w, w_w);
+}
+
 void ccl_cl_tracer_t_free(ccl_cl_tracer_t *tr) {
   if (tr != NULL) {
     if (tr->transfer != NULL)